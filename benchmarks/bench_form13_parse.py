@@ -0,0 +1,91 @@
+"""
+Benchmark: streaming vs. DOM parsing of a 13F information table.
+
+Generates a synthetic 100k-holding information table (about 37 MiB of XML) and
+compares the streaming :func:`finqual.form_13.parse_information_table` against
+the previous approach (``ET.fromstring`` on the whole document plus a list of
+dicts), reporting wall time and peak traced memory.
+
+Run from the repository root::
+
+    python benchmarks/bench_form13_parse.py [n_rows]
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+import polars as pl
+
+from finqual.form_13 import SEC_13F_NS, SEC_13F_VALUE_MULTIPLIER, aggregate_holdings, parse_information_table
+from finqual.sec_edgar.xml_utils import gettext
+
+_HOLDING = (
+    "<infoTable><nameOfIssuer>ISSUER {i}</nameOfIssuer><titleOfClass>COM</titleOfClass>"
+    "<cusip>{cusip:09d}</cusip><figi>BBG000000000</figi><value>{value}</value>"
+    "<shrsOrPrnAmt><sshPrnamt>{shares}</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>"
+    "{put_call}<investmentDiscretion>SOLE</investmentDiscretion>"
+    "<votingAuthority><Sole>{shares}</Sole><Shared>0</Shared><None>0</None></votingAuthority></infoTable>\n"
+)
+
+
+def synthetic_information_table(n_rows: int) -> bytes:
+    """Return an information table with ``n_rows`` holdings over ``n_rows // 4`` CUSIPs."""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+             '<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">\n']
+    for i in range(n_rows):
+        parts.append(_HOLDING.format(
+            i=i % (n_rows // 4 or 1), cusip=i % (n_rows // 4 or 1), value=1000 + i % 997, shares=10 + i % 89,
+            put_call="<putCall>Call</putCall>" if i % 10 == 0 else "",
+        ))
+    parts.append("</informationTable>\n")
+    return "".join(parts).encode()
+
+
+def legacy_parse(content: bytes) -> pl.DataFrame:
+    """The previous DOM-based implementation, kept here as the baseline."""
+    root = ET.fromstring(content)
+    rows = []
+    for holding in root.findall(".//ns:infoTable", SEC_13F_NS):
+        shares_text = gettext(holding, "ns:shrsOrPrnAmt/ns:sshPrnamt", SEC_13F_NS)
+        value_text = gettext(holding, "ns:value", SEC_13F_NS)
+        put_call = gettext(holding, "ns:putCall", SEC_13F_NS)
+        rows.append({
+            "CUSIP": gettext(holding, "ns:cusip", SEC_13F_NS),
+            "Issuer": gettext(holding, "ns:nameOfIssuer", SEC_13F_NS),
+            "TitleOfClass": gettext(holding, "ns:titleOfClass", SEC_13F_NS),
+            "AssetType": put_call.capitalize() if put_call else "Equity",
+            "Shares": float(shares_text) if shares_text else 0.0,
+            "Value_USD": float(value_text) * SEC_13F_VALUE_MULTIPLIER if value_text else 0.0,
+        })
+    return pl.DataFrame(rows)
+
+
+def measure(label: str, fn) -> pl.DataFrame:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<10} {elapsed:8.2f} s   peak {peak / 2**20:8.1f} MiB")
+    return result
+
+
+def main(n_rows: int = 100_000) -> None:
+    content = synthetic_information_table(n_rows)
+    print(f"{n_rows:,} holdings, {len(content) / 2**20:.1f} MiB of XML")
+
+    legacy = measure("DOM", lambda: aggregate_holdings(legacy_parse(content)))
+    streaming = measure("streaming", lambda: aggregate_holdings(parse_information_table(io.BytesIO(content))))
+
+    key = ["CUSIP", "AssetType"]
+    assert legacy.sort(key).equals(streaming.sort(key)), "streaming result differs from DOM result"
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
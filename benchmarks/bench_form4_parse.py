@@ -0,0 +1,124 @@
+"""
+Benchmark: Form 4 parsing throughput (rows per second).
+
+Parses the Form 4 fixtures in ``tests/fixtures/form4`` repeatedly with the
+current :func:`finqual.form_4.parse_form_4` and with the previous row-by-row
+parser (a dozen recursive ``.//`` searches per row, filing-level fields
+re-read for every row), and checks both produce the same frame.
+
+The ``batched`` line parses every filing to column lists and builds one frame
+per pass, as ``FinqualForms.get_insider_transactions_period`` does; for
+typical few-row filings, frame construction costs more than the XML walk.
+
+Run from the repository root::
+
+    python benchmarks/bench_form4_parse.py [repeats]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import polars as pl
+
+from finqual.form_4 import (
+    ACQUISITION_CODES,
+    OWNERSHIP_MAP,
+    TRANSACTION_CODES,
+    _CSUITE_KEYWORDS,
+    _OUTPUT_COLUMNS,
+    form_4_frame,
+    parse_form_4,
+    parse_form_4_columns,
+)
+from finqual.sec_edgar.xml_utils import gettext
+
+FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "form4"
+
+
+def legacy_roles(owner):
+    title = (gettext(owner, ".//officerTitle") or "").lower()
+    is_officer = gettext(owner, ".//isOfficer") == "1"
+    return {
+        "CSuite": is_officer and any(k in title for k in _CSUITE_KEYWORDS),
+        "Officer": is_officer,
+        "Director": gettext(owner, ".//isDirector") == "1",
+        "10PercentOwner": gettext(owner, ".//isTenPercentOwner") == "1",
+        "Other": gettext(owner, ".//isOther") == "1",
+    }
+
+
+def legacy_parse(root: ET.Element) -> pl.DataFrame:
+    """The previous parser, kept here as the baseline."""
+    roles = legacy_roles(root.find(".//reportingOwner"))
+    sources = (
+        (".//nonDerivativeTransaction", "Non-Derivative Transaction", False),
+        (".//derivativeTransaction", "Derivative Transaction", False),
+        (".//nonDerivativeHolding", "Non-Derivative Holding", True),
+        (".//derivativeHolding", "Derivative Holding", True),
+    )
+    rows = []
+    for xpath, transaction_type, is_holding in sources:
+        for el in root.findall(xpath):
+            tx = (lambda p: None) if is_holding else (lambda p: gettext(el, p))
+            row = {
+                "Ticker": gettext(root, ".//issuerTradingSymbol"),
+                "Security": gettext(el, ".//securityTitle/value"),
+                "Date": tx(".//transactionDate/value"),
+                "Name": gettext(root, ".//reportingOwnerId/rptOwnerName"),
+                "Position": gettext(root, ".//officerTitle"),
+                "TransactionCode": tx(".//transactionCoding/transactionCode"),
+                "Shares": tx(".//transactionShares/value"),
+                "TransactionPrice": tx(".//transactionPricePerShare/value"),
+                "AcquisitionDisposal": tx(".//transactionAcquiredDisposedCode/value"),
+                "SharesOwnedFollowingTransaction": gettext(el, ".//sharesOwnedFollowingTransaction/value"),
+                "OwnershipType": gettext(el, ".//directOrIndirectOwnership/value"),
+                "NatureOfOwnership": gettext(el, ".//natureOfOwnership/value"),
+                "TransactionType": transaction_type,
+            }
+            row.update(roles)
+            rows.append(row)
+
+    df = pl.DataFrame(rows).with_columns(
+        pl.col("TransactionCode").replace(TRANSACTION_CODES),
+        pl.col("AcquisitionDisposal").replace(ACQUISITION_CODES),
+        pl.col("OwnershipType").replace(OWNERSHIP_MAP),
+    )
+    return df.select(list(_OUTPUT_COLUMNS))
+
+
+def measure(label: str, parse, roots: list[ET.Element], repeats: int) -> None:
+    start = time.perf_counter()
+    n_rows = 0
+    for _ in range(repeats):
+        for root in roots:
+            n_rows += parse(root).height
+    elapsed = time.perf_counter() - start
+    print(f"{label:<8} {n_rows / elapsed:12,.0f} rows/s   ({elapsed / (repeats * len(roots)) * 1e6:7.1f} us/filing)")
+
+
+def main(repeats: int = 2_000) -> None:
+    roots = [ET.parse(path).getroot() for path in sorted(FIXTURES.glob("*.xml"))]
+
+    for root in roots:
+        current = parse_form_4(root)
+        # The legacy parser returned text; type its output the same way before comparing.
+        assert form_4_frame([legacy_parse(root).to_dict(as_series=False)]).equals(current), "parsers disagree"
+
+    print(f"{len(roots)} fixtures x {repeats} repeats")
+    measure("before", legacy_parse, roots, repeats)
+    measure("after", parse_form_4, roots, repeats)
+
+    start = time.perf_counter()
+    n_rows = 0
+    for _ in range(repeats):
+        n_rows += form_4_frame([parse_form_4_columns(root) for root in roots]).height
+    elapsed = time.perf_counter() - start
+    print(f"{'batched':<8} {n_rows / elapsed:12,.0f} rows/s   ({elapsed / (repeats * len(roots)) * 1e6:7.1f} us/filing)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
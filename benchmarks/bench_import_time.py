@@ -0,0 +1,72 @@
+"""
+Benchmark: cold-start import cost of the public entry points.
+
+Runs each import statement in a fresh interpreter under ``python -X importtime``
+and reports the median cumulative import time of everything the statement
+loads (modules imported by interpreter start-up are excluded), together with
+which heavy dependencies it pulled in. Exits non-zero when a statement exceeds
+its budget, so CLI / serverless deployments can run it as a start-up guard.
+
+Run from the repository root::
+
+    python benchmarks/bench_import_time.py [repeats]
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+# Import statement → budget in milliseconds (median of the runs).
+BUDGETS_MS = {
+    "import finqual": 10,
+    "from finqual import FinqualForms": 400,
+    "from finqual import Finqual": 500,
+}
+
+HEAVY_MODULES = ("polars", "numpy", "pandas", "pydantic", "requests", "cloudscraper", "matplotlib")
+
+
+def _import_times(statement: str) -> dict[str, int]:
+    """Cumulative microseconds for each top-level module imported while running ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not name[1:].startswith(" "):  # nested imports are indented under their importer
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def measure(statement: str, repeats: int) -> tuple[float, list[str]]:
+    """Median import time (ms) of ``statement`` and the heavy modules it loaded."""
+    baseline = set(_import_times("pass"))
+    runs, loaded = [], set()
+    for _ in range(repeats):
+        times = {name: us for name, us in _import_times(statement).items() if name not in baseline}
+        runs.append(sum(times.values()) / 1000)
+
+    probe = f"{statement}; import sys; print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    loaded.update(subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True,
+                                 check=True).stdout.split())
+    return statistics.median(runs), sorted(loaded)
+
+
+def main(repeats: int = 5) -> int:
+    over_budget = 0
+    for statement, budget in BUDGETS_MS.items():
+        elapsed, loaded = measure(statement, repeats)
+        status = "ok" if elapsed <= budget else "OVER"
+        over_budget += elapsed > budget
+        print(f"{statement:<36} {elapsed:8.1f} ms  (budget {budget:4d} ms) {status:<4}  loads: {', '.join(loaded) or '-'}")
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
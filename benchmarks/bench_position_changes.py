@@ -0,0 +1,64 @@
+"""
+Benchmark: 13F quarter-over-quarter position changes at scale.
+
+Generates ``n_quarters`` synthetic filings of 10,000 positions each (drawn from
+12,000 CUSIPs, so positions open and close between quarters) and times
+:func:`finqual.form_13.position_changes` over all of them.
+
+Run from the repository root::
+
+    python benchmarks/bench_position_changes.py [n_quarters]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+import polars as pl
+
+from finqual.form_13 import position_changes
+
+_POSITIONS = 10_000
+_UNIVERSE = 12_000
+
+
+def synthetic_filings(n_quarters: int, seed: int = 0) -> pl.DataFrame:
+    """Return ``n_quarters`` filings shaped like ``FinqualForms.get_form_13_period`` output."""
+    rng = np.random.default_rng(seed)
+    frames = []
+    for q in range(n_quarters):
+        cusips = rng.choice(_UNIVERSE, _POSITIONS, replace=False)
+        shares = (cusips + 1).astype(float)
+        report_date = f"{2010 + q // 4}-{q % 4 * 3 + 3:02d}-28"
+        frames.append(pl.DataFrame({
+            "CUSIP": cusips.astype(str),
+            "Issuer": [f"ISSUER {c}" for c in cusips],
+            "TitleOfClass": "COM",
+            "AssetType": "Equity",
+            "TotalShares": shares,
+            "TotalValue_USD": shares * 2,
+            "PortfolioWeight": shares / shares.sum(),
+            "filingDate": report_date,
+            "reportDate": report_date,
+            "accessionNumber": str(q),
+        }))
+    return pl.concat(frames)
+
+
+def main(n_quarters: int = 20) -> None:
+    filings = synthetic_filings(n_quarters)
+    print(f"{n_quarters} quarters, {filings.height:,} holdings")
+
+    start = time.perf_counter()
+    out = position_changes(filings)
+    elapsed = time.perf_counter() - start
+    print(f"position_changes {elapsed:8.2f} s   {out.height:,} rows")
+
+    latest = out.filter(pl.col("reportDate") == out["reportDate"].max())
+    assert latest.height > _POSITIONS, "expected closed positions alongside the held ones"
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
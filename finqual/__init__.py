@@ -5,12 +5,47 @@ Public API:
     Finqual       — fundamentals & ratios for a single company
     CCA           — comparable company analysis
     FinqualForms  — Form 4 (insider) and Form 13F (institutional) filings
+    Screen        — ratio screens across whole sectors
+
+The public classes are imported on first access, so ``import finqual`` does
+not pay for polars, numpy, pydantic or the HTTP clients until they are
+actually needed.
 """
 
-from .cca import CCA
-from .core import Finqual
-from .form_parsers import FinqualForms
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cca import CCA
+    from .core import Finqual
+    from .form_parsers import FinqualForms
+    from .screen import Screen
 
 __version__ = "4.8.1"
 
-__all__ = ["CCA", "Finqual", "FinqualForms", "__version__"]
+# Public name → submodule that defines it.
+_LAZY_ATTRS = {
+    "CCA": ".cca",
+    "Finqual": ".core",
+    "FinqualForms": ".form_parsers",
+    "Screen": ".screen",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
+__all__ = ["CCA", "Finqual", "FinqualForms", "Screen", "__version__"]
@@ -1,9 +1,13 @@
 """
 Shared caching utilities for the finqual package.
 
-This module provides ``weak_lru`` — an LRU-cache decorator that keeps only a
-weak reference to ``self`` so that cached methods do not extend the lifetime
-of their owning instance (and therefore do not leak memory).
+This module provides:
+
+- ``weak_lru``     — an LRU-cache decorator that keeps only a weak reference
+  to ``self`` so that cached methods do not extend the lifetime of their
+  owning instance (and therefore do not leak memory).
+- ``SingleFlight`` — per-key in-flight futures, so that concurrent callers
+  asking for the same key share one computation instead of racing.
 
 Previously the same decorator was duplicated in ``core.py``, ``cca.py``,
 ``sec_api.py`` and ``form_parsers.py``. All four call sites now import from
@@ -13,10 +17,72 @@ here.
 from __future__ import annotations
 
 import functools
+import threading
 import weakref
-from typing import Callable, TypeVar
+from concurrent.futures import Future
+from typing import Callable, Hashable, TypeVar
 
 F = TypeVar("F", bound=Callable[..., object])
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into a single computation.
+
+    The first caller for a key (the *leader*) runs the function; every caller
+    that arrives while it is still running waits on the leader's future and
+    receives the same result (or the same exception). Once the leader
+    finishes the key is forgotten, so this is a deduplication layer and not
+    a cache — pair it with one (e.g. :func:`weak_lru`) to keep results.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight: dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run ``fn(*args, **kwargs)`` once per concurrent ``key``.
+
+        Parameters
+        ----------
+        key : Hashable
+            Identity of the computation; callers with equal keys share it.
+        fn : Callable
+            Function to run if no computation for ``key`` is in flight.
+
+        Returns
+        -------
+        Any
+            The value returned by the leader's call to ``fn``.
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def __len__(self) -> int:
+        """Number of computations currently in flight."""
+        with self._lock:
+            return len(self._in_flight)
 
 
 def weak_lru(maxsize: int = 128, typed: bool = False) -> Callable[[F], F]:
@@ -28,6 +94,12 @@ def weak_lru(maxsize: int = 128, typed: bool = False) -> Callable[[F], F]:
     reference to ``self`` would keep the instance alive for as long as
     the cache lives).
 
+    ``functools.lru_cache`` does not coordinate misses, so two threads asking
+    for the same uncached key would both compute it. Misses are therefore
+    routed through a :class:`SingleFlight` keyed like the cache: concurrent
+    identical misses share one computation. Hits are served by the LRU
+    alone, without touching the single-flight lock.
+
     Parameters
     ----------
     maxsize : int, default 128
@@ -42,17 +114,24 @@ def weak_lru(maxsize: int = 128, typed: bool = False) -> Callable[[F], F]:
     """
 
     def wrapper(func: F) -> F:
+        flight = SingleFlight()
+
         @functools.lru_cache(maxsize=maxsize, typed=typed)
         def _cached(self_ref, *args, **kwargs):
-            return func(self_ref(), *args, **kwargs)
+            # Only reached on a cache miss.
+            key = (self_ref, args, tuple(sorted(kwargs.items())))
+            return flight.do(key, lambda: func(self_ref(), *args, **kwargs))
 
         @functools.wraps(func)
         def inner(self, *args, **kwargs):
             return _cached(weakref.ref(self), *args, **kwargs)
 
+        inner.cache_info = _cached.cache_info  # type: ignore[attr-defined]
+        inner.cache_clear = _cached.cache_clear  # type: ignore[attr-defined]
+
         return inner  # type: ignore[return-value]
 
     return wrapper
 
 
-__all__ = ["weak_lru"]
+__all__ = ["SingleFlight", "weak_lru"]
@@ -1,8 +1,73 @@
 from .core import Finqual
-from ._cache import weak_lru
+from .peer_index import PeerIndex
+from .stocktwit import quote_service
+from ._cache import SingleFlight, weak_lru
 import polars as pl
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Default number of peers fetched concurrently; SEC requests stay within the shared rate limit.
+_DEFAULT_MAX_WORKERS = 4
+
+# Percentiles reported by peer-group summaries, besides the median.
+_DEFAULT_PERCENTILES = (0.25, 0.75)
+
+
+def peer_statistics(df: pl.DataFrame | pl.LazyFrame, target: str,
+                    percentiles: tuple[float, ...] = _DEFAULT_PERCENTILES) -> pl.LazyFrame:
+    """
+    Summarise a peer ratio frame per period and ratio.
+
+    Every ratio column is unpivoted into one long column, so all statistics
+    are computed by a single ``group_by`` regardless of the number of ratios
+    or peers. NaN / infinite ratios (missing data, zero denominators) are
+    excluded.
+
+    Parameters
+    ----------
+    df : pl.DataFrame | pl.LazyFrame
+        Peer ratios with 'Ticker', 'Period' and one column per ratio.
+    target : str
+        Ticker whose value, percentile rank and z-score are reported.
+    percentiles : tuple[float, ...], default=(0.25, 0.75)
+        Quantiles in [0, 1] reported as ``P<100*q>`` columns.
+
+    Returns
+    -------
+    pl.LazyFrame
+        One row per Period and Ratio with 'Peers', 'Mean', 'Median', 'Std',
+        the percentile columns, 'Target', 'Target Percentile' (0–100, ties
+        counted as half) and 'Target Z-Score'.
+    """
+    lf = df.lazy()
+    ratio_columns = [c for c in lf.collect_schema().names() if c not in ("Ticker", "Period")]
+
+    value = pl.col("Value")
+    target_value = value.filter(pl.col("Ticker") == target).first()
+
+    return (
+        lf.select(["Ticker", "Period"] + ratio_columns)
+        .with_columns(pl.col(ratio_columns).cast(pl.Float64))
+        .unpivot(index=["Ticker", "Period"], variable_name="Ratio", value_name="Value")
+        .filter(value.is_finite())
+        .group_by(["Period", "Ratio"], maintain_order=True)
+        .agg(
+            value.count().alias("Peers"),
+            value.mean().alias("Mean"),
+            value.median().alias("Median"),
+            value.std().alias("Std"),
+            *[value.quantile(q, interpolation="linear").alias(f"P{round(q * 100):g}") for q in percentiles],
+            target_value.alias("Target"),
+            (((value < target_value).sum() + 0.5 * (value == target_value).sum()) / value.count() * 100)
+            .alias("Target Percentile"),
+        )
+        .with_columns(
+            ((pl.col("Target") - pl.col("Mean")) / pl.col("Std")).alias("Target Z-Score"),
+            pl.when(pl.col("Target").is_null()).then(None).otherwise(pl.col("Target Percentile"))
+            .alias("Target Percentile"),
+        )
+        .sort(["Period", "Ratio"], descending=[True, False], maintain_order=True)
+    )
 
 
 class CCA:
@@ -23,10 +88,13 @@ class CCA:
         Company CIK code.
     sector : str
         Company sector.
-    sectors : pl.LazyFrame
-        DataFrame of sector mappings.
+    max_workers : int
+        Number of peers fetched concurrently.
+    peer_index : PeerIndex
+        Index used to select comparable companies.
     """
-    def __init__(self, ticker_or_cik: str | int):
+    def __init__(self, ticker_or_cik: str | int, max_workers: int = _DEFAULT_MAX_WORKERS,
+                 peer_index: PeerIndex | None = None):
         """
         Initialize the CCA instance.
 
@@ -34,18 +102,35 @@ class CCA:
         ----------
         ticker_or_cik : str | int
             The company identifier (ticker symbol or CIK).
+        max_workers : int, default=4
+            Number of peers fetched concurrently. SEC requests from all workers
+            share the process-wide rate limit, so raising this mostly overlaps
+            parsing and statement computation with network waits.
+        peer_index : PeerIndex | None, default=None
+            Peer index to select comparables from, e.g. one with market-cap and
+            revenue features attached. Defaults to the shared
+            :meth:`PeerIndex.default` index.
         """
         self.fq_ticker = Finqual(ticker_or_cik)
         self.ticker = self.fq_ticker.ticker
         self.cik = self.fq_ticker.cik
         self.sector = self.fq_ticker.sector
-        self.sectors = self.fq_ticker.load_label("sector_mapping.parquet")
+        self.max_workers = max_workers
+        self.peer_index = peer_index if peer_index is not None else PeerIndex.default()
+
+        # Peer Finqual instances reused for the lifetime of this CCA.
+        self._peers: dict[str, Finqual] = {self.ticker: self.fq_ticker}
+        self._pool_lock = threading.Lock()
+        self._peer_flight = SingleFlight()
 
     @weak_lru(maxsize=4)
     def get_c(self, n: int | None = None) -> tuple[str] | None:
         """
         Get a list of comparable companies in the same sector.
 
+        Peers come from :attr:`peer_index`: by market-cap position in the
+        sector list, or by feature distance when the index carries features.
+
         Parameters
         ----------
         n : int | None, default=None
@@ -56,60 +141,57 @@ class CCA:
         tuple[str] | None
             Tickers of comparable companies. Returns None if no comparables found.
         """
-        df_c = self.sectors.filter(pl.col('sector') == self.sector).collect()
-        match_indices = df_c.select((pl.col('ticker') == self.ticker).arg_true()).to_series().to_list()
-
-        if n is None:
-            no_comparables = 6
-        else:
-            no_comparables = n
+        no_comparables = 6 if n is None else n
 
-        if match_indices:
-            i = match_indices[0]
-            total_rows = len(df_c)
-            half_window = 2
+        peers = self.peer_index.nearest(self.ticker, no_comparables)
+        if peers:
+            return peers
 
-            start = max(0, i - half_window)
-            end = start + no_comparables
+        print("No comparable companies found.")
 
-            if end > total_rows:
-                end = total_rows
-                start = max(0, end - no_comparables)
+    def _peer(self, ticker: str) -> Finqual:
+        """
+        Return the pooled :class:`Finqual` instance for ``ticker``, creating it on first use.
 
-            return tuple(df_c.slice(start, end - start)['ticker'])
+        Pooled instances keep their downloaded facts and cached statements, so
+        successive ratio calls on this CCA never re-download a peer.
+        """
+        with self._pool_lock:
+            fq = self._peers.get(ticker)
+        if fq is not None:
+            return fq
 
-        print("No comparable companies found.")
+        # Concurrent first requests for one ticker share a single construction.
+        fq = self._peer_flight.do(ticker, Finqual, ticker)
+        with self._pool_lock:
+            return self._peers.setdefault(ticker, fq)
 
-    def _get_ratios(self, year: int | None, method_name: str, quarter: int | None = None, n: int | None = None) -> pl.DataFrame:
+    def _collect(self, tickers: tuple[str], method_name: str, *args, summary: bool = False) -> pl.DataFrame:
         """
-        Retrieve ratios for the company and its comparables for a given year/quarter.
+        Call ``method_name(*args)`` on every peer concurrently and stack the results.
 
         Parameters
         ----------
-        year : int | None
-            Year to retrieve ratios for. If None, retrieves TTM.
+        tickers : tuple[str]
+            Peer tickers, in display order.
         method_name : str
             Name of the Finqual method to call (e.g., 'profitability_ratios').
-        quarter : int | None, default=None
-            Specific quarter to retrieve. If None, annual ratios are returned.
-        n : int | None, default=None
-            Number of comparable companies to include.
+        *args
+            Arguments forwarded to the method.
+        summary : bool, default=False
+            If True, return :func:`peer_statistics` for this company instead of per-peer rows.
 
         Returns
         -------
         pl.DataFrame
-            DataFrame containing the ratios for the company and comparables.
+            Ratios with a ``Ticker`` column, sorted by Period (newest first) then peer order.
         """
 
         def fetch_ratios(ticker: str):
             try:
-                fq_instance = Finqual(ticker)
-                func = getattr(fq_instance, method_name)
-                df_ratio = func(year, quarter)
+                df_ratio = getattr(self._peer(ticker), method_name)(*args)
                 if df_ratio is not None and len(df_ratio) > 0:
                     df_ratio = df_ratio.with_columns(pl.lit(ticker).alias("Ticker"))
-                del fq_instance
-                gc.collect()
                 return df_ratio
 
             except Exception as e:
@@ -117,41 +199,62 @@ class CCA:
                 print(f"[CCA] Skipping {ticker} ({method_name}): {type(e).__name__}: {e}")
                 return None
 
-        tickers = self.get_c(n)
-        lazy_frames = []
+        if not tickers:
+            return pl.DataFrame()
 
-        # --- Collecting tickers
+        # --- Collecting tickers; SEC requests are throttled by the shared limiter
 
-        with ThreadPoolExecutor(max_workers=1) as executor:
-            futures = {executor.submit(fetch_ratios, ticker): ticker for ticker in tickers}
-            for future in as_completed(futures):
-                df = future.result()
-                if df is not None and len(df) > 0:
-                    lazy_frames.append(df.lazy())
-                del df
-                gc.collect()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            frames = [df for df in executor.map(fetch_ratios, tickers) if df is not None and len(df) > 0]
 
-        if not lazy_frames:
+        if not frames:
             return pl.DataFrame()
 
-        df = pl.concat(lazy_frames, how="vertical").collect(engine="streaming")
+        df = pl.concat(frames, how="vertical")
 
         # --- Sorting
 
         ticker_df = pl.DataFrame({"Ticker": tickers, "Ticker_order": list(range(len(tickers)))})
 
-        df = (
+        lf = (
             df.lazy()
             .join(ticker_df.lazy(), on="Ticker", how="left")
             .sort(["Period", "Ticker_order"], descending=[True, False])
             .drop("Ticker_order")
-            .collect(engine="streaming")
         )
 
-        return df
+        if summary:
+            lf = peer_statistics(lf, self.ticker)
+
+        return lf.collect()
+
+    def _get_ratios(self, year: int | None, method_name: str, quarter: int | None = None, n: int | None = None,
+                    summary: bool = False) -> pl.DataFrame:
+        """
+        Retrieve ratios for the company and its comparables for a given year/quarter.
+
+        Parameters
+        ----------
+        year : int | None
+            Year to retrieve ratios for. If None, retrieves TTM.
+        method_name : str
+            Name of the Finqual method to call (e.g., 'profitability_ratios').
+        quarter : int | None, default=None
+            Specific quarter to retrieve. If None, annual ratios are returned.
+        n : int | None, default=None
+            Number of comparable companies to include.
+        summary : bool, default=False
+            If True, return peer-group statistics (see :func:`peer_statistics`).
+
+        Returns
+        -------
+        pl.DataFrame
+            DataFrame containing the ratios for the company and comparables.
+        """
+        return self._collect(self.get_c(n), method_name, year, quarter, summary=summary)
 
     def _get_ratios_period(self, start_year: int, end_year: int, method_name: str,
-                           quarter: bool = False, n: int | None = None) -> pl.DataFrame:
+                           quarter: bool = False, n: int | None = None, summary: bool = False) -> pl.DataFrame:
         """
         Retrieve ratios for the company and its comparables over a range of years.
 
@@ -167,84 +270,78 @@ class CCA:
             If True, retrieves quarterly data; otherwise annual.
         n : int | None, default=None
             Number of comparable companies to include.
+        summary : bool, default=False
+            If True, return peer-group statistics (see :func:`peer_statistics`).
 
         Returns
         -------
         pl.DataFrame
             DataFrame containing the ratios over the specified period.
         """
-        def fetch_ratios(ticker: str):
-            try:
-                fq_instance = Finqual(ticker)
-                func = getattr(fq_instance, method_name)
-                df_ratio = func(start_year, end_year, quarter)
-                df_ratio = df_ratio.with_columns(pl.lit(ticker).alias("Ticker"))
-                del fq_instance
-                gc.collect()
-                return df_ratio
-            except Exception as e:
-                print(f"[CCA] Skipping {ticker} ({method_name}): {type(e).__name__}: {e}")
-                return None
-
-        tickers = self.get_c(n)
-        lazy_frames = []
+        return self._collect(self.get_c(n), method_name, start_year, end_year, quarter, summary=summary)
 
-        # --- Collecting tickers
-
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(fetch_ratios, ticker): ticker for ticker in tickers}
-            for future in as_completed(futures):
-                df = future.result()
-                if df is not None and len(df) > 0:
-                    lazy_frames.append(df.lazy())
-                del df
-                gc.collect()
+    @weak_lru(maxsize=4)
+    def profitability_ratios(self, year: int | None = None, quarter: int | None = None, n: int | None = None,
+                             summary: bool = False) -> pl.DataFrame:
+        """
+        Retrieve profitability ratios for the company and comparables for a given year/quarter.
 
-        if not lazy_frames:
-            return pl.DataFrame()
+        With ``summary=True``, returns per-period peer statistics and the company's percentile rank instead.
+        """
+        return self._get_ratios(year, 'profitability_ratios', quarter, n, summary)
 
-        df = pl.concat(lazy_frames, how="vertical").collect(engine="streaming")
+    @weak_lru(maxsize=4)
+    def liquidity_ratios(self, year: int | None = None, quarter: int | None = None, n: int | None = None,
+                         summary: bool = False) -> pl.DataFrame:
+        """
+        Retrieve liquidity ratios for the company and comparables for a given year/quarter.
 
-        # --- Sorting
+        With ``summary=True``, returns per-period peer statistics and the company's percentile rank instead.
+        """
+        return self._get_ratios(year, 'liquidity_ratios', quarter, n, summary)
 
-        ticker_df = pl.DataFrame({"Ticker": tickers, "Ticker_order": list(range(len(tickers)))})
+    @weak_lru(maxsize=4)
+    def valuation_ratios(self, year: int | None = None, quarter: int | None = None, n: int | None = None,
+                         summary: bool = False) -> pl.DataFrame:
+        """
+        Retrieve valuation ratios for the company and comparables for a given year/quarter.
 
-        df = (
-            df.lazy()
-            .join(ticker_df.lazy(), on="Ticker", how="left")
-            .sort(["Period", "Ticker_order"], descending=[True, False])
-            .drop("Ticker_order")
-            .collect(engine="streaming")
-        )
+        With ``summary=True``, returns per-period peer statistics and the company's percentile rank instead.
+        """
+        if year is None and quarter is None:
+            # One batch quote request for the whole peer set; each peer's TTM lookup then hits the cache.
+            tickers = self.get_c(n)
+            if tickers:
+                quote_service().get_quotes(list(tickers))
 
-        return df
+        return self._get_ratios(year, 'valuation_ratios', quarter, n, summary)
 
     @weak_lru(maxsize=4)
-    def profitability_ratios(self, year: int | None = None, quarter: int | None = None, n: int | None = None) -> pl.DataFrame:
-        """Retrieve profitability ratios for the company and comparables for a given year/quarter."""
-        return self._get_ratios(year, 'profitability_ratios', quarter, n)
+    def profitability_ratios_period(self, start_year: int, end_year: int, quarter: bool = False, n: int | None = None,
+                                    summary: bool = False) -> pl.DataFrame:
+        """
+        Retrieve profitability ratios over a range of years or quarters for the company and comparables.
 
-    @weak_lru(maxsize=4)
-    def liquidity_ratios(self, year: int | None = None, quarter: int | None = None, n: int | None = None) -> pl.DataFrame:
-        """Retrieve liquidity ratios for the company and comparables for a given year/quarter."""
-        return self._get_ratios(year, 'liquidity_ratios', quarter, n)
+        With ``summary=True``, returns per-period peer statistics and the company's percentile rank instead.
+        """
+        return self._get_ratios_period(start_year, end_year, 'profitability_ratios_period', quarter, n, summary)
 
     @weak_lru(maxsize=4)
-    def valuation_ratios(self, year: int | None = None, quarter: int | None = None, n: int | None = None) -> pl.DataFrame:
-        """Retrieve valuation ratios for the company and comparables for a given year/quarter."""
-        return self._get_ratios(year, 'valuation_ratios', quarter, n)
+    def liquidity_ratios_period(self, start_year: int, end_year: int, quarter: bool = False, n: int | None = None,
+                                summary: bool = False) -> pl.DataFrame:
+        """
+        Retrieve liquidity ratios over a range of years or quarters for the company and comparables.
 
-    @weak_lru(maxsize=4)
-    def profitability_ratios_period(self, start_year: int, end_year: int, quarter: bool = False, n: int | None = None) -> pl.DataFrame:
-        """Retrieve profitability ratios over a range of years or quarters for the company and comparables."""
-        return self._get_ratios_period(start_year, end_year, 'profitability_ratios_period', quarter, n)
+        With ``summary=True``, returns per-period peer statistics and the company's percentile rank instead.
+        """
+        return self._get_ratios_period(start_year, end_year, 'liquidity_ratios_period', quarter, n, summary)
 
     @weak_lru(maxsize=4)
-    def liquidity_ratios_period(self, start_year: int, end_year: int, quarter: bool = False, n: int | None = None) -> pl.DataFrame:
-        """Retrieve liquidity ratios over a range of years or quarters for the company and comparables."""
-        return self._get_ratios_period(start_year, end_year, 'liquidity_ratios_period', quarter, n)
+    def valuation_ratios_period(self, start_year: int, end_year: int, quarter: bool = False, n: int | None = None,
+                                summary: bool = False) -> pl.DataFrame:
+        """
+        Retrieve valuation ratios over a range of years or quarters for the company and comparables.
 
-    @weak_lru(maxsize=4)
-    def valuation_ratios_period(self, start_year: int, end_year: int, quarter: bool = False, n: int | None = None) -> pl.DataFrame:
-        """Retrieve valuation ratios over a range of years or quarters for the company and comparables."""
-        return self._get_ratios_period(start_year, end_year, 'valuation_ratios_period', quarter, n)
+        With ``summary=True``, returns per-period peer statistics and the company's percentile rank instead.
+        """
+        return self._get_ratios_period(start_year, end_year, 'valuation_ratios_period', quarter, n, summary)
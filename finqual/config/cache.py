@@ -0,0 +1,30 @@
+"""
+Location of finqual's on-disk caches.
+
+Disk caching is opt-in: set ``FINQUAL_CACHE_DIR`` to a writable directory to
+enable it for every persistent cache in the package. When unset, finqual
+keeps results in memory only.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# Environment variable naming the root directory of all persistent caches.
+CACHE_DIR_ENV = "FINQUAL_CACHE_DIR"
+
+
+def cache_dir(*parts: str) -> Path | None:
+    """
+    Return ``$FINQUAL_CACHE_DIR/<parts...>``, or ``None`` if disk caching is disabled.
+
+    Parameters
+    ----------
+    *parts : str
+        Sub-directory components appended to the cache root.
+    """
+    root = os.environ.get(CACHE_DIR_ENV)
+    if not root:
+        return None
+    return Path(root).expanduser().joinpath(*parts)
@@ -2,8 +2,12 @@ from .node_classes.node_tree import NodeTree
 from .node_classes.node import Node
 from .sec_edgar.sec_api import SecApi
 from .stocktwit import StockTwit
+from .statement_store import StatementStore, persisted
+from .prices import PriceProvider
+from .line_items import INCOME_STATEMENT_ITEMS, BALANCE_SHEET_ITEMS, CASH_FLOW_ITEMS, SHARES_OUTSTANDING
 from ._cache import weak_lru
-from . import ratios
+from . import tracing
+from . import ratio_engine
 
 from importlib.resources import files
 import ijson
@@ -11,7 +15,7 @@ import numpy as np
 import polars as pl
 import re
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from dateutil.relativedelta import relativedelta
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -217,6 +221,68 @@ def triangulate_smart(df: pl.DataFrame, rules: list[dict[str]]) -> tuple[pl.Data
 
     return df_out, notes
 
+def _quarter_index(label: str) -> int:
+    """Map a ``"YYYYQn"`` period label to a consecutive integer quarter index."""
+    year, quarter = label.split("Q")
+    return int(year) * 4 + int(quarter) - 1
+
+
+def rolling_ttm(df: pl.DataFrame, point_in_time: tuple[str, ...] = ()) -> pl.DataFrame:
+    """
+    Compute every rolling four-quarter (TTM) sum of a wide quarterly statement.
+
+    The quarterly columns are laid onto a dense quarter grid so that gaps (e.g.
+    quarters dropped because they were all zero) are never bridged: a TTM
+    column is only produced where all four quarters ending at it are present.
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        Wide statement with line items in the first column and ``"YYYYQn"``
+        period columns, as returned by the ``*_period(..., quarter=True)`` methods.
+    point_in_time : tuple of str, default ()
+        Line items that are instantaneous (e.g. ``"End Cash Position"``); they
+        take the value of the window's latest quarter instead of the sum.
+
+    Returns
+    -------
+    pl.DataFrame
+        Line items plus one column per window, labelled by the window's last
+        quarter and ordered newest first.
+    """
+    id_col = df.columns[0]
+    periods = df.columns[1:]
+
+    if not periods:
+        return df.select(id_col)
+
+    positions = {label: _quarter_index(label) for label in periods}
+    first = min(positions.values())
+    n_quarters = max(positions.values()) - first + 1
+
+    if n_quarters < 4:
+        return df.select(id_col)
+
+    # Dense (line item × quarter) grid; absent quarters stay NaN.
+    matrix = np.full((df.height, n_quarters), np.nan)
+    present = np.zeros(n_quarters, dtype=bool)
+    for label, pos in positions.items():
+        matrix[:, pos - first] = df[label].cast(pl.Float64).to_numpy()
+        present[pos - first] = True
+
+    sums = np.lib.stride_tricks.sliding_window_view(matrix, 4, axis=1).sum(axis=2)
+    complete = np.lib.stride_tricks.sliding_window_view(present, 4).all(axis=1)
+
+    pit_rows = df[id_col].is_in(list(point_in_time)).to_numpy()
+    sums[pit_rows] = matrix[pit_rows, 3:]
+
+    columns = {id_col: df[id_col]}
+    for offset in np.flatnonzero(complete)[::-1]:
+        end = first + offset + 3
+        columns[f"{end // 4}Q{end % 4 + 1}"] = sums[:, offset]
+
+    return pl.DataFrame(columns)
+
 # ----------------------------------------------------------------------------------
 
 class Finqual:
@@ -247,15 +313,29 @@ class Finqual:
         Polars DataFrame or LazyFrame with taxonomy label mappings and metadata.
     sector : str
         Company’s industry sector (as identified by SEC metadata).
+    latest_accession : str | None
+        Accession number of the latest periodic report; keys the statement store.
+    statement_store : StatementStore | None
+        On-disk store of computed statements. Defaults to the store under
+        ``$FINQUAL_CACHE_DIR`` when that variable is set, otherwise ``None``.
+    price_provider : PriceProvider | None
+        Source of historical share prices for valuation ratios (e.g. a
+        :class:`~finqual.prices.LocalPriceStore`). Without one, TTM valuation
+        uses a live StockTwits quote and historical valuation prices are NaN.
     """
     
-    def __init__(self, ticker_or_cik: str | int):
+    def __init__(self, ticker_or_cik: str | int, statement_store: StatementStore | None = None,
+                 price_provider: PriceProvider | None = None):
         self.ticker_or_cik = ticker_or_cik
-        self.sec_edgar = SecApi(ticker_or_cik)
+        with tracing.span("finqual.init", ticker_or_cik=str(ticker_or_cik)):
+            self.sec_edgar = SecApi(ticker_or_cik)
         self.ticker = self.sec_edgar.id_data.ticker
         self.cik = self.sec_edgar.id_data.cik
         self.taxonomy = self.sec_edgar.facts_data.taxonomy
         self.sector = self.sec_edgar.submissions_data.sector
+        self.latest_accession = self.sec_edgar.submissions_data.latest_accession
+        self.statement_store = statement_store if statement_store is not None else StatementStore.default()
+        self.price_provider = price_provider
 
         self.trees = self.select_tree()
         self.labels = self.select_label()
@@ -384,6 +464,7 @@ class Finqual:
         return results
 
     @weak_lru(maxsize=4)
+    @tracing.traced("finqual.annual_quarter")
     def _process_annual_quarter(self, year: int, quarter: int, label_type: tuple) -> pl.DataFrame:
         """
         Process annual quarter data by comparing annual report with the sum of previous quarters.
@@ -479,6 +560,7 @@ class Finqual:
         return df_annual_quarter
 
     @weak_lru(maxsize=4)
+    @tracing.traced("finqual.process_financials")
     def _process_financials(self, year: int, quarter: int | None, label_type: tuple,
                             period_type: tuple, target_yf_list: tuple, tolerance: float = 0.4) -> pl.DataFrame:
         """
@@ -518,16 +600,20 @@ class Finqual:
                     return df
 
             all_dfs = []
-            for nodes in self.trees.values():
-                nodes_copy = [n.copy() for n in nodes]  # make a thread-safe copy
-                tree = NodeTree(nodes_copy)
+            tree_rows = 0
+            with tracing.span("finqual.tree_eval", statement="".join(label_type), year=year, quarter=quarter) as stage:
+                for nodes in self.trees.values():
+                    nodes_copy = [n.copy() for n in nodes]  # make a thread-safe copy
+                    tree = NodeTree(nodes_copy)
 
-                tree.load_sec_data(sec_data_dict)
-                tree.get_all_values()   # TODO: this is not deterministic, see AMZN 2024 "Total Liabilities Net Minority Interest" changes
-                df_tree = tree.to_df()
+                    tree.load_sec_data(sec_data_dict)
+                    tree.get_all_values()   # TODO: this is not deterministic, see AMZN 2024 "Total Liabilities Net Minority Interest" changes
+                    df_tree = tree.to_df()
 
-                if df_tree is not None:
-                    all_dfs.append(df_tree.lazy().with_columns(pl.col("balance").cast(pl.Utf8)))
+                    if df_tree is not None:
+                        all_dfs.append(df_tree.lazy().with_columns(pl.col("balance").cast(pl.Utf8)))
+                        tree_rows += df_tree.height
+                stage.set(rows=tree_rows)
 
             if not all_dfs:
                 return pl.DataFrame()
@@ -538,23 +624,25 @@ class Finqual:
                 .select(["code", "yf", "prob"])
             )
 
-            df_total = (
-                pl.concat(all_dfs, how="vertical")
-                .with_columns(pl.col("balance").cast(pl.Utf8))
-                .filter(pl.col("period_type").is_in(period_type))
-                .join(df_label_lazy, on="code", how="inner")
-                .unique()
-                .filter(pl.col("yf").is_in(target_yf_list))
-                .select(["yf", "prob", "value"])
-                .group_by(["yf", "value"])
-                .agg(pl.col("prob").sum().alias("total_prob"))
-                .sort(["yf", "total_prob", "value"], descending=[False, True, False])
-                .with_columns(pl.arange(0, pl.len()).alias("row_num"))  # stable tie-breaker
-                .unique(subset="yf", keep="first")  # deterministic now
-                .filter(pl.col("total_prob") >= tolerance)
-                .drop("row_num")  # optional: remove tie-breaker
-                .collect(engine="streaming")
-            )
+            with tracing.span("finqual.label_join", statement="".join(label_type), year=year, quarter=quarter) as stage:
+                df_total = (
+                    pl.concat(all_dfs, how="vertical")
+                    .with_columns(pl.col("balance").cast(pl.Utf8))
+                    .filter(pl.col("period_type").is_in(period_type))
+                    .join(df_label_lazy, on="code", how="inner")
+                    .unique()
+                    .filter(pl.col("yf").is_in(target_yf_list))
+                    .select(["yf", "prob", "value"])
+                    .group_by(["yf", "value"])
+                    .agg(pl.col("prob").sum().alias("total_prob"))
+                    .sort(["yf", "total_prob", "value"], descending=[False, True, False])
+                    .with_columns(pl.arange(0, pl.len()).alias("row_num"))  # stable tie-breaker
+                    .unique(subset="yf", keep="first")  # deterministic now
+                    .filter(pl.col("total_prob") >= tolerance)
+                    .drop("row_num")  # optional: remove tie-breaker
+                    .collect(engine="streaming")
+                )
+                stage.set(rows=df_total.height)
 
             # ---
 
@@ -580,6 +668,8 @@ class Finqual:
             return df_target
 
     @weak_lru(maxsize=4)
+    @persisted("income_stmt")
+    @tracing.traced("finqual.income_stmt")
     def income_stmt(self, year: int, quarter: int | None = None) -> pl.DataFrame:
         """
         Retrieve the income statement for a given year and optional quarter.
@@ -597,14 +687,6 @@ class Finqual:
             Polars DataFrame of the income statement, with line items as rows.
         """
 
-        income_list = [
-            'Total Revenue', 'Cost Of Revenue', 'Gross Profit',
-            'Selling General And Administration', 'Research And Development',
-            'Other Operating Income Expense', 'Operating Income',
-            "Interest Expense", 'Other Non Operating Income Expense', 'Pretax Income',  # 'Total Expenses'
-            'Tax Provision', 'Net Income',
-        ]
-
         rules = [
             build_rule("Gross Profit = Total Revenue - Cost Of Revenue", prefer_balance=["Gross Profit"]),
             build_rule("Operating Income = Gross Profit - Selling General And Administration - Research And Development - Other Operating Income Expense", prefer_balance=["Other Operating Income Expense"]),
@@ -617,7 +699,7 @@ class Finqual:
             year, quarter,
             label_type=tuple(["income_statement"]),
             period_type=tuple(["duration"]),
-            target_yf_list=tuple(income_list),
+            target_yf_list=INCOME_STATEMENT_ITEMS,
         )
 
         # ---
@@ -659,7 +741,8 @@ class Finqual:
                 .alias("total_prob")
             )
 
-        df_income, log = triangulate_smart(df_income, rules)
+        with tracing.span("finqual.triangulate", statement="income_statement", year=year, quarter=quarter):
+            df_income, log = triangulate_smart(df_income, rules)
 
         label = str(year) if quarter is None else f"{year}Q{quarter}"
         df_income = df_income.rename({"value": label, "line_item": self.ticker})
@@ -677,6 +760,8 @@ class Finqual:
         return df_income
 
     @weak_lru(maxsize=4)
+    @persisted("balance_sheet")
+    @tracing.traced("finqual.balance_sheet")
     def balance_sheet(self, year: int, quarter: int | None = None) -> pl.DataFrame:
         """
         Retrieve the balance sheet for a given year and optional quarter.
@@ -694,23 +779,11 @@ class Finqual:
             Polars DataFrame of the balance sheet, with line items as rows.
         """
 
-        balance_list = [
-            "Total Assets",
-            "Current Assets", "Other Short Term Investments", "Receivables", "Inventory", "Other Current Assets",
-            "Total Non Current Assets", "Net PPE", "Goodwill", "Investments And Advances", "Other Non-Current Assets",
-
-            "Total Liabilities Net Minority Interest",
-            "Current Liabilities", "Accounts Payable", "Current Debt", "Current Capital Lease Obligation", "Other Current Liabilities",
-            "Total Non Current Liabilities Net Minority Interest", "Long Term Debt", "Long Term Capital Lease Obligation", "Other Non-Current Liabilities",
-
-            "Stockholders Equity", "Capital Stock", "Retained Earnings",
-        ]
-
         df_bs = self._process_financials(
             year, quarter,
             label_type=tuple(["balance_sheet"]),
             period_type=tuple(["instant"]),
-            target_yf_list=tuple(balance_list),
+            target_yf_list=BALANCE_SHEET_ITEMS,
         )
 
         rules = [
@@ -724,7 +797,8 @@ class Finqual:
             build_rule("Stockholders Equity = Common Stock + Preferred Stock + Retained Earnings"),
         ]
 
-        df_bs, log = triangulate_smart(df_bs, rules)
+        with tracing.span("finqual.triangulate", statement="balance_sheet", year=year, quarter=quarter):
+            df_bs, log = triangulate_smart(df_bs, rules)
 
         label = str(year) if quarter is None else f"{year}Q{quarter}"
         df_bs = df_bs.rename({"value": label, "line_item": self.ticker})
@@ -735,7 +809,7 @@ class Finqual:
         except (ValueError, TypeError):
             shares = 0.0
 
-        df_bs = pl.concat([df_bs, pl.DataFrame({self.ticker: ["Shares Outstanding"], label: [shares], "total_prob": [1.0]})])
+        df_bs = pl.concat([df_bs, pl.DataFrame({self.ticker: [SHARES_OUTSTANDING], label: [shares], "total_prob": [1.0]})])
 
         if "total_prob" in df_bs.columns:
             df_bs = df_bs.drop("total_prob")
@@ -750,6 +824,8 @@ class Finqual:
         return df_bs
 
     @weak_lru(maxsize=4)
+    @persisted("cash_flow")
+    @tracing.traced("finqual.cash_flow")
     def cash_flow(self, year: int, quarter: int | None = None) -> pl.DataFrame:
         """
         Retrieve the cash flow statement for a given year and optional quarter.
@@ -767,22 +843,11 @@ class Finqual:
             Polars DataFrame of the cash flow statement, with line items as rows.
         """
 
-        cashflow_list = [
-
-            "Operating Cash Flow",
-            "Depreciation And Amortization",
-            
-            "Investing Cash Flow",
-            
-            "Financing Cash Flow",
-            "End Cash Position",
-        ]
-
         df_cf = self._process_financials(
             year, quarter,
             label_type=tuple(["cash_flow"]),
             period_type=tuple(["duration", "instant"]),
-            target_yf_list=tuple(cashflow_list),
+            target_yf_list=CASH_FLOW_ITEMS,
         )
 
         label = str(year) if quarter is None else f"{year}Q{quarter}"
@@ -802,7 +867,7 @@ class Finqual:
 
     def _financials_period(self, method_name: str, start_year: int, end_year: int, append_type: str, quarter: bool = False) -> pl.DataFrame:
         """
-        Retrieve financial statements or ratios over a specified period.
+        Retrieve financial statements over a specified period.
 
         Parameters
         ----------
@@ -813,7 +878,7 @@ class Finqual:
         end_year : int
             End year of the period.
         append_type : str
-            'statement' for financials, 'ratios' for ratios.
+            'statement' for financials (ratios are evaluated by :mod:`finqual.ratio_engine`).
         quarter : bool, default=False
             If True, returns quarterly data.
 
@@ -875,25 +940,6 @@ class Finqual:
 
             return df_total
 
-        elif append_type == 'ratios':
-
-            dfs = []
-
-            for df in results.values():
-                dfs.append(df)
-
-            df_total = pl.concat(dfs, how="vertical")
-
-            metric_cols = [c for c in df_total.columns if c not in ("Ticker", "Period")]
-
-            df_mask = df_total.select([pl.when(pl.col(c).is_nan()).then(0).otherwise(pl.col(c)).alias(c) for c in metric_cols])
-            non_zero_mask = df_mask.select(pl.any_horizontal([pl.col(c) != 0 for c in metric_cols])).to_series()
-            df_total = df_total.filter(non_zero_mask)
-
-            df_total = df_total.sort("Period", descending=True)
-
-            return df_total
-
     def income_stmt_period(self, start_year: int, end_year: int,
                            quarter: bool = False) -> pl.DataFrame:
         """
@@ -968,64 +1014,127 @@ class Finqual:
     # Trailing Twelve Months (TTM)
     # ------------------------------------------------------------------ #
 
-    def _ttm_from_quarterly(
-        self,
-        period_fetcher,
-        statement_name: str,
-        end_cash_index: int | None = None,
-    ) -> pl.DataFrame:
+    def _ttm_series(self, period_fetcher, start_year: int, end_year: int,
+                    point_in_time: tuple[str, ...] = ()) -> pl.DataFrame:
         """
-        Generic TTM helper for income statement and cash flow.
+        Generic rolling-TTM helper for income statement and cash flow.
 
-        ``period_fetcher`` is one of :meth:`income_stmt_period` or
-        :meth:`cash_flow_period`. If insufficient quarterly columns are
-        available, fall back to the most recent annual column.
+        Fetches the quarterly statement once, from the year before
+        ``start_year`` (so the earliest window has its three prior quarters),
+        and evaluates every four-quarter window in one pass via :func:`rolling_ttm`.
 
         Parameters
         ----------
         period_fetcher : callable
             Bound method returning a quarterly statement DataFrame.
+        start_year : int
+            First year whose quarters may end a TTM window.
+        end_year : int
+            Last year whose quarters may end a TTM window.
+        point_in_time : tuple of str, default ()
+            Instantaneous line items carried from the window's latest quarter.
+        """
+        df = period_fetcher(start_year - 1, end_year, True)
+        if df.width < 2:
+            return df
+
+        df_ttm = rolling_ttm(df, point_in_time)
+
+        keep = [c for c in df_ttm.columns[1:] if start_year <= int(c[:4]) <= end_year]
+        return df_ttm.select([df_ttm.columns[0]] + keep)
+
+    def _ttm_from_quarterly(self, series_fetcher, period_fetcher, statement_name: str) -> pl.DataFrame:
+        """
+        Latest TTM column of ``series_fetcher``, falling back to annual data.
+
+        If no complete four-quarter window ends in the latest reporting year,
+        fall back to the most recent annual column of ``period_fetcher``.
+
+        Parameters
+        ----------
+        series_fetcher : callable
+            Bound ``*_ttm_series`` method.
+        period_fetcher : callable
+            Bound ``*_period`` method used for the annual fallback.
         statement_name : str
             Human-readable name used in the warning message.
-        end_cash_index : int or None, default ``None``
-            Row index of an instantaneous "End Cash Position" line that must
-            not be summed (cash flow only).
         """
         current_year, _ = self.sec_edgar.latest_report(quarterly=True)
-        df = period_fetcher(current_year - 1, current_year, True)
+        df = series_fetcher(current_year, current_year)
 
-        line_items = df.select(pl.col(df.columns[0]))
-        threshold = 4 if end_cash_index is None else 5  # cash_flow_ttm uses <= 4
-
-        if (end_cash_index is None and df.width < threshold) or (end_cash_index is not None and df.width <= 4):
+        if df.width < 2:
             print(f"Not enough data to calculate {statement_name} TTM for {self.ticker}")
             df = period_fetcher(current_year - 2, current_year + 2)
-            line_items = df.select(pl.col(df.columns[0]))
-            return pl.DataFrame(
-                {self.ticker: line_items, "TTM": df.select(pl.col(df.columns[1]))}
-            )
 
-        df_quarters = df.select(pl.col(df.columns[1:5]))
-        ttm = sum(df_quarters)
+        return df.select([pl.col(df.columns[0]), pl.col(df.columns[1]).alias("TTM")])
+
+    @weak_lru(maxsize=4)
+    def income_stmt_ttm_series(self, start_year: int, end_year: int) -> pl.DataFrame:
+        """
+        Retrieve every rolling trailing-twelve-month income statement in a range.
+
+        Parameters
+        ----------
+        start_year : int
+            First year whose quarters may end a TTM window.
+        end_year : int
+            Last year whose quarters may end a TTM window.
 
-        result = pl.DataFrame({self.ticker: line_items, "TTM": ttm})
+        Returns
+        -------
+        pl.DataFrame
+            Line items plus one TTM column per quarter-end (e.g. ``"2024Q3"``),
+            newest first. Quarters without four consecutive quarters of data are omitted.
+        """
+        return self._ttm_series(self.income_stmt_period, start_year, end_year)
+
+    @weak_lru(maxsize=4)
+    def balance_sheet_ttm_series(self, start_year: int, end_year: int) -> pl.DataFrame:
+        """
+        Retrieve the balance sheet at every quarter-end in a range.
 
-        # Cash flow's end-cash line is instantaneous, not cumulative.
-        if end_cash_index is not None:
-            result[end_cash_index, 1] = df_quarters[end_cash_index, 0]
+        The balance sheet is a snapshot, so each "TTM" column is simply the
+        quarterly balance sheet for that quarter.
 
-        return result
+        Parameters
+        ----------
+        start_year : int
+            Start year of the period.
+        end_year : int
+            End year of the period.
+        """
+        return self.balance_sheet_period(start_year, end_year, True)
 
     @weak_lru(maxsize=4)
+    def cash_flow_ttm_series(self, start_year: int, end_year: int) -> pl.DataFrame:
+        """
+        Retrieve every rolling trailing-twelve-month cash flow statement in a range.
+
+        The "End Cash Position" line is instantaneous and is carried from the
+        window's latest quarter rather than summed.
+
+        Parameters
+        ----------
+        start_year : int
+            First year whose quarters may end a TTM window.
+        end_year : int
+            Last year whose quarters may end a TTM window.
+        """
+        return self._ttm_series(self.cash_flow_period, start_year, end_year, point_in_time=("End Cash Position",))
+
+    @weak_lru(maxsize=4)
+    @persisted("income_stmt_ttm")
     def income_stmt_ttm(self) -> pl.DataFrame:
         """
         Retrieve the trailing twelve months (TTM) income statement.
 
-        If insufficient quarterly data exists, falls back to annual data.
+        This is the latest column of :meth:`income_stmt_ttm_series`. If
+        insufficient quarterly data exists, falls back to annual data.
         """
-        return self._ttm_from_quarterly(self.income_stmt_period, "income")
+        return self._ttm_from_quarterly(self.income_stmt_ttm_series, self.income_stmt_period, "income")
 
     @weak_lru(maxsize=4)
+    @persisted("balance_sheet_ttm")
     def balance_sheet_ttm(self) -> pl.DataFrame:
         """
         Retrieve the trailing twelve months (TTM) balance sheet.
@@ -1047,19 +1156,72 @@ class Finqual:
         return pl.DataFrame({self.ticker: line_items, "TTM": ttm})
 
     @weak_lru(maxsize=4)
+    @persisted("cash_flow_ttm")
     def cash_flow_ttm(self) -> pl.DataFrame:
         """
         Retrieve the trailing twelve months (TTM) cash flow statement.
 
-        The "End Cash Position" line (row index 4) is instantaneous and is
-        carried forward from the latest quarter rather than summed.
+        This is the latest column of :meth:`cash_flow_ttm_series`, so the
+        "End Cash Position" line is carried forward from the latest quarter.
         """
-        return self._ttm_from_quarterly(self.cash_flow_period, "cashflow", end_cash_index=4)
+        return self._ttm_from_quarterly(self.cash_flow_ttm_series, self.cash_flow_period, "cashflow")
 
     # ----
 
-    def _get_ratios(self, year: int | None, ratio_definitions: dict, statement_fetchers: dict,
-                    quarter: int | None = None, pct_flag: bool = False) -> dict:
+    # Ratio-engine source → statement method name.
+    _STATEMENT_METHODS = {
+        "income": "income_stmt",
+        "balance": "balance_sheet",
+        "cashflow": "cash_flow",
+    }
+
+    @classmethod
+    def _statement_methods(cls, ratio_definitions: dict) -> dict[str, str]:
+        """Statements needed by ``ratio_definitions``, as source → statement method name."""
+        sources = ratio_engine.required_sources(ratio_definitions.values())
+        return {name: method for name, method in cls._STATEMENT_METHODS.items() if name in sources}
+
+    def _statement(self, method_name: str, year: int, quarter: int | None) -> pl.DataFrame:
+        """Fetch a single-period statement, calling annual statements without a quarter argument."""
+        func = getattr(self, method_name)
+        return func(year, quarter) if quarter else func(year)
+
+    def _get_ratios(self, statements: dict[str, pl.DataFrame], ratio_definitions: dict,
+                    pct_flag: bool = False, share_price: float | pl.DataFrame | None = None) -> pl.DataFrame:
+        """
+        Evaluate ratios over every period present in the given statements.
+
+        Parameters
+        ----------
+        statements : dict[str, pl.DataFrame]
+            Wide statements keyed by type ('income', 'balance', 'cashflow'),
+            with one column per period (a single period, TTM, or a range).
+        ratio_definitions : dict[str, callable]
+            Ratio name → :mod:`finqual.ratio_engine` expression builder.
+        pct_flag : bool, default=False
+            If True, ratios are expressed as percentages.
+        share_price : float | pl.DataFrame | None, default=None
+            Share price applied to every period, or a ``Period`` / ``Share Price``
+            frame of per-period prices (valuation ratios only).
+
+        Returns
+        -------
+        pl.DataFrame
+            One row per period with 'Ticker', 'Period' and the calculated ratios.
+            Missing line items and zero denominators evaluate to NaN.
+        """
+        frame = ratio_engine.statement_frame(statements)
+        frame = frame.with_columns(pl.lit(self.ticker).alias("Ticker"))
+
+        if isinstance(share_price, pl.DataFrame):
+            frame = frame.join(share_price, on="Period", how="left")
+        elif share_price is not None:
+            frame = frame.with_columns(pl.lit(share_price, dtype=pl.Float64).alias("Share Price"))
+
+        return ratio_engine.evaluate_ratios(frame, ratio_definitions, 100 if pct_flag else 1)
+
+    def _get_ratios_single(self, year: int | None, quarter: int | None, ratio_definitions: dict,
+                           pct_flag: bool = False, share_price: float | None = None) -> pl.DataFrame:
         """
         Calculate financial ratios for a specific year/quarter or TTM.
 
@@ -1067,60 +1229,111 @@ class Finqual:
         ----------
         year : int | None
             Fiscal year of interest; None for TTM.
-        ratio_definitions : dict[str, callable]
-            Dictionary of ratio name to calculation function.
-        statement_fetchers : dict[str, callable]
-            Dictionary mapping statement types ('income', 'balance', 'cashflow') to fetcher functions.
-        quarter : int | None, default=None
+        quarter : int | None
             Specific quarter; None for full year or TTM.
+        ratio_definitions : dict[str, CompiledRatio]
+            Ratio name → compiled ratio. Only the statements it references are
+            fetched; TTM uses each statement's ``_ttm`` variant.
         pct_flag : bool, default=False
             If True, ratios are expressed as percentages.
+        share_price : float | None, default=None
+            Share price for valuation ratios.
 
         Returns
         -------
-        dict
-            Dictionary containing 'Ticker', 'Period', and calculated ratios.
+        pl.DataFrame
+            Single-row DataFrame containing 'Ticker', 'Period', and calculated ratios.
         """
-        if pct_flag:
-            ratio_multiplier = 100
-        else:
-            ratio_multiplier = 1
-
-        # --- Label
+        statement_methods = self._statement_methods(ratio_definitions)
 
         if year is None and quarter is None:
             label = "TTM"
-
+            statements = {name: getattr(self, f"{method}_ttm")() for name, method in statement_methods.items()}
         else:
             label = str(year) + "Q" + str(quarter) if quarter is not None else str(year)
+            statements = {name: self._statement(method, year, quarter) for name, method in statement_methods.items()}
 
-        # --- Retrieving ratios
+        df_ratio = self._get_ratios(statements, ratio_definitions, pct_flag, share_price)
+        df_ratio = df_ratio.filter(pl.col("Period") == label)
 
-        try:
-            statement_data = {}
-            for name, fetcher in statement_fetchers.items():
-                if quarter is None:
-                    stmt = fetcher(year)
-                    statement_data[name] = dict(zip(stmt[self.ticker], stmt[label]))
-                else:
-                    stmt = fetcher(year, quarter)
-                    statement_data[name] = dict(zip(stmt[self.ticker], stmt[label]))
-
-            result = {'Ticker': self.ticker, 'Period': label}
-            for ratio, func in ratio_definitions.items():
-                try:
-                    result[ratio] = func(statement_data) * ratio_multiplier
-                except (ZeroDivisionError, TypeError, KeyError):
-                    # Missing line items / zero denominators degrade gracefully to NaN.
-                    result[ratio] = np.nan
-            return result
-
-        except KeyError:
+        if df_ratio.is_empty():
             print(f"No data for {self.ticker} found.")
-            result = {'Ticker': self.ticker, 'Period': label}
-            for ratio, func in ratio_definitions.items():
-                result[ratio] = np.nan
-            return result
+            df_ratio = pl.DataFrame(
+                {"Ticker": [self.ticker], "Period": [label], **{ratio: [np.nan] for ratio in ratio_definitions}}
+            )
+
+        return df_ratio
+
+    def _get_ratios_period(self, start_year: int, end_year: int, quarter: bool, ratio_definitions: dict,
+                           pct_flag: bool = False, share_price: float | pl.DataFrame | None = None) -> pl.DataFrame:
+        """
+        Calculate financial ratios over a range of years or quarters in one columnar pass.
+
+        Each statement referenced by ``ratio_definitions`` is fetched once as a
+        wide multi-period frame (via its ``_period`` method) and every ratio is
+        evaluated over all periods at once. Periods whose ratios are all zero
+        or NaN are dropped.
+
+        Returns
+        -------
+        pl.DataFrame
+            DataFrame containing 'Ticker', 'Period' and calculated ratios, newest period first.
+        """
+        statements = {
+            name: getattr(self, f"{method}_period")(start_year, end_year, quarter)
+            for name, method in self._statement_methods(ratio_definitions).items()
+        }
+
+        df_total = self._get_ratios(statements, ratio_definitions, pct_flag, share_price)
+
+        metric_cols = [c for c in df_total.columns if c not in ("Ticker", "Period")]
+        non_empty = pl.any_horizontal([pl.col(c).fill_nan(0) != 0 for c in metric_cols])
+
+        return df_total.filter(non_empty).sort("Period", descending=True)
+
+    def _share_price(self, year: int | None, quarter: int | None) -> float:
+        """
+        Share price for valuation ratios.
+
+        With a :attr:`price_provider`, this is the last close on or before the
+        period's report date (today for TTM). Without one, TTM uses the latest
+        StockTwits quote and historical periods are NaN.
+        """
+        if self.price_provider is not None:
+            as_of = date.today() if year is None and quarter is None else self.sec_edgar.period_end_date(year, quarter)
+            return self.price_provider.price_asof(self.ticker, [as_of])[0]
+
+        if year is None and quarter is None:
+            return StockTwit(self.ticker).retrieve_data()[self.ticker]
+
+        print("*** Finqual: Note that historical valuation ratios need a price_provider; share prices are NaN.")
+        return np.nan
+
+    def _share_prices_period(self, start_year: int, end_year: int, quarter: bool) -> float | pl.DataFrame:
+        """
+        Per-period share prices for valuation ratios over a range.
+
+        Returns
+        -------
+        float | pl.DataFrame
+            ``Period`` / ``Share Price`` frame of as-of prices at each period's
+            report date, or NaN when no :attr:`price_provider` is configured.
+        """
+        if self.price_provider is None:
+            print("*** Finqual: Note that historical valuation ratios need a price_provider; share prices are NaN.")
+            return np.nan
+
+        periods = [
+            (y, q) for y in range(end_year, start_year - 1, -1)
+            for q in ([4, 3, 2, 1] if quarter else [None])
+        ]
+        dates = [self.sec_edgar.period_end_date(y, q) for y, q in periods]
+        prices = self.price_provider.price_asof(self.ticker, dates)
+
+        return pl.DataFrame(
+            {"Period": [str(y) if q is None else f"{y}Q{q}" for y, q in periods], "Share Price": prices},
+            schema={"Period": pl.Utf8, "Share Price": pl.Float64},
+        )
 
     def profitability_ratios(self, year: int | None = None, quarter: int | None = None) -> pl.DataFrame:
         """
@@ -1138,37 +1351,7 @@ class Finqual:
         pl.DataFrame
             Polars DataFrame with profitability ratios.
         """
-
-        if year is None and quarter is None:
-
-            statement_fetchers = {
-                'income': lambda y, q=None: self.income_stmt_ttm(),
-                'balance': lambda y, q=None: self.balance_sheet_ttm(),
-            }
-
-        else:
-
-            statement_fetchers = {
-                'income': lambda y, q=None: self.income_stmt(y, q) if q else self.income_stmt(y),
-                'balance': lambda y, q=None: self.balance_sheet(y, q) if q else self.balance_sheet(y),
-            }
-
-        ratio_definitions = {
-            'SG&A Ratio':       lambda data: ratios.sga_ratio(data['income']),
-            'R&D Ratio':        lambda data: ratios.rd_ratio(data['income']),
-            'Operating Margin': lambda data: ratios.operating_margin(data['income']),
-            'Gross Margin':     lambda data: ratios.gross_margin(data['income']),
-            'ROA':              lambda data: ratios.roa(data['income'], data['balance']),
-            'ROE':              lambda data: ratios.roe(data['income'], data['balance']),
-            'ROIC':             lambda data: ratios.roic(data['income'], data['balance']),
-        }
-
-        ratio_row = self._get_ratios(year, ratio_definitions, statement_fetchers, quarter, True)
-
-        df_ratio = pl.DataFrame([ratio_row])
-        df_ratio = df_ratio.fill_null(np.nan)
-
-        return df_ratio
+        return self._get_ratios_single(year, quarter, ratio_engine.PROFITABILITY_RATIOS, True)
 
     def liquidity_ratios(self, year: int | None = None, quarter: int | None = None) -> pl.DataFrame:
         """
@@ -1186,30 +1369,7 @@ class Finqual:
         pl.DataFrame
             Polars DataFrame with liquidity ratios.
         """
-
-        if year is None and quarter is None:
-
-            statement_fetchers = {
-                'balance': lambda y, q=None: self.balance_sheet_ttm(),
-            }
-
-        else:
-            statement_fetchers = {
-                'balance': lambda y, q=None: self.balance_sheet(y, q) if q else self.balance_sheet(y),
-            }
-
-        ratio_definitions = {
-            'Current Ratio':        lambda data: ratios.current_ratio(data['balance']),
-            'Quick Ratio':          lambda data: ratios.quick_ratio(data['balance']),
-            'Debt-to-Equity Ratio': lambda data: ratios.debt_to_equity(data['balance']),
-        }
-
-        ratio_row = self._get_ratios(year, ratio_definitions, statement_fetchers, quarter, False)
-
-        df_ratio = pl.DataFrame([ratio_row])
-        df_ratio = df_ratio.fill_null(np.nan)
-
-        return df_ratio
+        return self._get_ratios_single(year, quarter, ratio_engine.LIQUIDITY_RATIOS, False)
 
     def valuation_ratios(self, year: int | None = None, quarter: int | None = None) -> pl.DataFrame:
         """
@@ -1228,44 +1388,12 @@ class Finqual:
             Polars DataFrame with valuation ratios.
         Notes
         -----
-        Historical valuation ratios are not implemented; only current/latest data is supported.
+        TTM uses the latest quote. Historical periods use the ``price_provider``
+        close as of the period's report date, or NaN without a provider.
         """
 
-        if year is None and quarter is None:
-
-            share_price = StockTwit(self.ticker).retrieve_data()[self.ticker]  # This would have to be the share price at the given year and quarter time
-
-            statement_fetchers = {
-                'income': lambda y, q=None: self.income_stmt_ttm(),
-                'balance': lambda y, q=None: self.balance_sheet_ttm(),
-                'cashflow': lambda y, q=None: self.cash_flow_ttm(),
-            }
-
-        else:
-
-            print("*** Finqual: Note that functionality for historical valuation ratios not implemented.")
-
-            share_price = np.nan  # Placeholder code - need to add the share price at the requested year and quarter
-
-            statement_fetchers = {
-                'income': lambda y, q=None: self.income_stmt(y, q) if q else self.income_stmt(y),
-                'balance': lambda y, q=None: self.balance_sheet(y, q) if q else self.balance_sheet(y),
-                'cashflow': lambda y, q=None: self.cash_flow(y, q) if q else self.cash_flow(y),
-            }
-
-        ratio_definitions = {
-            'EPS':       lambda data: ratios.eps(data['income'], data['balance']),
-            'P/E':       lambda data: ratios.pe(data['income'], data['balance'], share_price),
-            'P/B':       lambda data: ratios.pb(data['income'], data['balance'], share_price),
-            'EV/EBITDA': lambda data: ratios.ev_ebitda(data['income'], data['balance'], data['cashflow'], share_price),
-        }
-
-        ratio_row = self._get_ratios(year, ratio_definitions, statement_fetchers, quarter, False)
-
-        df_ratio = pl.DataFrame([ratio_row])
-        df_ratio = df_ratio.fill_null(np.nan)
-
-        return df_ratio
+        share_price = self._share_price(year, quarter)
+        return self._get_ratios_single(year, quarter, ratio_engine.VALUATION_RATIOS, False, share_price)
 
     def profitability_ratios_period(self, start_year: int, end_year: int, quarter: bool = False) -> pl.DataFrame:
         """
@@ -1285,7 +1413,8 @@ class Finqual:
         pl.DataFrame
             Polars DataFrame with profitability ratios over the specified period.
         """
-        return self._financials_period("profitability_ratios", start_year, end_year, 'ratios', quarter)
+        return self._get_ratios_period(start_year, end_year, quarter,
+                                       ratio_engine.PROFITABILITY_RATIOS, True)
 
     def liquidity_ratios_period(self, start_year: int, end_year: int, quarter: bool = False) -> pl.DataFrame:
         """
@@ -1305,7 +1434,8 @@ class Finqual:
         pl.DataFrame
             Polars DataFrame with liquidity ratios over the specified period.
         """
-        return self._financials_period("liquidity_ratios", start_year, end_year, 'ratios', quarter)
+        return self._get_ratios_period(start_year, end_year, quarter,
+                                       ratio_engine.LIQUIDITY_RATIOS, False)
 
     def valuation_ratios_period(self, start_year: int, end_year: int, quarter: bool = False) -> pl.DataFrame:
         """
@@ -1326,6 +1456,68 @@ class Finqual:
             Polars DataFrame with valuation ratios over the specified period.
         Notes
         -----
-        Only current/latest valuation ratios are supported; historical valuation is not implemented.
+        Share prices are looked up as of each period's report date through the
+        configured ``price_provider``; without one, price-based ratios are NaN.
+        """
+        share_prices = self._share_prices_period(start_year, end_year, quarter)
+        return self._get_ratios_period(start_year, end_year, quarter,
+                                       ratio_engine.VALUATION_RATIOS, False, share_prices)
+
+    def custom_ratios(self, formulas: dict[str, str], year: int | None = None,
+                      quarter: int | None = None, pct_flag: bool = False) -> pl.DataFrame:
+        """
+        Calculate user-defined ratios for a given period.
+
+        Formulas reference standardised line items, e.g.
+        ``{"Cash Conversion": "Operating Cash Flow / Net Income"}``; see
+        :func:`finqual.ratio_engine.compile_ratio` for the syntax. Only the
+        statements the formulas reference are fetched.
+
+        Parameters
+        ----------
+        formulas : dict[str, str]
+            Ratio name → formula.
+        year : int | None, default=None
+            Fiscal year; None for TTM.
+        quarter : int | None, default=None
+            Specific quarter; None for annual data.
+        pct_flag : bool, default=False
+            If True, ratios are expressed as percentages.
+
+        Returns
+        -------
+        pl.DataFrame
+            Polars DataFrame with the requested ratios.
+        """
+        ratio_definitions = ratio_engine.compile_ratios(formulas)
+        needs_price = "price" in ratio_engine.required_sources(ratio_definitions.values())
+        share_price = self._share_price(year, quarter) if needs_price else None
+        return self._get_ratios_single(year, quarter, ratio_definitions, pct_flag, share_price)
+
+    def custom_ratios_period(self, formulas: dict[str, str], start_year: int, end_year: int,
+                             quarter: bool = False, pct_flag: bool = False) -> pl.DataFrame:
+        """
+        Calculate user-defined ratios over a period of years or quarters.
+
+        Parameters
+        ----------
+        formulas : dict[str, str]
+            Ratio name → formula (see :meth:`custom_ratios`).
+        start_year : int
+            Start year of the period.
+        end_year : int
+            End year of the period.
+        quarter : bool, default=False
+            If True, returns quarterly ratios.
+        pct_flag : bool, default=False
+            If True, ratios are expressed as percentages.
+
+        Returns
+        -------
+        pl.DataFrame
+            Polars DataFrame with the requested ratios over the specified period.
         """
-        return self._financials_period("valuation_ratios", start_year, end_year, 'ratios', quarter)
+        ratio_definitions = ratio_engine.compile_ratios(formulas)
+        needs_price = "price" in ratio_engine.required_sources(ratio_definitions.values())
+        share_price = self._share_prices_period(start_year, end_year, quarter) if needs_price else None
+        return self._get_ratios_period(start_year, end_year, quarter, ratio_definitions, pct_flag, share_price)
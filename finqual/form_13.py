@@ -2,15 +2,26 @@
 Parsing of SEC Form 13F-HR institutional-holdings XML filings.
 
 Aggregates holdings by issuer + asset-type and computes portfolio weights.
+
+A 13F-HR/A amendment either restates the manager's report or, for a
+"NEW HOLDINGS" amendment, lists only the positions it adds to it.
+:func:`parse_amendment_type` reads the type from the cover page and
+:func:`effective_filings` picks the filings that make up each report.
+
+Information tables from large managers run to tens of thousands of holdings,
+so they are parsed incrementally with ``iterparse`` straight from the download
+stream into column buffers; processed elements are cleared as soon as they
+are read, keeping peak memory flat regardless of filing size.
 """
 
 from __future__ import annotations
 
-from typing import Mapping
+import xml.etree.ElementTree as ET
+from typing import BinaryIO, Mapping
 
 import polars as pl
 
-from finqual.sec_edgar.xml_utils import gettext, safe_get_xml
+from finqual.sec_edgar.xml_utils import open_document
 
 # 13F information-table namespace
 SEC_13F_NS = {"ns": "http://www.sec.gov/edgar/document/thirteenf/informationtable"}
@@ -21,55 +32,188 @@ SEC_13F_NS = {"ns": "http://www.sec.gov/edgar/document/thirteenf/informationtabl
 SEC_13F_VALUE_MULTIPLIER = 1000.0
 
 
-def retrieve_form_13f_aggregated(xml_url: str, headers: Mapping[str, str]) -> pl.DataFrame:
+# Direct children of <infoTable> read into column buffers (local name → output column).
+_INFO_TABLE_FIELDS = {
+    "cusip": "CUSIP",
+    "nameOfIssuer": "Issuer",
+    "titleOfClass": "TitleOfClass",
+    "putCall": "PutCall",
+    "value": "Value",
+}
+
+
+# 13F-HR/A cover-page ``amendmentType`` values.
+AMENDMENT_RESTATEMENT = "RESTATEMENT"
+AMENDMENT_NEW_HOLDINGS = "NEW HOLDINGS"
+
+
+def _local_name(tag: str) -> str:
+    """Strip the ``{namespace}`` prefix from an element tag."""
+    return tag.rpartition("}")[2]
+
+
+def parse_amendment_type(source: BinaryIO) -> str | None:
     """
-    Retrieve and parse a 13F ``infoTable`` XML and aggregate holdings.
+    Read ``amendmentType`` from a 13F cover page (the filing's primary document).
 
-    Holdings are grouped by ``(CUSIP, Issuer, TitleOfClass, AssetType)`` —
-    ``AssetType`` distinguishes Equity / Put / Call so option overlays are
-    not collapsed into the underlying.
+    Parameters
+    ----------
+    source : BinaryIO
+        Readable binary stream of the cover-page XML.
+
+    Returns
+    -------
+    str | None
+        ``"RESTATEMENT"`` or ``"NEW HOLDINGS"``; None when the cover page has
+        no amendment type (an original filing).
+    """
+    for _, elem in ET.iterparse(source, events=("end",)):
+        if _local_name(elem.tag) == "amendmentType":
+            return " ".join((elem.text or "").split()).upper() or None
+    return None
+
+
+def effective_filings(filings: pl.DataFrame) -> pl.DataFrame:
+    """
+    Select the filings that make up each manager's report.
+
+    Per ``(CIK, reportDate)`` (per ``reportDate`` when there is no ``CIK``
+    column): the latest filing that is an original or a restatement, plus
+    every "NEW HOLDINGS" amendment filed after it, whose positions add to it.
+    An amendment of unknown type (no ``amendmentType``) is a restatement.
 
     Parameters
     ----------
-    xml_url : str
-        URL of the 13F holdings XML (``infoTable``).
-    headers : Mapping[str, str]
-        HTTP headers (typically :data:`finqual.config.headers.sec_headers`).
+    filings : pl.DataFrame
+        One row per filing with ``accessionNumber``, ``reportDate``,
+        ``filingDate`` and optionally ``CIK`` and ``amendmentType``.
 
     Returns
     -------
-    polars.DataFrame
-        Aggregated holdings with ``TotalShares``, ``TotalValue_USD`` and
-        ``PortfolioWeight`` columns, sorted by total value descending.
+    pl.DataFrame
+        The subset of ``filings`` to combine.
     """
-    root = safe_get_xml(xml_url, headers)
-
-    rows: list[dict] = []
-    for holding in root.findall(".//ns:infoTable", SEC_13F_NS):
-        shares_text = gettext(holding, "ns:shrsOrPrnAmt/ns:sshPrnamt", SEC_13F_NS)
-        value_text = gettext(holding, "ns:value", SEC_13F_NS)
-        put_call = gettext(holding, "ns:putCall", SEC_13F_NS)
-
-        asset_type = put_call.capitalize() if put_call else "Equity"
-
-        rows.append(
-            {
-                "CUSIP": gettext(holding, "ns:cusip", SEC_13F_NS),
-                "Issuer": gettext(holding, "ns:nameOfIssuer", SEC_13F_NS),
-                "TitleOfClass": gettext(holding, "ns:titleOfClass", SEC_13F_NS),
-                "AssetType": asset_type,
-                "Shares": float(shares_text) if shares_text else 0.0,
-                "Value_USD": float(value_text) * SEC_13F_VALUE_MULTIPLIER if value_text else 0.0,
-            }
+    amendment = pl.col("amendmentType") if "amendmentType" in filings.columns else pl.lit(None, dtype=pl.Utf8)
+    additive = amendment.fill_null("").str.to_uppercase() == AMENDMENT_NEW_HOLDINGS
+    keys = [c for c in ("CIK", "reportDate") if c in filings.columns]
+    ordered = filings.sort(["filingDate", "accessionNumber"], nulls_last=False)
+    base = (
+        ordered.filter(~additive)
+        .group_by(keys)
+        .agg(pl.col("accessionNumber").last().alias("_base"), pl.col("filingDate").last().alias("_base_filed"))
+    )
+    return (
+        ordered.join(base, on=keys, how="left")
+        .filter(
+            (~additive & (pl.col("accessionNumber") == pl.col("_base")))
+            | (additive & (pl.col("_base_filed").is_null() | (pl.col("filingDate") >= pl.col("_base_filed"))))
         )
+        .drop("_base", "_base_filed")
+    )
+
+
+def parse_information_table(source: BinaryIO) -> pl.DataFrame:
+    """
+    Stream-parse a 13F ``informationTable`` into one row per holding.
 
-    if not rows:
+    Elements are matched by local name, so filings using any namespace
+    prefix (or none) are handled.
+
+    Parameters
+    ----------
+    source : BinaryIO
+        Readable binary stream of the information-table XML.
+
+    Returns
+    -------
+    polars.DataFrame
+        ``CUSIP``, ``Issuer``, ``TitleOfClass``, ``AssetType``, ``Shares`` and
+        ``Value_USD`` columns; empty when the table has no holdings. A blank
+        or missing amount is ``0.0``.
+
+    Raises
+    ------
+    ValueError
+        If a ``sshPrnamt`` or ``value`` is not a number.
+    """
+    columns: dict[str, list] = {name: [] for name in (*_INFO_TABLE_FIELDS.values(), "Shares")}
+
+    # The first event is the root's start; it is kept so processed holdings can be detached from it.
+    events = ET.iterparse(source, events=("start", "end"))
+    _, root = next(events)
+
+    for event, elem in events:
+        if event != "end" or _local_name(elem.tag) != "infoTable":
+            continue
+
+        values = dict.fromkeys(columns)
+        for child in elem:
+            name = _local_name(child.tag)
+            if name in _INFO_TABLE_FIELDS:
+                values[_INFO_TABLE_FIELDS[name]] = child.text
+            elif name == "shrsOrPrnAmt":
+                for amount in child:
+                    if _local_name(amount.tag) == "sshPrnamt":
+                        values["Shares"] = amount.text
+
+        for name, value in values.items():
+            columns[name].append(value)
+
+        # Release the holding and detach it from the root so memory stays flat.
+        elem.clear()
+        root.clear()
+
+    if not columns["CUSIP"]:
         return pl.DataFrame()
 
-    df = pl.DataFrame(rows)
+    df = pl.DataFrame(columns, schema=dict.fromkeys(columns, pl.Utf8)).with_columns(
+        pl.col("Shares", "Value").str.strip_chars()
+    )
+    amounts = df.select(pl.col("Shares", "Value").cast(pl.Float64, strict=False))
+
+    # Blank amounts count as zero; anything else that does not parse is an error, not a silent zero.
+    malformed = df.select(
+        "CUSIP",
+        *[(df[c].is_not_null() & (df[c] != "") & amounts[c].is_null()).alias(c) for c in ("Shares", "Value")],
+    ).filter(pl.col("Shares") | pl.col("Value"))
+    if not malformed.is_empty():
+        raise ValueError(
+            f"{malformed.height} holding(s) with non-numeric sshPrnamt/value, "
+            f"e.g. CUSIP(s) {malformed['CUSIP'].head(5).to_list()}"
+        )
+
+    put_call = pl.col("PutCall")
+    return df.with_columns(amounts).select(
+        [
+            "CUSIP",
+            "Issuer",
+            "TitleOfClass",
+            pl.when(put_call.is_null() | (put_call == ""))
+            .then(pl.lit("Equity"))
+            .otherwise(put_call.str.slice(0, 1).str.to_uppercase() + put_call.str.slice(1).str.to_lowercase())
+            .alias("AssetType"),
+            pl.col("Shares").fill_null(0.0),
+            (pl.col("Value") * SEC_13F_VALUE_MULTIPLIER).fill_null(0.0).alias("Value_USD"),
+        ]
+    )
 
-    df_agg = (
-        df.group_by(["CUSIP", "Issuer", "TitleOfClass", "AssetType"])
+
+def aggregate_holdings(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Aggregate per-holding rows by ``(CUSIP, Issuer, TitleOfClass, AssetType)``.
+
+    Returns
+    -------
+    polars.DataFrame
+        ``TotalShares``, ``TotalValue_USD`` and ``PortfolioWeight`` per group,
+        sorted by total value descending.
+    """
+    if df.is_empty():
+        return pl.DataFrame()
+
+    return (
+        df.lazy()
+        .group_by(["CUSIP", "Issuer", "TitleOfClass", "AssetType"])
         .agg(
             [
                 pl.sum("Shares").alias("TotalShares"),
@@ -77,10 +221,128 @@ def retrieve_form_13f_aggregated(xml_url: str, headers: Mapping[str, str]) -> pl
             ]
         )
         .sort("TotalValue_USD", descending=True)
+        .with_columns((pl.col("TotalValue_USD") / pl.sum("TotalValue_USD")).alias("PortfolioWeight"))
+        .collect()
+    )
+
+
+def position_changes(df: pl.DataFrame, keys: tuple[str, ...] = ("CUSIP", "AssetType"),
+                     filed: pl.DataFrame | None = None) -> pl.DataFrame:
+    """
+    Compare 13F positions across consecutive report dates.
+
+    Every position (``keys``) is placed on the grid of report dates in
+    ``df`` and compared with the previous date in a single join / window
+    pipeline; a position missing from a report counts as zero, so exits are
+    reported as closed rather than disappearing. When several filings share a
+    report date (amendments), they are combined by :func:`effective_filings`:
+    the latest original or restatement, plus later "NEW HOLDINGS" amendments.
+    Rows of an additive amendment keep the ``PortfolioWeight`` they were
+    filed with, so a report's weights are summed across its filings.
+
+    Parameters
+    ----------
+    df : pl.DataFrame
+        Aggregated holdings for several report dates, shaped like
+        :meth:`FinqualForms.get_form_13_period` output (including its
+        ``amendmentType`` column, when present).
+    keys : tuple[str, ...], default=("CUSIP", "AssetType")
+        Columns identifying a position, e.g. ``("CIK", "AssetType")`` to
+        compare holders of a single CUSIP.
+    filed : pl.DataFrame | None, default=None
+        Report dates actually filed, as ``reportDate`` plus any key columns
+        that identify the filer (e.g. ``CIK``). When given, each position is
+        only observed on its filer's dates, so a filing that is missing (not
+        yet filed or not ingested) is never read as a closed or new position.
+        None observes every position on every report date in ``df``.
+
+    Returns
+    -------
+    polars.DataFrame
+        One row per report date and position with current and previous
+        ``TotalShares``, ``TotalValue_USD`` and ``PortfolioWeight``, their
+        deltas, and ``New`` / ``Closed`` flags; newest report first. The first
+        report date has no previous values.
+    """
+    keys = list(keys)
+    if df.is_empty():
+        return pl.DataFrame()
+
+    metrics = {"TotalShares": "Shares", "TotalValue_USD": "Value", "PortfolioWeight": "Weight"}
+    descriptive = [c for c in ("Issuer", "TitleOfClass") if c in df.columns and c not in keys]
+
+    lf = df.lazy()
+    if "filingDate" in df.columns and "accessionNumber" in df.columns:
+        filing_columns = [c for c in ("CIK", "accessionNumber", "reportDate", "filingDate", "amendmentType")
+                          if c in df.columns]
+        effective = effective_filings(df.select(filing_columns).unique("accessionNumber", maintain_order=True))
+        lf = lf.join(effective.lazy().select("accessionNumber"), on="accessionNumber", how="semi")
+
+    positions = lf.group_by(keys + ["reportDate"]).agg(pl.col(list(metrics)).sum())
+    labels = lf.group_by(keys).agg(pl.col(descriptive).drop_nulls().last()) if descriptive else None
+
+    if filed is None:
+        grid = positions.select(keys).unique().join(positions.select("reportDate").unique(), how="cross")
+    else:
+        filers = [c for c in filed.columns if c != "reportDate"]
+        dates = filed.lazy().select(filers + ["reportDate"]).unique()
+        grid = (positions.select(keys).unique().join(dates, on=filers, how="inner") if filers
+                else positions.select(keys).unique().join(dates, how="cross"))
+    previous = [
+        pl.col(col).shift(1).over(keys, order_by="reportDate").alias(f"Prev{col}") for col in metrics
+    ]
+    prev_shares = pl.col("PrevTotalShares")
+
+    out = (
+        grid.join(positions, on=keys + ["reportDate"], how="left")
+        .with_columns(pl.col(list(metrics)).fill_null(0.0))
+        .with_columns(previous)
+        .with_columns(
+            [(pl.col(col) - pl.col(f"Prev{col}")).alias(f"{name}Change") for col, name in metrics.items()]
+            + [
+                ((prev_shares == 0) & (pl.col("TotalShares") > 0)).fill_null(False).alias("New"),
+                ((prev_shares > 0) & (pl.col("TotalShares") == 0)).fill_null(False).alias("Closed"),
+            ]
+        )
+        # Drop grid cells where the position neither existed nor just closed.
+        .filter((pl.col("TotalShares") != 0) | (prev_shares.fill_null(0.0) != 0))
     )
+    if labels is not None:
+        out = out.join(labels, on=keys, how="left")
+
+    columns = ["reportDate"] + keys + descriptive
+    for col, name in metrics.items():
+        columns += [col, f"Prev{col}", f"{name}Change"]
 
-    df_agg = df_agg.with_columns(
-        (pl.col("TotalValue_USD") / pl.sum("TotalValue_USD")).alias("PortfolioWeight")
+    return (
+        out.select(columns + ["New", "Closed"])
+        .sort(["reportDate", "TotalValue_USD"], descending=[True, True])
+        .collect()
     )
 
-    return df_agg
+
+def retrieve_form_13f_aggregated(xml_url: str, headers: Mapping[str, str]) -> pl.DataFrame:
+    """
+    Retrieve and parse a 13F ``infoTable`` XML and aggregate holdings.
+
+    Holdings are grouped by ``(CUSIP, Issuer, TitleOfClass, AssetType)`` —
+    ``AssetType`` distinguishes Equity / Put / Call so option overlays are
+    not collapsed into the underlying.
+
+    Parameters
+    ----------
+    xml_url : str
+        URL of the 13F holdings XML (``infoTable``).
+    headers : Mapping[str, str]
+        HTTP headers (typically :data:`finqual.config.headers.sec_headers`).
+
+    Returns
+    -------
+    polars.DataFrame
+        Aggregated holdings with ``TotalShares``, ``TotalValue_USD`` and
+        ``PortfolioWeight`` columns, sorted by total value descending.
+    """
+    with open_document(xml_url, headers) as stream:
+        df = parse_information_table(stream)
+
+    return aggregate_holdings(df)
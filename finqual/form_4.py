@@ -9,7 +9,7 @@ reporting owner (officer, director, ten-percent owner, C-suite, etc.).
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
-from typing import Mapping, Optional
+from typing import Iterable, Mapping, Optional
 
 import polars as pl
 
@@ -76,6 +76,55 @@ _OUTPUT_COLUMNS = (
 )
 
 
+# Code columns mapped to human-readable labels.
+_CODE_LABELS = {
+    "TransactionCode": TRANSACTION_CODES,
+    "AcquisitionDisposal": ACQUISITION_CODES,
+    "OwnershipType": OWNERSHIP_MAP,
+}
+
+# Output dtypes. The parser collects role flags as bools and everything else as
+# text; :func:`form_4_frame` then casts the typed columns once, vectorised.
+_ROLE_COLUMNS = ("CSuite", "Officer", "Director", "10PercentOwner", "Other")
+_TYPED_COLUMNS = {
+    "Date": pl.Date,
+    "Shares": pl.Float64,
+    "TransactionPrice": pl.Float64,
+    "SharesOwnedFollowingTransaction": pl.Float64,
+    "TransactionCode": pl.Categorical(),
+    "OwnershipType": pl.Categorical(),
+    "TransactionType": pl.Categorical(),
+}
+OUTPUT_SCHEMA = {
+    col: pl.Boolean if col in _ROLE_COLUMNS else _TYPED_COLUMNS.get(col, pl.Utf8) for col in _OUTPUT_COLUMNS
+}
+
+# Transaction / holding elements per table, in output order: (table, element, transaction_type, is_holding).
+_SOURCES = (
+    ("nonDerivativeTable", "nonDerivativeTransaction", "Non-Derivative Transaction", False),
+    ("derivativeTable", "derivativeTransaction", "Derivative Transaction", False),
+    ("nonDerivativeTable", "nonDerivativeHolding", "Non-Derivative Holding", True),
+    ("derivativeTable", "derivativeHolding", "Derivative Holding", True),
+)
+
+# Per-element columns → direct child paths (relative to the transaction / holding element).
+_ELEMENT_PATHS = {
+    "Security": "securityTitle/value",
+    "SharesOwnedFollowingTransaction": "postTransactionAmounts/sharesOwnedFollowingTransaction/value",
+    "OwnershipType": "ownershipNature/directOrIndirectOwnership/value",
+    "NatureOfOwnership": "ownershipNature/natureOfOwnership/value",
+}
+
+# Columns only present on transactions; holdings leave them empty.
+_TRANSACTION_PATHS = {
+    "Date": "transactionDate/value",
+    "TransactionCode": "transactionCoding/transactionCode",
+    "Shares": "transactionAmounts/transactionShares/value",
+    "TransactionPrice": "transactionAmounts/transactionPricePerShare/value",
+    "AcquisitionDisposal": "transactionAmounts/transactionAcquiredDisposedCode/value",
+}
+
+
 def extract_roles(reporting_owner: Optional[ET.Element]) -> dict:
     """
     Extract role flags from a ``<reportingOwner>`` element.
@@ -93,11 +142,12 @@ def extract_roles(reporting_owner: Optional[ET.Element]) -> dict:
             "Other": False,
         }
 
-    officer_title = (gettext(reporting_owner, ".//officerTitle") or "").lower()
-    is_officer = gettext(reporting_owner, ".//isOfficer") == "1"
-    is_director = gettext(reporting_owner, ".//isDirector") == "1"
-    is_10pct = gettext(reporting_owner, ".//isTenPercentOwner") == "1"
-    is_other = gettext(reporting_owner, ".//isOther") == "1"
+    relationship = reporting_owner.find("reportingOwnerRelationship")
+    officer_title = (gettext(relationship, "officerTitle") or "").lower()
+    is_officer = gettext(relationship, "isOfficer") == "1"
+    is_director = gettext(relationship, "isDirector") == "1"
+    is_10pct = gettext(relationship, "isTenPercentOwner") == "1"
+    is_other = gettext(relationship, "isOther") == "1"
 
     is_csuite = is_officer and any(k in officer_title for k in _CSUITE_KEYWORDS)
 
@@ -111,51 +161,118 @@ def extract_roles(reporting_owner: Optional[ET.Element]) -> dict:
 
 
 # ------------------------------------------------------------------ #
-# Row builder (used for both transactions and holdings, derivative or not)
+# Parsing
 # ------------------------------------------------------------------ #
 
-def _build_row(
-    el: ET.Element,
-    root: ET.Element,
-    *,
-    transaction_type: str,
-    is_holding: bool,
-) -> dict:
+def parse_form_4_columns(root: ET.Element) -> dict[str, list]:
     """
-    Construct the canonical Form-4 row from a transaction/holding element.
+    Parse a Form 4 ``<ownershipDocument>`` element into column lists.
 
-    A *holding* never has a transaction date, code, share count, price or
-    acquisition/disposal flag, so those fields are forced to ``None``.
-    """
-    if is_holding:
-        date = None
-        tx_code = None
-        shares = None
-        price = None
-        ack_disp = None
-    else:
-        date = gettext(el, ".//transactionDate/value")
-        tx_code = gettext(el, ".//transactionCoding/transactionCode")
-        shares = gettext(el, ".//transactionShares/value")
-        price = gettext(el, ".//transactionPricePerShare/value")
-        ack_disp = gettext(el, ".//transactionAcquiredDisposedCode/value")
+    Filing-level fields (ticker, reporter name, position, role flags) are
+    read once; each transaction / holding is read with direct child paths
+    straight into per-column buffers.
 
-    return {
-        "Ticker": gettext(root, ".//issuerTradingSymbol"),
-        "Security": gettext(el, ".//securityTitle/value"),
-        "Date": date,
-        "Name": gettext(root, ".//reportingOwnerId/rptOwnerName"),
-        "Position": gettext(root, ".//officerTitle"),
-        "TransactionCode": tx_code,
-        "Shares": shares,
-        "TransactionPrice": price,
-        "AcquisitionDisposal": ack_disp,
-        "SharesOwnedFollowingTransaction": gettext(el, ".//sharesOwnedFollowingTransaction/value"),
-        "OwnershipType": gettext(el, ".//directOrIndirectOwnership/value"),
-        "NatureOfOwnership": gettext(el, ".//natureOfOwnership/value"),
-        "TransactionType": transaction_type,
+    Parameters
+    ----------
+    root : xml.etree.ElementTree.Element
+        Root ``<ownershipDocument>`` element.
+
+    Returns
+    -------
+    dict[str, list]
+        Output column → values, one entry per transaction / holding, in
+        ``_OUTPUT_COLUMNS`` order. Combine with :func:`form_4_frame`.
+    """
+    reporting_owner = root.find("reportingOwner")
+    filing_fields = {
+        "Ticker": gettext(root, "issuer/issuerTradingSymbol"),
+        "Name": gettext(reporting_owner, "reportingOwnerId/rptOwnerName"),
+        "Position": gettext(reporting_owner, "reportingOwnerRelationship/officerTitle"),
+        # Roles are reporter-level metadata — apply to every row.
+        **extract_roles(reporting_owner),
     }
 
+    columns: dict[str, list] = {name: [] for name in (*_ELEMENT_PATHS, *_TRANSACTION_PATHS, "TransactionType")}
+    for table_tag, element_tag, transaction_type, is_holding in _SOURCES:
+        table = root.find(table_tag)
+        if table is None:
+            continue
+
+        for el in table.iterfind(element_tag):
+            for name, path in _ELEMENT_PATHS.items():
+                columns[name].append(gettext(el, path))
+            # A holding never has a transaction date, code, share count, price or acquisition/disposal flag.
+            for name, path in _TRANSACTION_PATHS.items():
+                columns[name].append(None if is_holding else gettext(el, path))
+            columns["TransactionType"].append(transaction_type)
+
+    # Map codes to labels while still in Python lists; unknown codes pass through unchanged.
+    for name, labels in _CODE_LABELS.items():
+        columns[name] = [labels.get(code, code) for code in columns[name]]
+
+    n_rows = len(columns["TransactionType"])
+    for name, value in filing_fields.items():
+        columns[name] = [value] * n_rows
+
+    return {col: columns[col] for col in _OUTPUT_COLUMNS}
+
+
+def _cast_text(col: str, dtype: pl.DataType) -> pl.Expr:
+    """Vectorised cast of a text column to ``dtype``; unparseable values become null."""
+    if dtype == pl.Date:
+        # EDGAR dates occasionally carry a UTC offset suffix ("2024-09-11-05:00").
+        return pl.col(col).str.slice(0, 10).str.to_date("%Y-%m-%d", strict=False)
+    if dtype.is_numeric():
+        return pl.col(col).str.strip_chars().cast(dtype, strict=False)
+    return pl.col(col).cast(dtype)
+
+
+def form_4_frame(filings: Iterable[Mapping[str, list]], extra_schema: Mapping[str, pl.DataType] | None = None
+                 ) -> pl.DataFrame:
+    """
+    Build one typed DataFrame from the column lists of many parsed filings.
+
+    Building a frame costs far more than parsing a typical (few-row) filing,
+    so batches of filings are concatenated as Python lists, constructed once
+    as text, and cast to :data:`OUTPUT_SCHEMA` in a single vectorised pass.
+
+    Parameters
+    ----------
+    filings : Iterable[Mapping[str, list]]
+        Outputs of :func:`parse_form_4_columns`, optionally with extra text columns.
+    extra_schema : Mapping[str, pl.DataType] | None, default=None
+        Target dtypes of extra columns appended after the standard ones.
+
+    Returns
+    -------
+    polars.DataFrame
+        Frame with exactly :data:`OUTPUT_SCHEMA` plus ``extra_schema``, so
+        frames from separate calls concatenate with ``how="vertical"``.
+    """
+    schema = {**OUTPUT_SCHEMA, **(extra_schema or {})}
+    merged: dict[str, list] = {col: [] for col in schema}
+    for filing in filings:
+        for col, values in merged.items():
+            values.extend(filing[col])
+
+    raw_schema = {col: pl.Boolean if dtype == pl.Boolean else pl.Utf8 for col, dtype in schema.items()}
+    return pl.DataFrame(merged, schema=raw_schema).with_columns(
+        _cast_text(col, dtype) for col, dtype in schema.items() if raw_schema[col] != dtype
+    )
+
+
+def parse_form_4(root: ET.Element) -> pl.DataFrame:
+    """
+    Parse a Form 4 ``<ownershipDocument>`` element into a Polars DataFrame.
+
+    Returns
+    -------
+    polars.DataFrame
+        Rows for every non-derivative / derivative transaction and holding,
+        decorated with reporter-role flags, typed per :data:`OUTPUT_SCHEMA`.
+    """
+    return form_4_frame([parse_form_4_columns(root)])
+
 
 # ------------------------------------------------------------------ #
 # Public entry point
@@ -175,42 +292,11 @@ def retrieve_form_4(xml_url: str, headers: Mapping[str, str]) -> pl.DataFrame:
     Returns
     -------
     polars.DataFrame
-        Rows for every non-derivative / derivative transaction and holding,
-        decorated with reporter-role flags.
+        See :func:`parse_form_4`.
     """
-    root = safe_get_xml(xml_url, headers)
-    reporting_owner = root.find(".//reportingOwner")
-    role_flags = extract_roles(reporting_owner)
-
-    # Mapping of XPath → (transaction_type, is_holding)
-    sources = (
-        (".//nonDerivativeTransaction", "Non-Derivative Transaction", False),
-        (".//derivativeTransaction", "Derivative Transaction", False),
-        (".//nonDerivativeHolding", "Non-Derivative Holding", True),
-        # NB: SEC schema uses lowercase 'd' — the previous "DerivativeHolding"
-        # never matched and silently dropped these rows.
-        (".//derivativeHolding", "Derivative Holding", True),
-    )
+    return parse_form_4(safe_get_xml(xml_url, headers))
 
-    rows: list[dict] = []
-    for xpath, transaction_type, is_holding in sources:
-        for el in root.findall(xpath):
-            row = _build_row(el, root, transaction_type=transaction_type, is_holding=is_holding)
-            # Roles are reporter-level metadata — apply to every row.
-            row.update(role_flags)
-            rows.append(row)
-
-    if not rows:
-        return pl.DataFrame(schema={col: pl.Utf8 for col in _OUTPUT_COLUMNS})
-
-    df = pl.DataFrame(rows)
-
-    df = df.with_columns(
-        [
-            pl.col("TransactionCode").replace(TRANSACTION_CODES),
-            pl.col("AcquisitionDisposal").replace(ACQUISITION_CODES),
-            pl.col("OwnershipType").replace(OWNERSHIP_MAP),
-        ]
-    )
 
-    return df.select(list(_OUTPUT_COLUMNS))
+def retrieve_form_4_columns(xml_url: str, headers: Mapping[str, str]) -> dict[str, list]:
+    """Download a single Form 4 XML filing and parse it with :func:`parse_form_4_columns`."""
+    return parse_form_4_columns(safe_get_xml(xml_url, headers))
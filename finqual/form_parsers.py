@@ -8,27 +8,57 @@ returns aggregated insider-transaction / 13F holdings DataFrames.
 
 from __future__ import annotations
 
-import gzip
 import io
-from datetime import datetime, timedelta, timezone
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
 
-import ijson
 import polars as pl
-import requests
 from dateutil.relativedelta import relativedelta
-from ratelimit import limits
 
 from finqual._cache import weak_lru
 from finqual.config.headers import sec_headers
-from finqual.sec_edgar.entities.exceptions import CompanyIdCodeNotFoundError
+from finqual.sec_edgar.company import company_submissions, resolve_company
 from finqual.sec_edgar.entities.models import CompanyIdCode
+from finqual.sec_edgar.xml_utils import fetch_document
 
-from .form_4 import retrieve_form_4
-from .form_13 import retrieve_form_13f_aggregated
+from .form_4 import form_4_frame, retrieve_form_4_columns
+from .insider_store import InsiderStore
+from .form_13 import parse_amendment_type, position_changes, retrieve_form_13f_aggregated
 
 # HTTP request defaults for SEC endpoints.
 _REQUEST_TIMEOUT_SECS = 30
 
+# Form 4 filings fetched and parsed concurrently; requests are still paced by the shared SEC rate limiter.
+_FORM4_FETCH_WORKERS = 8
+
+# Filing metadata columns appended to every Form 4 row.
+_FORM4_FILING_SCHEMA = {"filingDate": pl.Date, "reportDate": pl.Date, "accessionNumber": pl.Utf8}
+
+# Accession directory listings resolved concurrently when locating 13F information tables.
+_INDEX_FETCH_WORKERS = 4
+
+
+def _information_table_name(listing: dict, primary_document: str | None) -> str | None:
+    """
+    Pick the information-table XML from an accession directory listing.
+
+    The submissions payload names the primary document (the 13F cover page)
+    but not the information table, so the table is the remaining XML file;
+    names mentioning "info" or "table" win when there are several.
+    """
+    primary = (primary_document or "primary_doc.xml").rsplit("/", 1)[-1].lower()
+    candidates = [
+        item["name"]
+        for item in listing.get("directory", {}).get("item", [])
+        if item["name"].lower().endswith(".xml") and item["name"].lower() not in (primary, "primary_doc.xml")
+    ]
+    if not candidates:
+        return None
+
+    preferred = [c for c in candidates if "info" in c.lower() or "table" in c.lower()]
+    return (preferred or candidates)[0]
+
 
 def _parse_period_to_start_date(period: str) -> datetime:
     """
@@ -71,7 +101,7 @@ class FinqualForms:
     Interface for interacting with SEC EDGAR endpoints and standardised forms.
     """
 
-    def __init__(self, ticker_or_cik: str | int):
+    def __init__(self, ticker_or_cik: str | int, insider_store: InsiderStore | None = None):
         """
         Initialise the SEC client and retrieve company-level metadata.
 
@@ -79,72 +109,55 @@ class FinqualForms:
         ----------
         ticker_or_cik : str or int
             Stock ticker (e.g., ``"AAPL"``) or raw CIK (e.g., ``"0000320193"``).
+        insider_store : InsiderStore | None, default=None
+            Local Form 4 store built from bulk archives. When set, insider
+            transactions are read from it instead of fetched per filing.
         """
         self.headers = sec_headers
+        self.insider_store = insider_store
         self.id_data = self.get_id_code(ticker_or_cik)
-        self.submissions_data = self.process_company_submissions()
+        self.submissions = company_submissions(self.id_data.cik, self.headers)
+        self.submissions_data = self.submissions.recent
 
     # ------------------------------------------------------------------ #
     # CIK / ticker resolution
     # ------------------------------------------------------------------ #
 
-    @weak_lru(maxsize=4)
     def get_id_code(self, ticker_or_cik: str | int) -> CompanyIdCode:
         """
         Resolve a ticker or CIK to a :class:`CompanyIdCode`.
 
+        Resolution is process-wide and shared with :class:`~finqual.sec_edgar.sec_api.SecApi`.
+
         Raises
         ------
         CompanyIdCodeNotFoundError
             If the ticker or CIK is not found in the SEC index.
         """
-        value = str(ticker_or_cik).strip()
-
-        # --- Numeric → treat as CIK
-        if value.isdigit():
-            cik_padded = value.zfill(10)
-            url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
-
-            response = requests.get(url, headers=self.headers, timeout=_REQUEST_TIMEOUT_SECS)
-            if response.status_code == 200:
-                data = response.json()
-                return CompanyIdCode(
-                    cik=cik_padded,
-                    name=data.get("name"),
-                    ticker=(data.get("tickers") or ["None"])[0],
-                    exchange=(data.get("exchanges") or ["None"])[0],
-                )
-
-            raise CompanyIdCodeNotFoundError(value)
-
-        # --- Otherwise → look up by ticker in SEC's combined index
-        url = "https://www.sec.gov/files/company_tickers_exchange.json"
-
-        with requests.get(url, headers=self.headers, stream=True, timeout=_REQUEST_TIMEOUT_SECS) as response:
-            gz = gzip.GzipFile(fileobj=response.raw)
-            text_stream = io.TextIOWrapper(gz, encoding="utf-8", errors="replace")
-
-            # Each item: [cik, title, ticker, exchange]
-            for item in ijson.items(text_stream, "data.item"):
-                cik, name, ticker, exchange = item
-                if ticker.lower() == value.lower() or str(cik) == value:
-                    return CompanyIdCode(
-                        cik=str(cik).zfill(10),
-                        name=name,
-                        ticker=ticker,
-                        exchange=exchange,
-                    )
-
-        raise CompanyIdCodeNotFoundError(value)
+        return resolve_company(ticker_or_cik, self.headers)
 
     # ------------------------------------------------------------------ #
     # Form-4 (insider) and Form-13F (institutional holdings) metadata
     # ------------------------------------------------------------------ #
 
+    def _filings(self, since: date | None) -> pl.DataFrame:
+        """Return the submissions table, reaching into older pages only when ``since`` predates it."""
+        if since is None:
+            return self.submissions_data
+        return self.submissions.filings(since)
+
     @weak_lru(maxsize=4)
-    def get_form4(self) -> pl.DataFrame:
-        """Return the metadata DataFrame of Form 4 (insider transaction) filings."""
-        df = self.submissions_data.filter(pl.col("form").is_in(["4"]))
+    def get_form4(self, since: date | None = None) -> pl.DataFrame:
+        """
+        Return the metadata DataFrame of Form 4 (insider transaction) filings.
+
+        Parameters
+        ----------
+        since : date | None, default=None
+            Earliest filing date wanted. None uses the recent filings only;
+            an earlier date than those also reads the older submission pages.
+        """
+        df = self._filings(since).filter(pl.col("form").is_in(["4"]))
 
         df = df.with_columns(
             (
@@ -160,9 +173,16 @@ class FinqualForms:
         return df
 
     @weak_lru(maxsize=4)
-    def get_form13(self) -> pl.DataFrame:
-        """Return the metadata DataFrame of Form 13F (institutional holdings) filings."""
-        df = self.submissions_data.filter(
+    def get_form13(self, since: date | None = None) -> pl.DataFrame:
+        """
+        Return the metadata DataFrame of Form 13F (institutional holdings) filings.
+
+        Parameters
+        ----------
+        since : date | None, default=None
+            As for :meth:`get_form4`; ``date.min`` reads the complete history.
+        """
+        df = self._filings(since).filter(
             pl.col("form").is_in(["13-F", "13F-HR", "13F", "13F-HR/A"])
         )
 
@@ -177,27 +197,37 @@ class FinqualForms:
 
         return df
 
-    @limits(calls=10, period=1)
     def process_company_submissions(self) -> pl.DataFrame:
         """
-        Download and parse the SEC ``submissions`` JSON file for the company.
+        Return the company's typed recent-filings table.
 
-        Returns
-        -------
-        polars.DataFrame
-            The recent-filings table from the SEC submissions endpoint.
+        The submissions file is downloaded through the process-wide
+        :func:`~finqual.sec_edgar.company.company_submissions` cache, shared
+        with :class:`~finqual.sec_edgar.sec_api.SecApi`.
         """
-        url = f"https://data.sec.gov/submissions/CIK{self.id_data.cik}.json"
-        response = requests.get(url, headers=self.headers, timeout=_REQUEST_TIMEOUT_SECS)
-        response.raise_for_status()
-
-        json_request = response.json()
-        return pl.DataFrame(json_request["filings"]["recent"])
+        return company_submissions(self.id_data.cik, self.headers).recent
 
     # ------------------------------------------------------------------ #
     # Form-4 detail fetch + period aggregation
     # ------------------------------------------------------------------ #
 
+    def _form4_filing_columns(self, url: str, filing_date, report_date, accession_number: str) -> dict[str, list]:
+        """Retrieve a single Form 4 filing as column lists, with its filing metadata appended."""
+        columns = retrieve_form_4_columns(url, self.headers)
+
+        n_rows = len(columns["TransactionType"])
+        columns["filingDate"] = [str(filing_date) if filing_date is not None else None] * n_rows
+        columns["reportDate"] = [str(report_date) if report_date is not None else None] * n_rows
+        columns["accessionNumber"] = [accession_number] * n_rows
+        return columns
+
+    def _process_form4_filing(
+        self, url: str, filing_date, report_date, accession_number: str
+    ) -> pl.DataFrame:
+        """Retrieve and normalise a single Form 4 filing from its metadata fields."""
+        columns = self._form4_filing_columns(url, filing_date, report_date, accession_number)
+        return form_4_frame([columns], extra_schema=_FORM4_FILING_SCHEMA)
+
     def _process_form4_by_accession(
         self, df_filings: pl.DataFrame, accession_number: str
     ) -> pl.DataFrame:
@@ -206,93 +236,171 @@ class FinqualForms:
         if row.is_empty():
             raise ValueError(f"Accession {accession_number} not found.")
 
-        url = row["URL"][0]
-        filing_date = row["filingDate"][0]
-        report_date = row["reportDate"][0]
-
-        df_form4 = retrieve_form_4(url, self.headers)
-        df_form4 = df_form4.with_columns(
-            [
-                pl.lit(filing_date, dtype=pl.Utf8).alias("filingDate"),
-                pl.lit(report_date, dtype=pl.Utf8).alias("reportDate"),
-                pl.lit(accession_number, dtype=pl.Utf8).alias("accessionNumber"),
-            ]
+        return self._process_form4_filing(
+            row["URL"][0], row["filingDate"][0], row["reportDate"][0], accession_number
         )
-        return df_form4
 
-    def get_insider_transactions_period(self, period: str) -> pl.DataFrame:
+    def get_insider_transactions_period(self, period: str, max_workers: int = _FORM4_FETCH_WORKERS) -> pl.DataFrame:
         """
         Retrieve insider transactions filed within ``period`` (e.g. ``'1y'``, ``'6m'``).
+
+        With an ``insider_store``, rows are read from the local store.
+        Otherwise filings are downloaded and parsed to column lists on a
+        thread pool (every request still goes through the shared SEC rate
+        limiter) and the result frame is built once. Either way rows are
+        ordered newest filing first, and filings that fail are reported and
+        skipped.
+
+        Parameters
+        ----------
+        period : str
+            Look-back window suffixed with ``y``, ``m`` or ``d``.
+        max_workers : int, default=8
+            Filings fetched concurrently.
+
+        Returns
+        -------
+        pl.DataFrame
+            Typed rows (see :data:`finqual.form_4.OUTPUT_SCHEMA`) plus Date
+            ``filingDate`` / ``reportDate`` and ``accessionNumber``.
         """
-        df = self.get_form4()
+        start_date = _parse_period_to_start_date(period)
+
+        if self.insider_store is not None:
+            df = self.insider_store.transactions(cik=self.id_data.cik, start=start_date.date())
+            return df.drop("IssuerCIK") if not df.is_empty() else pl.DataFrame()
+
+        df = self.get_form4(start_date.date())
 
         if df is None or df.is_empty():
             print("No Form 4 filings found.")
             return pl.DataFrame()
 
-        start_date = _parse_period_to_start_date(period)
-
-        df = df.with_columns(pl.col("filingDate").str.strptime(pl.Date, strict=False))
         df_filtered = df.filter(pl.col("filingDate") >= start_date.date())
 
         if df_filtered.is_empty():
             return pl.DataFrame()
 
-        dfs: list[pl.DataFrame] = []
-        for accession_number in df_filtered["accessionNumber"]:
+        def fetch(filing: tuple) -> dict[str, list] | None:
+            url, filing_date, report_date, accession_number = filing
             try:
-                dfs.append(self._process_form4_by_accession(df_filtered, accession_number))
+                return self._form4_filing_columns(url, filing_date, report_date, accession_number)
             except Exception as e:
                 print(f"[FinqualForms] Skipping Form 4 accession {accession_number}: {type(e).__name__}: {e}")
-                continue
+                return None
 
-        if not dfs:
+        filings = df_filtered.select(["URL", "filingDate", "reportDate", "accessionNumber"]).iter_rows()
+
+        # ``map`` yields in submission order, so output order is independent of completion order.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = [columns for columns in executor.map(fetch, filings) if columns is not None]
+
+        if not parsed:
             return pl.DataFrame()
 
-        return pl.concat(dfs, how="vertical_relaxed")
+        # Filings are parsed to column lists and the frame is built once for the whole period.
+        return form_4_frame(parsed, extra_schema=_FORM4_FILING_SCHEMA)
 
     # ------------------------------------------------------------------ #
     # Form-13F detail fetch + period aggregation
     # ------------------------------------------------------------------ #
 
-    def _process_form13_by_accession(
-        self, df_filings: pl.DataFrame, accession_number: str
-    ) -> pl.DataFrame:
-        """Retrieve and normalise a single Form 13F filing by accession number."""
-        row = df_filings.filter(pl.col("accessionNumber") == accession_number)
-        if row.is_empty():
-            raise ValueError(f"Accession {accession_number} not found.")
+    def _information_table_url(self, base_url: str, primary_document: str | None, accession_number: str) -> str:
+        """
+        Return the information-table URL of one 13F filing.
 
-        url = row["URL"][0] + "/index.json"
-        filing_date = row["filingDate"][0]
-        report_date = row["reportDate"][0]
+        The accession's ``index.json`` listing is fetched through the
+        permanent filing cache, so each listing is downloaded at most once.
+        """
+        listing = json.loads(fetch_document(base_url + "/index.json", self.headers, _REQUEST_TIMEOUT_SECS))
+        name = _information_table_name(listing, primary_document)
+        if name is None:
+            raise ValueError(f"No holdings XML found for accession {accession_number}")
+        return base_url + f"/{name}"
 
-        resp = requests.get(url, headers=self.headers, timeout=_REQUEST_TIMEOUT_SECS)
-        resp.raise_for_status()
+    def resolve_information_tables(self, df_filings: pl.DataFrame,
+                                   max_workers: int = _INDEX_FETCH_WORKERS) -> dict[str, str]:
+        """
+        Locate the information-table XML for many 13F filings at once.
 
-        files = resp.json()["directory"]["item"]
+        Listings already in the filing cache cost no request; the rest are
+        fetched concurrently under the shared SEC rate limiter. Filings whose
+        table cannot be found are reported and omitted.
 
-        # Pick the holdings XML (anything except primary_doc.xml)
-        xml_files = [
-            f["name"]
-            for f in files
-            if f["name"].lower().endswith(".xml") and f["name"].lower() != "primary_doc.xml"
-        ]
+        Parameters
+        ----------
+        df_filings : pl.DataFrame
+            13F filing metadata as returned by :meth:`get_form13`.
+        max_workers : int, default=4
+            Listings fetched concurrently.
 
-        if not xml_files:
-            raise ValueError(f"No holdings XML found for accession {accession_number}")
+        Returns
+        -------
+        dict[str, str]
+            Accession number → information-table URL.
+        """
+        primary = (
+            pl.col("primaryDocument") if "primaryDocument" in df_filings.columns else pl.lit(None, dtype=pl.Utf8)
+        )
+        rows = df_filings.select([pl.col("accessionNumber"), pl.col("URL"), primary.alias("primaryDocument")])
+
+        def resolve(row: tuple) -> tuple[str, str | None]:
+            accession_number, base_url, primary_document = row
+            try:
+                return accession_number, self._information_table_url(base_url, primary_document, accession_number)
+            except Exception as e:
+                print(f"[FinqualForms] Skipping Form 13 accession {accession_number}: {type(e).__name__}: {e}")
+                return accession_number, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            resolved = executor.map(resolve, rows.iter_rows())
+            return {accession_number: url for accession_number, url in resolved if url is not None}
 
-        info_xml_url = row["URL"][0] + f"/{xml_files[0]}"
+    def _amendment_type(self, base_url: str, primary_document: str | None) -> str | None:
+        """
+        Read a 13F-HR/A's amendment type ("RESTATEMENT" / "NEW HOLDINGS") from its cover page.
+
+        The submissions payload names the rendered cover page
+        (``xslForm13F_X02/primary_doc.xml``); the raw XML sits at the
+        accession root under the same name.
+        """
+        name = (primary_document or "primary_doc.xml").rsplit("/", 1)[-1]
+        content = fetch_document(f"{base_url}/{name}", self.headers, _REQUEST_TIMEOUT_SECS)
+        return parse_amendment_type(io.BytesIO(content))
+
+    def _process_form13_filing(
+        self, info_xml_url: str, filing_date, report_date, accession_number: str,
+        amendment_type: str | None = None,
+    ) -> pl.DataFrame:
+        """Retrieve and normalise a single Form 13F information table."""
         df_form13 = retrieve_form_13f_aggregated(info_xml_url, self.headers)
+        # Submissions dates are typed ``date``s (or None); 13F frames keep ISO strings, as HoldingsStore does.
         df_form13 = df_form13.with_columns(
             [
-                pl.lit(filing_date, dtype=pl.Utf8).alias("filingDate"),
-                pl.lit(report_date, dtype=pl.Utf8).alias("reportDate"),
+                pl.lit(str(filing_date) if filing_date else None, dtype=pl.Utf8).alias("filingDate"),
+                pl.lit(str(report_date) if report_date else None, dtype=pl.Utf8).alias("reportDate"),
                 pl.lit(accession_number, dtype=pl.Utf8).alias("accessionNumber"),
+                pl.lit(amendment_type, dtype=pl.Utf8).alias("amendmentType"),
             ]
         )
         return df_form13
 
+    def _process_form13_by_accession(
+        self, df_filings: pl.DataFrame, accession_number: str
+    ) -> pl.DataFrame:
+        """Retrieve and normalise a single Form 13F filing by accession number."""
+        row = df_filings.filter(pl.col("accessionNumber") == accession_number)
+        if row.is_empty():
+            raise ValueError(f"Accession {accession_number} not found.")
+
+        primary_document = row["primaryDocument"][0] if "primaryDocument" in row.columns else None
+        info_xml_url = self._information_table_url(row["URL"][0], primary_document, accession_number)
+        is_amendment = "form" in row.columns and row["form"][0] == "13F-HR/A"
+        amendment_type = self._amendment_type(row["URL"][0], primary_document) if is_amendment else None
+        return self._process_form13_filing(
+            info_xml_url, row["filingDate"][0], row["reportDate"][0], accession_number, amendment_type
+        )
+
     def get_form_13_period(self, n: int) -> pl.DataFrame:
         """
         Retrieve the aggregated holdings of the latest ``n`` Form 13F filings.
@@ -301,23 +409,50 @@ class FinqualForms:
         ----------
         n : int
             Number of most-recent filings to include.
+
+        Returns
+        -------
+        pl.DataFrame
+            Aggregated holdings per filing with ``CIK``, ``filingDate``,
+            ``reportDate``, ``accessionNumber`` and ``amendmentType`` (the
+            13F-HR/A cover-page type, null for original filings). An amendment
+            whose cover page cannot be read is skipped.
         """
         df = self.get_form13()
+        if df.height < n and self.submissions.pages:
+            # Fewer filings than requested in the recent table: read the older pages too.
+            df = self.get_form13(date.min)
 
         if df is None or df.is_empty():
             print("No Form 13 filings found.")
             return pl.DataFrame()
 
-        df = df.with_columns(pl.col("filingDate").str.strptime(pl.Date, strict=False))
         df_latest = df.sort("filingDate", descending=True).head(n)
 
         if df_latest.is_empty():
             return pl.DataFrame()
 
+        info_tables = self.resolve_information_tables(df_latest)
+
+        optional = {"form": pl.col("form"), "primaryDocument": pl.col("primaryDocument"), "URL": pl.col("URL")}
+        filings = df_latest.select(
+            ["accessionNumber", "filingDate", "reportDate"]
+            + [expr if name in df_latest.columns else pl.lit(None, dtype=pl.Utf8).alias(name)
+               for name, expr in optional.items()]
+        )
+
         dfs: list[pl.DataFrame] = []
-        for accession_number in df_latest["accessionNumber"]:
+        for accession_number, filing_date, report_date, form, primary_document, base_url in filings.iter_rows():
+            if accession_number not in info_tables:
+                continue
             try:
-                dfs.append(self._process_form13_by_accession(df_latest, accession_number))
+                # A "NEW HOLDINGS" amendment adds to the original filing rather than replacing it.
+                amendment_type = self._amendment_type(base_url, primary_document) if form == "13F-HR/A" else None
+                dfs.append(
+                    self._process_form13_filing(
+                        info_tables[accession_number], filing_date, report_date, accession_number, amendment_type
+                    )
+                )
             except Exception as e:
                 print(f"[FinqualForms] Skipping Form 13 accession {accession_number}: {type(e).__name__}: {e}")
                 continue
@@ -330,3 +465,27 @@ class FinqualForms:
         df_agg = df_agg.select(["CIK"] + [c for c in df_agg.columns if c != "CIK"])
 
         return df_agg
+
+    def get_form_13_changes(self, n: int) -> pl.DataFrame:
+        """
+        Quarter-over-quarter position changes across the latest ``n`` Form 13F filings.
+
+        Parameters
+        ----------
+        n : int
+            Number of most-recent filings to include; ``n`` filings give up to
+            ``n - 1`` quarters of changes.
+
+        Returns
+        -------
+        pl.DataFrame
+            Share, value and weight deltas with new / closed flags per
+            ``CUSIP`` and ``AssetType`` (see :func:`finqual.form_13.position_changes`).
+        """
+        df = self.get_form_13_period(n)
+        if df.is_empty():
+            return pl.DataFrame()
+
+        df_changes = position_changes(df)
+        df_changes = df_changes.with_columns(pl.lit(self.id_data.cik).alias("CIK"))
+        return df_changes.select(["CIK"] + [c for c in df_changes.columns if c != "CIK"])
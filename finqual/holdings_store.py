@@ -0,0 +1,308 @@
+"""
+Local cross-manager store of 13F holdings, indexed by CUSIP.
+
+:meth:`FinqualForms.get_form_13_period` answers "what does this manager hold?".
+:class:`HoldingsStore` answers the reverse — "who holds this CUSIP, and how did
+that change?" — by ingesting many managers' parsed information tables into a
+CUSIP-partitioned Parquet dataset::
+
+    <root>/cusip=<first two CUSIP characters>.parquet   holdings, sorted by CUSIP
+    <root>/index.parquet                                CUSIP → (partition, offset, length)
+    <root>/accessions.parquet                           ingested filings (CIK, report date, amendment type)
+
+Each partition file is sorted by CUSIP, and the inverted index records the row
+range of every CUSIP, so a holder lookup reads one slice of one file. The
+filings table records which report dates each manager has filed, so
+:meth:`HoldingsStore.holder_changes` can tell "sold out" from "not filed yet".
+
+Ingestion is incremental: only the partitions touched by new filings are
+rewritten, and filings already in the store are skipped. Ingest in batches
+(one call per group of filings) to amortise partition rewrites. The store
+assumes a single writer.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import polars as pl
+
+from finqual.config.cache import cache_dir
+from finqual.form_13 import effective_filings, position_changes
+
+# Number of leading CUSIP characters used as the partition key.
+_PARTITION_PREFIX_LEN = 2
+
+# Columns stored for every holding (the output of ``FinqualForms.get_form_13_period``).
+HOLDING_COLUMNS = {
+    "CIK": pl.Utf8,
+    "accessionNumber": pl.Utf8,
+    "reportDate": pl.Utf8,
+    "filingDate": pl.Utf8,
+    "CUSIP": pl.Utf8,
+    "Issuer": pl.Utf8,
+    "TitleOfClass": pl.Utf8,
+    "AssetType": pl.Utf8,
+    "TotalShares": pl.Float64,
+    "TotalValue_USD": pl.Float64,
+    "PortfolioWeight": pl.Float64,
+}
+
+# One row per ingested filing. ``amendmentType`` is the 13F-HR/A cover-page
+# value ("RESTATEMENT" or "NEW HOLDINGS"); null for original filings.
+FILING_COLUMNS = {
+    "accessionNumber": pl.Utf8,
+    "CIK": pl.Utf8,
+    "reportDate": pl.Utf8,
+    "filingDate": pl.Utf8,
+    "amendmentType": pl.Utf8,
+}
+
+_INDEX_SCHEMA = {"CUSIP": pl.Utf8, "partition": pl.Utf8, "offset": pl.UInt32, "length": pl.UInt32}
+
+
+def _write_atomic(df: pl.DataFrame, path: Path) -> None:
+    """Write ``df`` to ``path`` through a temporary file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.write_parquet(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class HoldingsStore:
+    """
+    CUSIP-partitioned Parquet store of 13F holdings with an inverted CUSIP index.
+
+    Attributes
+    ----------
+    root : Path
+        Store directory.
+    """
+
+    def __init__(self, root: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        root : str | os.PathLike
+            Store directory; created on first ingest.
+        """
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._index: dict[str, tuple[str, int, int]] | None = None
+
+    @classmethod
+    def default(cls) -> HoldingsStore | None:
+        """Return a store under ``$FINQUAL_CACHE_DIR/holdings``, or ``None`` if disk caching is disabled."""
+        root = cache_dir("holdings")
+        return cls(root) if root is not None else None
+
+    # ------------------------------------------------------------------ #
+    # Paths and index
+    # ------------------------------------------------------------------ #
+
+    def _partition_path(self, partition: str) -> Path:
+        return self.root / f"cusip={partition}.parquet"
+
+    @property
+    def _index_path(self) -> Path:
+        return self.root / "index.parquet"
+
+    @property
+    def _accessions_path(self) -> Path:
+        return self.root / "accessions.parquet"
+
+    def _load_index(self) -> dict[str, tuple[str, int, int]]:
+        """Return the in-memory CUSIP index, loading it from disk on first use."""
+        with self._lock:
+            if self._index is None:
+                index: dict[str, tuple[str, int, int]] = {}
+                if self._index_path.is_file():
+                    for cusip, partition, offset, length in pl.read_parquet(self._index_path).iter_rows():
+                        index[cusip] = (partition, offset, length)
+                self._index = index
+            return self._index
+
+    def filings(self) -> pl.DataFrame:
+        """Return one row per ingested filing (:data:`FILING_COLUMNS`)."""
+        if not self._accessions_path.is_file():
+            return pl.DataFrame(schema=FILING_COLUMNS)
+        df = pl.read_parquet(self._accessions_path)
+        # Stores written before filings were recorded hold accession numbers only.
+        return df.select([
+            pl.col(c).cast(t) if c in df.columns else pl.lit(None, dtype=t).alias(c)
+            for c, t in FILING_COLUMNS.items()
+        ])
+
+    def accessions(self) -> set[str]:
+        """Return the accession numbers already ingested."""
+        return set(self.filings()["accessionNumber"].to_list())
+
+    def cusips(self) -> list[str]:
+        """Return every CUSIP in the store."""
+        return sorted(self._load_index())
+
+    # ------------------------------------------------------------------ #
+    # Ingest
+    # ------------------------------------------------------------------ #
+
+    def ingest(self, holdings: pl.DataFrame) -> int:
+        """
+        Add parsed 13F holdings to the store.
+
+        Parameters
+        ----------
+        holdings : pl.DataFrame
+            Frame shaped like :meth:`FinqualForms.get_form_13_period` output
+            (one or many filings, from one or many managers). An optional
+            ``amendmentType`` column ("RESTATEMENT" / "NEW HOLDINGS") marks
+            13F-HR/A filings; without it an amendment is treated as a
+            restatement of the manager's earlier filing for that date.
+
+        Returns
+        -------
+        int
+            Number of holdings rows added. Filings already in the store are skipped.
+        """
+        if holdings.is_empty():
+            return 0
+
+        missing = set(HOLDING_COLUMNS) - set(holdings.columns)
+        if missing:
+            raise ValueError(f"Holdings are missing columns: {sorted(missing)}")
+
+        known = self.filings()
+        seen = set(known["accessionNumber"].to_list())
+        holdings = holdings.filter(~pl.col("accessionNumber").is_in(list(seen)))
+        if holdings.is_empty():
+            return 0
+
+        amendment = pl.col("amendmentType") if "amendmentType" in holdings.columns else pl.lit(None)
+        filings = (
+            holdings.select([pl.col(c).cast(t) for c, t in FILING_COLUMNS.items() if c != "amendmentType"]
+                            + [amendment.cast(pl.Utf8).str.to_uppercase().alias("amendmentType")])
+            .unique("accessionNumber", keep="first", maintain_order=True)
+        )
+        new = (
+            holdings.select([pl.col(c).cast(t) for c, t in HOLDING_COLUMNS.items()])
+            .filter(pl.col("CUSIP").is_not_null())
+            .with_columns(pl.col("CUSIP").str.to_uppercase())
+        )
+
+        new = new.with_columns(pl.col("CUSIP").str.slice(0, _PARTITION_PREFIX_LEN).alias("_partition"))
+
+        index = dict(self._load_index())
+        for (partition,), rows in new.group_by("_partition"):
+            path = self._partition_path(partition)
+            rows = rows.drop("_partition")
+            if path.is_file():
+                rows = pl.concat([pl.read_parquet(path), rows], how="vertical")
+
+            rows = rows.sort(["CUSIP", "reportDate", "TotalValue_USD"], descending=[False, True, True])
+            _write_atomic(rows, path)
+
+            # Re-derive this partition's row ranges; other partitions are untouched.
+            ranges = (
+                rows.with_row_index("_row")
+                .group_by("CUSIP")
+                .agg(pl.col("_row").min().alias("offset"), pl.len().alias("length"))
+            )
+            for cusip, offset, length in ranges.iter_rows():
+                index[cusip] = (partition, offset, length)
+
+        index_df = pl.DataFrame(
+            [(c, p, o, n) for c, (p, o, n) in index.items()], schema=_INDEX_SCHEMA, orient="row"
+        )
+        _write_atomic(index_df, self._index_path)
+
+        _write_atomic(pl.concat([known, filings], how="vertical").sort("accessionNumber"), self._accessions_path)
+
+        with self._lock:
+            self._index = index
+
+        return new.height
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def holders(self, cusip: str, report_date: str | None = None) -> pl.DataFrame:
+        """
+        Return every stored holding of ``cusip``.
+
+        Parameters
+        ----------
+        cusip : str
+            Nine-character CUSIP.
+        report_date : str | None, default=None
+            Restrict to one report (quarter-end) date, e.g. ``"2024-12-31"``.
+
+        Returns
+        -------
+        pl.DataFrame
+            Holdings sorted by report date (newest first), then value.
+        """
+        entry = self._load_index().get(cusip.upper())
+        if entry is None:
+            return pl.DataFrame(schema=HOLDING_COLUMNS)
+
+        partition, offset, length = entry
+        df = pl.scan_parquet(self._partition_path(partition)).slice(offset, length).collect()
+        if report_date is not None:
+            df = df.filter(pl.col("reportDate") == report_date)
+        return df
+
+    def holder_changes(self, cusip: str) -> pl.DataFrame:
+        """
+        Return each holder's quarter-over-quarter change in ``cusip``.
+
+        Every (holder, asset type) is compared across the report dates that
+        holder has filed. A position is ``Closed`` only when the holder filed
+        the later report without it, and ``New`` only when the holder filed the
+        earlier report without it; a report that has not been filed or
+        ingested yet produces no signal. See :func:`finqual.form_13.position_changes`.
+
+        For each holder and report date the latest original or restating
+        filing is used, plus any later "NEW HOLDINGS" amendments, which add to
+        it rather than replace it (see :func:`finqual.form_13.effective_filings`).
+
+        Returns
+        -------
+        pl.DataFrame
+            ``reportDate``, ``CIK``, ``AssetType``, ``TotalShares``,
+            ``PrevShares``, ``SharesChange``, ``TotalValue_USD``,
+            ``ValueChange``, ``New`` and ``Closed`` columns, newest report first.
+        """
+        df = self.holders(cusip)
+        if df.is_empty():
+            return pl.DataFrame()
+
+        holders = df.select("CIK").unique()
+        filings = pl.concat([
+            self.filings().join(holders, on="CIK", how="semi"),
+            # Filings behind the stored rows count as filed even if missing from an older filings table.
+            df.select("accessionNumber", "CIK", "reportDate", "filingDate",
+                      pl.lit(None, dtype=pl.Utf8).alias("amendmentType")),
+        ], how="vertical").unique("accessionNumber", keep="first", maintain_order=True)
+
+        effective = effective_filings(filings)
+        df = df.join(effective.select("accessionNumber"), on="accessionNumber", how="semi")
+        changes = position_changes(
+            df.drop("filingDate", "accessionNumber"),
+            keys=("CIK", "AssetType"),
+            filed=effective.select("CIK", "reportDate"),
+        )
+        return changes.select(
+            "reportDate", "CIK", "AssetType", "TotalShares", pl.col("PrevTotalShares").alias("PrevShares"),
+            "SharesChange", "TotalValue_USD", "ValueChange", "New", "Closed",
+        )
+
+
+__all__ = ["HoldingsStore", "HOLDING_COLUMNS", "FILING_COLUMNS"]
@@ -0,0 +1,258 @@
+"""
+Universe-wide insider buying signals from parsed Form 4 transactions.
+
+:class:`InsiderSignals` turns Form 4 rows (from
+:meth:`FinqualForms.get_insider_transactions_period` or an
+:class:`~finqual.insider_store.InsiderStore`) into per-issuer rolling signals,
+evaluated at every date with an open-market purchase or sale::
+
+    Issuer | Date | PurchaseValue | SaleValue | NetPurchaseValue
+           | Buyers | CSuiteBuyers | OfficerBuyers | DirectorBuyers | ClusterBuy
+
+Values and buyer counts cover the trailing ``window_days`` (inclusive of the
+date). ``ClusterBuy`` flags windows with at least ``cluster_size`` distinct
+insiders buying. All issuers are computed in one polars rolling pass.
+
+Signals update incrementally: :meth:`InsiderSignals.update` keeps only the
+compact open-market events (never the full Form 4 history) and recomputes
+just the dates whose window contains a new event.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import polars as pl
+
+from finqual.form_4 import TRANSACTION_CODES
+
+# Transaction codes that count as insider buying / selling.
+_PURCHASE = TRANSACTION_CODES["P"]
+_SALE = TRANSACTION_CODES["S"]
+
+# Compact open-market events retained between updates.
+_EVENT_SCHEMA = {
+    "Issuer": pl.Utf8,
+    "Date": pl.Date,
+    "accessionNumber": pl.Utf8,
+    "Name": pl.Utf8,
+    "CSuite": pl.Boolean,
+    "Officer": pl.Boolean,
+    "Director": pl.Boolean,
+    "Buy": pl.Boolean,
+    "Value": pl.Float64,
+}
+
+SIGNAL_SCHEMA = {
+    "Issuer": pl.Utf8,
+    "Date": pl.Date,
+    "PurchaseValue": pl.Float64,
+    "SaleValue": pl.Float64,
+    "NetPurchaseValue": pl.Float64,
+    "Buyers": pl.UInt32,
+    "CSuiteBuyers": pl.UInt32,
+    "OfficerBuyers": pl.UInt32,
+    "DirectorBuyers": pl.UInt32,
+    "ClusterBuy": pl.Boolean,
+}
+
+
+def _write_atomic(df: pl.DataFrame, path: Path) -> None:
+    """Write ``df`` to ``path`` through a temporary file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.write_parquet(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _events(transactions: pl.DataFrame, issuer: str) -> pl.DataFrame:
+    """Reduce Form 4 rows to open-market purchase / sale events."""
+    missing = {issuer, "Date", "Name", "TransactionCode", "Shares", "TransactionPrice"} - set(transactions.columns)
+    if missing:
+        raise ValueError(f"Transactions are missing columns: {sorted(missing)}")
+
+    code = pl.col("TransactionCode").cast(pl.Utf8)
+    return (
+        transactions.lazy()
+        .filter(code.is_in([_PURCHASE, _SALE]) & pl.col("Date").is_not_null())
+        .select(
+            pl.col(issuer).cast(pl.Utf8).alias("Issuer"),
+            pl.col("Date"),
+            (pl.col("accessionNumber") if "accessionNumber" in transactions.columns else pl.lit(None))
+            .cast(pl.Utf8).alias("accessionNumber"),
+            pl.col("Name"),
+            *(pl.col(c).fill_null(False) for c in ("CSuite", "Officer", "Director")),
+            (code == _PURCHASE).alias("Buy"),
+            (pl.col("Shares") * pl.col("TransactionPrice")).alias("Value"),
+        )
+        .cast(_EVENT_SCHEMA)
+        .collect()
+    )
+
+
+def _rolling_signals(events: pl.DataFrame, window_days: int, cluster_size: int) -> pl.DataFrame:
+    """Compute signals at every event date, for all issuers in one rolling pass."""
+    def buyers(flag: str | None = None) -> pl.Expr:
+        """Distinct buyers in the window, optionally restricted to one role flag."""
+        buying = pl.col("Buy") if flag is None else pl.col("Buy") & pl.col(flag)
+        return pl.col("Name").filter(buying).drop_nulls().n_unique().cast(pl.UInt32)
+
+    return (
+        events.sort(["Issuer", "Date"])
+        .rolling(index_column="Date", period=f"{window_days}d", group_by="Issuer")
+        .agg(
+            pl.col("Value").filter(pl.col("Buy")).sum().alias("PurchaseValue"),
+            pl.col("Value").filter(~pl.col("Buy")).sum().alias("SaleValue"),
+            buyers().alias("Buyers"),
+            buyers("CSuite").alias("CSuiteBuyers"),
+            buyers("Officer").alias("OfficerBuyers"),
+            buyers("Director").alias("DirectorBuyers"),
+        )
+        # Rows sharing a date share a window; keep one per (issuer, date).
+        .unique(["Issuer", "Date"], keep="last", maintain_order=True)
+        .with_columns(
+            (pl.col("PurchaseValue") - pl.col("SaleValue")).alias("NetPurchaseValue"),
+            (pl.col("Buyers") >= cluster_size).alias("ClusterBuy"),
+        )
+        .select(list(SIGNAL_SCHEMA))
+        .cast(SIGNAL_SCHEMA)
+    )
+
+
+class InsiderSignals:
+    """
+    Incrementally maintained rolling insider-buying signals for many issuers.
+
+    Attributes
+    ----------
+    events : pl.DataFrame
+        Open-market purchase / sale events seen so far, in date order.
+    signals : pl.DataFrame
+        Current signals, sorted by date and issuer.
+    """
+
+    def __init__(self, window_days: int = 90, cluster_size: int = 3, issuer: str = "IssuerCIK",
+                 root: str | os.PathLike | None = None):
+        """
+        Parameters
+        ----------
+        window_days : int, default=90
+            Trailing window, in calendar days, for values and buyer counts.
+        cluster_size : int, default=3
+            Distinct buyers within the window that make a cluster buy.
+        issuer : str, default="IssuerCIK"
+            Column identifying the issuer (``"Ticker"`` for
+            :meth:`FinqualForms.get_insider_transactions_period` output).
+        root : str | os.PathLike | None, default=None
+            Directory where events and signals are persisted after every
+            update and reloaded from on construction.
+        """
+        if window_days < 1 or cluster_size < 1:
+            raise ValueError("window_days and cluster_size must be positive.")
+
+        self.window_days = window_days
+        self.cluster_size = cluster_size
+        self.issuer = issuer
+        self.root = Path(root) if root is not None else None
+
+        self.events = pl.DataFrame(schema=_EVENT_SCHEMA)
+        self.signals = pl.DataFrame(schema=SIGNAL_SCHEMA)
+        if self.root is not None and (self.root / "events.parquet").is_file():
+            self.events = pl.read_parquet(self.root / "events.parquet")
+            self.signals = pl.read_parquet(self.root / "signals.parquet")
+        self._accessions: set[str] = set(self.events["accessionNumber"].drop_nulls().unique().to_list())
+
+    def update(self, transactions: pl.DataFrame) -> pl.DataFrame:
+        """
+        Add newly arrived Form 4 rows and refresh the affected signals.
+
+        Only dates whose trailing window contains a new event are recomputed,
+        from the retained events of the affected issuers. Filings already
+        seen (by accession number) are ignored, so overlapping batches are safe.
+
+        Parameters
+        ----------
+        transactions : pl.DataFrame
+            Typed Form 4 rows with the issuer column, ``Date``, ``Name``,
+            role flags, ``TransactionCode``, ``Shares``, ``TransactionPrice``
+            and ``accessionNumber``.
+
+        Returns
+        -------
+        pl.DataFrame
+            The recomputed signal rows (a subset of :attr:`signals`).
+        """
+        new = _events(transactions, self.issuer)
+        if "accessionNumber" in transactions.columns:
+            unseen = set(new["accessionNumber"].unique().to_list()) - self._accessions
+            new = new.filter(pl.col("accessionNumber").is_in(list(unseen)))
+            self._accessions |= unseen
+        if new.is_empty():
+            return pl.DataFrame(schema=SIGNAL_SCHEMA)
+
+        # Per issuer, dates in [first new date, last new date + window) see a new event,
+        # and their windows reach back another ``window`` before that. Events and
+        # signals are kept in date order, so only their tails past the earliest new
+        # date are touched; older history is sliced off unchanged.
+        window = timedelta(days=self.window_days)
+        earliest = new["Date"].min()
+
+        cut = self.events["Date"].search_sorted(earliest - window, side="right")
+        recent = pl.concat([self.events.slice(cut), new], how="vertical").sort("Date", maintain_order=True)
+        self.events = pl.concat([self.events.slice(0, cut), recent], how="vertical")
+
+        affected = new.group_by("Issuer").agg(pl.min("Date").alias("_lo"), pl.max("Date").alias("_hi"))
+        inputs = (
+            recent.join(affected, on="Issuer", how="inner")
+            .filter((pl.col("Date") > pl.col("_lo") - window) & (pl.col("Date") < pl.col("_hi") + window))
+        )
+        refreshed = (
+            _rolling_signals(inputs.drop("_lo", "_hi"), self.window_days, self.cluster_size)
+            .join(affected, on="Issuer", how="inner")
+            .filter((pl.col("Date") >= pl.col("_lo")) & (pl.col("Date") < pl.col("_hi") + window))
+            .drop("_lo", "_hi")
+            .sort(["Date", "Issuer"])
+        )
+
+        cut = self.signals["Date"].search_sorted(earliest, side="left")
+        tail = self.signals.slice(cut).join(refreshed, on=["Issuer", "Date"], how="anti")
+        self.signals = pl.concat(
+            [self.signals.slice(0, cut), pl.concat([tail, refreshed], how="vertical").sort(["Date", "Issuer"])],
+            how="vertical",
+        )
+        if self.root is not None:
+            self._save()
+        return refreshed
+
+    def _save(self) -> None:
+        """Persist events and signals under :attr:`root`."""
+        _write_atomic(self.events, self.root / "events.parquet")
+        _write_atomic(self.signals, self.root / "signals.parquet")
+
+    def latest(self) -> pl.DataFrame:
+        """Return each issuer's most recent signal row, strongest net buying first."""
+        return (
+            self.signals.group_by("Issuer").agg(pl.all().sort_by("Date").last())
+            .sort("NetPurchaseValue", descending=True, nulls_last=True)
+        )
+
+
+def insider_signals(transactions: pl.DataFrame, window_days: int = 90, cluster_size: int = 3,
+                    issuer: str = "IssuerCIK") -> pl.DataFrame:
+    """
+    Compute rolling insider signals for every issuer in ``transactions`` at once.
+
+    One-shot form of :class:`InsiderSignals`; see there for the columns.
+    """
+    return _rolling_signals(_events(transactions, issuer), window_days, cluster_size)
+
+
+__all__ = ["InsiderSignals", "insider_signals", "SIGNAL_SCHEMA"]
@@ -0,0 +1,377 @@
+"""
+Local market-wide store of Form 4 insider transactions, built from bulk archives.
+
+:meth:`FinqualForms.get_insider_transactions_period` fetches one company's
+filings over the network. :class:`InsiderStore` instead ingests a local
+directory or tarball of Form 4 documents — raw ``ownershipDocument`` XML, or
+EDGAR feed / full-text submissions (``.nc`` / ``.txt``) with the XML embedded —
+and parses them in a process pool into a date- and issuer-partitioned Parquet
+dataset::
+
+    <root>/year=<filing year>/issuer=<issuer CIK>/part-<id>.parquet
+    <root>/year=unknown/issuer=<issuer CIK>/...    filings without any date
+    <root>/accessions.parquet                     ingested filings
+
+The partition year is that of the date queries filter on — the filing date,
+or the period of report when the filing date is unknown — so a filing made
+long after its period of report is still found. Issuer queries read only that
+issuer's directories, and date ranges prune whole years, so a store can back :class:`~finqual.form_parsers.FinqualForms`
+(``FinqualForms(ticker, insider_store=store)``) or a whole-market screen
+without touching the network.
+
+Ingestion is incremental: filings already in the store are skipped. Each
+ingest writes one file per (year, issuer) it touches, so ingest whole archives
+rather than single documents. The store assumes a single writer.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import tarfile
+import tempfile
+import uuid
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import polars as pl
+
+from finqual.config.cache import cache_dir
+from finqual.form_4 import OUTPUT_SCHEMA, form_4_frame, parse_form_4_columns
+from finqual.sec_edgar.xml_utils import gettext
+
+# Filing-level columns stored alongside the Form 4 rows.
+_FILING_SCHEMA = {"IssuerCIK": pl.Utf8, "filingDate": pl.Date, "reportDate": pl.Date, "accessionNumber": pl.Utf8}
+
+# Columns of every stored row.
+STORE_SCHEMA = {**OUTPUT_SCHEMA, **_FILING_SCHEMA}
+
+# Partition for rows with neither a filing date nor a period of report; only unbounded scans read it.
+_UNKNOWN_YEAR = "unknown"
+
+# Date that queries filter on, and whose year partitions the store.
+_QUERY_DATE = pl.coalesce("filingDate", "reportDate")
+
+# Archive members / files treated as Form 4 documents.
+_DOCUMENT_SUFFIXES = (".xml", ".nc", ".txt")
+
+# Documents parsed per worker task.
+_BATCH_SIZE = 500
+
+# Accession numbers in file names and submission headers (dashes optional).
+_ACCESSION_RE = re.compile(r"(\d{10})-?(\d{2})-?(\d{6})")
+
+# Submission headers: feed (``<ACCESSION-NUMBER>``) and full-text (``ACCESSION NUMBER:``) forms.
+_HEADER_ACCESSION_RE = re.compile(rb"(?:<ACCESSION-NUMBER>|ACCESSION NUMBER:)\s*(\d{10}-?\d{2}-?\d{6})")
+_HEADER_FILED_RE = re.compile(rb"(?:<FILING-DATE>|FILED AS OF DATE:)\s*(\d{8})")
+
+# The ownership document embedded in a submission's ``<XML>`` block.
+_EMBEDDED_XML_RE = re.compile(rb"<XML>\s*(.*?<ownershipDocument>.*?</ownershipDocument>)\s*</XML>", re.DOTALL)
+
+
+# ------------------------------------------------------------------ #
+# Document parsing (runs in pool workers)
+# ------------------------------------------------------------------ #
+
+def _accession_from_name(name: str) -> str | None:
+    """Return the dashed accession number in a file or member name, if any."""
+    match = _ACCESSION_RE.search(name)
+    return "-".join(match.groups()) if match is not None else None
+
+
+def _parse_document(name: str, content: bytes) -> tuple[str, dict[str, list]] | None:
+    """
+    Parse one Form 4 document into ``(accession, columns)``.
+
+    Returns None for documents that are not Form 4 (or 4/A) ownership documents.
+    """
+    if b"<ownershipDocument" not in content:
+        return None
+
+    accession = filed = None
+    if b"<XML>" in content:
+        # Feed / full-text submission: read the header, then the embedded XML.
+        header = content[:content.find(b"<XML>")]
+        if (match := _HEADER_ACCESSION_RE.search(header)) is not None:
+            accession = _accession_from_name(match.group(1).decode())
+        if (match := _HEADER_FILED_RE.search(header)) is not None:
+            raw = match.group(1).decode()
+            filed = f"{raw[:4]}-{raw[4:6]}-{raw[6:]}"
+        match = _EMBEDDED_XML_RE.search(content)
+        if match is None:
+            return None
+        content = match.group(1)
+
+    root = ET.fromstring(content)
+    if root.tag != "ownershipDocument" or not (gettext(root, "documentType") or "").startswith("4"):
+        return None
+
+    columns = parse_form_4_columns(root)
+    n_rows = len(columns["TransactionType"])
+    issuer_cik = gettext(root, "issuer/issuerCik")
+    columns["IssuerCIK"] = [issuer_cik.strip().zfill(10) if issuer_cik else None] * n_rows
+    columns["filingDate"] = [filed] * n_rows
+    columns["reportDate"] = [gettext(root, "periodOfReport")] * n_rows
+
+    # Raw XML carries no accession number; fall back to the file name.
+    accession = accession or _accession_from_name(name) or Path(name).stem
+    columns["accessionNumber"] = [accession] * n_rows
+    return accession, columns
+
+
+def _parse_batch(documents: list[tuple[str, bytes | None]]) -> tuple[list[tuple[str, dict[str, list]]], dict[str, str]]:
+    """
+    Parse a batch of documents (runs in a worker).
+
+    Documents with ``None`` content are read from disk by path here, so
+    directory ingests do not ship file contents between processes.
+
+    Returns
+    -------
+    tuple[list[tuple[str, dict[str, list]]], dict[str, str]]
+        Parsed ``(accession, columns)`` pairs, and document name → error for
+        documents that could not be parsed.
+    """
+    parsed, failed = [], {}
+    for name, content in documents:
+        try:
+            if content is None:
+                content = Path(name).read_bytes()
+            result = _parse_document(name, content)
+        except Exception as e:
+            failed[name] = f"{type(e).__name__}: {e}"
+            continue
+        if result is not None:
+            parsed.append(result)
+    return parsed, failed
+
+
+def _iter_documents(source: Path) -> Iterator[tuple[str, bytes | None]]:
+    """Yield ``(name, content)`` for each candidate document in a directory, tarball or single file."""
+    if source.is_dir():
+        for path in sorted(source.rglob("*")):
+            if path.is_file() and path.suffix.lower() in _DOCUMENT_SUFFIXES:
+                yield str(path), None
+    elif tarfile.is_tarfile(source):
+        with tarfile.open(source, "r:*") as archive:
+            for member in archive:
+                if member.isfile() and Path(member.name).suffix.lower() in _DOCUMENT_SUFFIXES:
+                    yield member.name, archive.extractfile(member).read()
+    else:
+        yield str(source), None
+
+
+def _batches(documents: Iterable[tuple[str, bytes | None]], size: int) -> Iterator[list[tuple[str, bytes | None]]]:
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _write_atomic(df: pl.DataFrame, path: Path) -> None:
+    """Write ``df`` to ``path`` through a temporary file in the same directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.write_parquet(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class InsiderStore:
+    """
+    Year- and issuer-partitioned Parquet store of Form 4 transactions.
+
+    Attributes
+    ----------
+    root : Path
+        Store directory.
+    """
+
+    def __init__(self, root: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        root : str | os.PathLike
+            Store directory; created on first ingest.
+        """
+        self.root = Path(root)
+
+    @classmethod
+    def default(cls) -> InsiderStore | None:
+        """Return a store under ``$FINQUAL_CACHE_DIR/insider``, or ``None`` if disk caching is disabled."""
+        root = cache_dir("insider")
+        return cls(root) if root is not None else None
+
+    @property
+    def _accessions_path(self) -> Path:
+        return self.root / "accessions.parquet"
+
+    def accessions(self) -> set[str]:
+        """Return the accession numbers already ingested."""
+        if not self._accessions_path.is_file():
+            return set()
+        return set(pl.read_parquet(self._accessions_path)["accessionNumber"].to_list())
+
+    def issuers(self) -> list[str]:
+        """Return the CIK of every issuer in the store."""
+        return sorted({p.name.removeprefix("issuer=") for p in self.root.glob("year=*/issuer=*")})
+
+    # ------------------------------------------------------------------ #
+    # Ingest
+    # ------------------------------------------------------------------ #
+
+    def ingest(self, source: str | os.PathLike, max_workers: int | None = None, processes: bool = True,
+               batch_size: int = _BATCH_SIZE) -> int:
+        """
+        Parse a directory, tarball or single file of Form 4 documents into the store.
+
+        Parameters
+        ----------
+        source : str | os.PathLike
+            Directory (searched recursively), tar archive (optionally
+            compressed) or file. ``.xml``, ``.nc`` and ``.txt`` documents are
+            read; documents that are not Form 4 filings are skipped.
+        max_workers : int | None, default=None
+            Worker count; defaults to ``os.cpu_count()``.
+        processes : bool, default=True
+            Parse in a process pool. False uses threads, which avoids process
+            start-up cost for small archives.
+        batch_size : int, default=500
+            Documents parsed per worker task.
+
+        Returns
+        -------
+        int
+            Number of transaction rows added. Filings already in the store are skipped.
+        """
+        source = Path(source)
+        if not source.exists():
+            raise FileNotFoundError(source)
+
+        max_workers = max_workers or os.cpu_count() or 1
+        seen = self.accessions()
+        added: dict[str, dict[str, list]] = {}
+        failed: dict[str, str] = {}
+
+        executor: Executor = (ProcessPoolExecutor(max_workers=max_workers) if processes
+                              else ThreadPoolExecutor(max_workers=max_workers))
+        with executor:
+            # Keep a bounded number of batches in flight so tarball contents are not all held at once.
+            pending = set()
+            for batch in _batches(_iter_documents(source), batch_size):
+                pending.add(executor.submit(_parse_batch, batch))
+                if len(pending) >= 2 * max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    self._collect(done, seen, added, failed)
+            self._collect(pending, seen, added, failed)
+
+        for name, error in failed.items():
+            print(f"[InsiderStore] Skipping {name}: {error}")
+
+        if not added:
+            return 0
+
+        df = form_4_frame(added.values(), extra_schema=_FILING_SCHEMA)
+        # Partition by the date scans filter on, so year pruning never drops a late filing.
+        year = _QUERY_DATE.dt.year().cast(pl.Utf8).fill_null(_UNKNOWN_YEAR).alias("_year")
+        undated = df.filter(_QUERY_DATE.is_null())["accessionNumber"].unique().to_list()
+        if undated:
+            print(f"[InsiderStore] {len(undated)} filing(s) without a filing or report date stored under "
+                  f"year={_UNKNOWN_YEAR}; date-bounded queries skip them: {sorted(undated)[:5]}")
+        for (partition_year, issuer), rows in df.with_columns(year).group_by("_year", "IssuerCIK"):
+            path = self.root / f"year={partition_year}" / f"issuer={issuer}" / f"part-{uuid.uuid4().hex}.parquet"
+            _write_atomic(rows.drop("_year"), path)
+
+        accessions = pl.DataFrame({"accessionNumber": sorted(seen | set(added))})
+        _write_atomic(accessions, self._accessions_path)
+
+        return df.height
+
+    @staticmethod
+    def _collect(futures, seen: set[str], added: dict[str, dict[str, list]], failed: dict[str, str]) -> None:
+        """Merge finished batch results, keeping the first copy of each new accession."""
+        for future in futures:
+            parsed, batch_failed = future.result()
+            failed.update(batch_failed)
+            for accession, columns in parsed:
+                if accession not in seen and accession not in added:
+                    added[accession] = columns
+
+    # ------------------------------------------------------------------ #
+    # Queries
+    # ------------------------------------------------------------------ #
+
+    def scan(self, cik: str | int | None = None, start: date | str | None = None,
+             end: date | str | None = None) -> pl.LazyFrame:
+        """
+        Lazily scan stored transactions, reading only the matching partitions.
+
+        Parameters
+        ----------
+        cik : str | int | None, default=None
+            Issuer CIK. None scans every issuer.
+        start, end : date | str | None, default=None
+            Inclusive bounds on the filing date (the period of report when the
+            filing date is unknown), as dates or ISO strings. Filings with
+            neither date are only returned when both bounds are None.
+
+        Returns
+        -------
+        pl.LazyFrame
+            Rows with :data:`STORE_SCHEMA`.
+        """
+        start = date.fromisoformat(start) if isinstance(start, str) else start
+        end = date.fromisoformat(end) if isinstance(end, str) else end
+
+        issuer = f"issuer={str(cik).strip().zfill(10)}" if cik is not None else "issuer=*"
+        files = []
+        for year_dir in self.root.glob("year=*"):
+            label = year_dir.name.removeprefix("year=")
+            if not label.isdigit():
+                # Undated rows cannot satisfy a date bound.
+                if start is None and end is None:
+                    files.extend(year_dir.glob(f"{issuer}/*.parquet"))
+                continue
+            year = int(label)
+            if (start is not None and year < start.year) or (end is not None and year > end.year):
+                continue
+            files.extend(year_dir.glob(f"{issuer}/*.parquet"))
+
+        if not files:
+            return pl.LazyFrame(schema=STORE_SCHEMA)
+
+        lf = pl.scan_parquet(sorted(files))
+        if start is not None:
+            lf = lf.filter(_QUERY_DATE >= start)
+        if end is not None:
+            lf = lf.filter(_QUERY_DATE <= end)
+        return lf
+
+    def transactions(self, cik: str | int | None = None, start: date | str | None = None,
+                     end: date | str | None = None) -> pl.DataFrame:
+        """
+        Return stored transactions, newest filing first.
+
+        Parameters are as for :meth:`scan`. Rows within a filing keep their
+        document order.
+        """
+        return (
+            self.scan(cik, start, end)
+            .sort(["filingDate", "reportDate", "accessionNumber"], descending=True, nulls_last=True,
+                  maintain_order=True)
+            .collect()
+        )
+
+
+__all__ = ["InsiderStore", "STORE_SCHEMA"]
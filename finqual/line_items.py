@@ -0,0 +1,64 @@
+"""
+Standardised line items produced by :class:`~finqual.core.Finqual`.
+
+Each statement is built from a fixed, ordered list of target line items. The
+lists live here (rather than inside the statement methods) so other modules —
+notably the ratio expression compiler in :mod:`finqual.ratio_engine` — can
+tell which statement a line item comes from.
+"""
+
+from __future__ import annotations
+
+INCOME_STATEMENT_ITEMS = (
+    'Total Revenue', 'Cost Of Revenue', 'Gross Profit',
+    'Selling General And Administration', 'Research And Development',
+    'Other Operating Income Expense', 'Operating Income',
+    "Interest Expense", 'Other Non Operating Income Expense', 'Pretax Income',  # 'Total Expenses'
+    'Tax Provision', 'Net Income',
+)
+
+BALANCE_SHEET_ITEMS = (
+    "Total Assets",
+    "Current Assets", "Other Short Term Investments", "Receivables", "Inventory", "Other Current Assets",
+    "Total Non Current Assets", "Net PPE", "Goodwill", "Investments And Advances", "Other Non-Current Assets",
+
+    "Total Liabilities Net Minority Interest",
+    "Current Liabilities", "Accounts Payable", "Current Debt", "Current Capital Lease Obligation", "Other Current Liabilities",
+    "Total Non Current Liabilities Net Minority Interest", "Long Term Debt", "Long Term Capital Lease Obligation", "Other Non-Current Liabilities",
+
+    "Stockholders Equity", "Capital Stock", "Retained Earnings",
+)
+
+# Appended to the balance sheet after triangulation (from DEI / share-count facts).
+SHARES_OUTSTANDING = "Shares Outstanding"
+
+CASH_FLOW_ITEMS = (
+    "Operating Cash Flow",
+    "Depreciation And Amortization",
+
+    "Investing Cash Flow",
+
+    "Financing Cash Flow",
+    "End Cash Position",
+)
+
+# Market input supplied alongside the statements for valuation ratios.
+SHARE_PRICE = "Share Price"
+
+# Line item → source ('income', 'balance', 'cashflow' or 'price').
+ITEM_SOURCES: dict[str, str] = {
+    **{item: "income" for item in INCOME_STATEMENT_ITEMS},
+    **{item: "balance" for item in BALANCE_SHEET_ITEMS},
+    SHARES_OUTSTANDING: "balance",
+    **{item: "cashflow" for item in CASH_FLOW_ITEMS},
+    SHARE_PRICE: "price",
+}
+
+__all__ = [
+    "INCOME_STATEMENT_ITEMS",
+    "BALANCE_SHEET_ITEMS",
+    "SHARES_OUTSTANDING",
+    "CASH_FLOW_ITEMS",
+    "SHARE_PRICE",
+    "ITEM_SOURCES",
+]
@@ -0,0 +1,172 @@
+"""
+Prebuilt index for comparable-company (peer) lookups.
+
+:class:`PeerIndex` groups tickers by sector once, so a peer query is a dict
+lookup plus array slicing instead of a scan over ``sector_mapping.parquet``.
+
+Two kinds of query are supported:
+
+- :meth:`PeerIndex.window` — neighbours by position in the sector list, which
+  is ordered by market capitalisation (the original ``CCA.get_c`` behaviour).
+- :meth:`PeerIndex.nearest` — k nearest peers over numeric features (e.g.
+  market cap and revenue) attached with :meth:`PeerIndex.with_features`.
+  Features are standardised and distances computed in one vectorised NumPy
+  pass over the sector, which for sector sizes (at most a few hundred
+  tickers) is faster than building a tree.
+"""
+
+from __future__ import annotations
+
+import functools
+from importlib.resources import files
+
+import numpy as np
+import polars as pl
+
+# Peers taken before the target in a positional window.
+_HALF_WINDOW = 2
+
+
+class PeerIndex:
+    """
+    Sector-grouped ticker index with optional numeric features.
+
+    Attributes
+    ----------
+    feature_names : tuple[str, ...]
+        Names of the attached features; empty when none are attached.
+    """
+
+    def __init__(self, mapping: pl.DataFrame, features: pl.DataFrame | None = None):
+        """
+        Parameters
+        ----------
+        mapping : pl.DataFrame
+            ``ticker`` / ``sector`` rows. Order within a sector is the
+            positional (market-cap) order.
+        features : pl.DataFrame | None, default=None
+            ``ticker`` plus numeric feature columns. Tickers without features
+            sit at the feature means.
+        """
+        mapping = mapping.select(["ticker", "sector"]).unique("ticker", keep="first", maintain_order=True)
+
+        self._sectors: dict[str, np.ndarray] = {}
+        self._location: dict[str, tuple[str, int]] = {}
+        for (sector,), group in mapping.group_by("sector", maintain_order=True):
+            tickers = group["ticker"].to_numpy()
+            self._sectors[sector] = tickers
+            for i, ticker in enumerate(tickers):
+                self._location[ticker] = (sector, i)
+
+        self.feature_names: tuple[str, ...] = ()
+        self._features: dict[str, np.ndarray] = {}
+        if features is not None:
+            self._attach(mapping, features)
+
+    def _attach(self, mapping: pl.DataFrame, features: pl.DataFrame) -> None:
+        """Standardise ``features`` and store one matrix per sector, aligned with the ticker arrays."""
+        names = [c for c in features.columns if c != "ticker"]
+        if not names:
+            raise ValueError("features must contain at least one numeric column besides 'ticker'.")
+
+        # z-score each feature over the whole universe; missing values become the mean (0).
+        standardised = features.select(
+            ["ticker"] + [
+                ((pl.col(c).cast(pl.Float64) - pl.col(c).cast(pl.Float64).mean())
+                 / pl.col(c).cast(pl.Float64).std()).fill_nan(0.0).fill_null(0.0).alias(c)
+                for c in names
+            ]
+        )
+        aligned = mapping.join(standardised, on="ticker", how="left", maintain_order="left").fill_null(0.0)
+
+        for (sector,), group in aligned.group_by("sector", maintain_order=True):
+            self._features[sector] = group.select(names).to_numpy()
+
+        self.feature_names = tuple(names)
+
+    @classmethod
+    @functools.cache
+    def default(cls) -> PeerIndex:
+        """Return the process-wide index over the packaged ``sector_mapping.parquet``, built once."""
+        return cls(pl.read_parquet(files("finqual.data") / "sector_mapping.parquet"))
+
+    def with_features(self, features: pl.DataFrame) -> PeerIndex:
+        """
+        Return a new index over the same universe with ``features`` attached.
+
+        Parameters
+        ----------
+        features : pl.DataFrame
+            ``ticker`` plus numeric feature columns (e.g. market cap, revenue).
+        """
+        mapping = pl.DataFrame(
+            {"ticker": list(self._location), "sector": [s for s, _ in self._location.values()]}
+        )
+        return PeerIndex(mapping, features)
+
+    def sector(self, ticker: str) -> str | None:
+        """Return the sector of ``ticker``, or None if it is not indexed."""
+        location = self._location.get(ticker)
+        return location[0] if location is not None else None
+
+    def window(self, ticker: str, n: int = 6) -> tuple[str, ...] | None:
+        """
+        Return ``n`` tickers around ``ticker`` in its sector's market-cap order.
+
+        The window starts two places before the target and is shifted to stay
+        within the sector.
+
+        Returns
+        -------
+        tuple[str, ...] | None
+            Tickers including the target, or None if ``ticker`` is not indexed.
+        """
+        location = self._location.get(ticker)
+        if location is None:
+            return None
+
+        sector, i = location
+        tickers = self._sectors[sector]
+
+        start = max(0, i - _HALF_WINDOW)
+        end = min(start + n, len(tickers))
+        start = max(0, end - n)
+        return tuple(tickers[start:end].tolist())
+
+    def nearest(self, ticker: str, k: int = 6) -> tuple[str, ...] | None:
+        """
+        Return ``ticker`` and its nearest same-sector peers by feature distance.
+
+        Falls back to :meth:`window` when no features are attached.
+
+        Parameters
+        ----------
+        ticker : str
+            Target ticker.
+        k : int, default=6
+            Number of tickers returned, including the target.
+
+        Returns
+        -------
+        tuple[str, ...] | None
+            Tickers ordered by distance (target first), or None if ``ticker`` is not indexed.
+        """
+        if not self._features:
+            return self.window(ticker, k)
+
+        location = self._location.get(ticker)
+        if location is None:
+            return None
+
+        sector, i = location
+        matrix = self._features[sector]
+        distances = ((matrix - matrix[i]) ** 2).sum(axis=1)
+        distances[i] = -1.0  # the target always ranks first
+
+        k = min(k, len(distances))
+        candidates = np.argpartition(distances, k - 1)[:k]
+        order = candidates[np.argsort(distances[candidates], kind="stable")]
+        return tuple(self._sectors[sector][order].tolist())
+
+
+__all__ = ["PeerIndex"]
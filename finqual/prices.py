@@ -0,0 +1,211 @@
+"""
+Share-price providers for valuation ratios.
+
+Valuation ratios need the share price at each period's report date. A
+:class:`PriceProvider` answers vectorised *as-of* lookups — the last close on
+or before each requested date — for one ticker at a time.
+
+:class:`LocalPriceStore` serves those lookups from a local price history
+(``ticker``, ``date``, ``close``) stored as Arrow IPC or Parquet, so historical
+valuation works fully offline, e.g. for backtests. An uncompressed IPC file
+with a single record batch, already sorted by ticker then date, is
+memory-mapped and indexed in place without copying the history onto the heap;
+any other input is loaded, sorted and held in memory.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from abc import ABC, abstractmethod
+from datetime import date
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import polars as pl
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+# File suffixes read as Arrow IPC (memory-mapped when possible) rather than Parquet.
+_IPC_SUFFIXES = (".arrow", ".ipc", ".feather")
+
+
+class PriceProvider(ABC):
+    """
+    Interface for share-price sources.
+
+    Subclasses implement :meth:`price_asof`; a subclass that does not cannot be instantiated.
+    """
+
+    @abstractmethod
+    def price_asof(self, ticker: str, dates: Sequence[date | None]) -> list[float]:
+        """
+        Return the last close on or before each date.
+
+        Parameters
+        ----------
+        ticker : str
+            Ticker symbol.
+        dates : Sequence[date | None]
+            Lookup dates. ``None`` entries yield ``NaN``.
+
+        Returns
+        -------
+        list[float]
+            One price per date; ``NaN`` where no price is available.
+        """
+
+
+class LocalPriceStore(PriceProvider):
+    """
+    As-of price lookups over a local ``(ticker, date, close)`` price history.
+
+    The history is ordered by ticker then date and each ticker's contiguous
+    row range is indexed, so a lookup is a slice plus a binary search
+    (``np.searchsorted``) over that ticker's dates. A frame passed to the
+    constructor is normalised and sorted (a copy); :meth:`from_file` maps a
+    qualifying IPC file in place instead.
+
+    Attributes
+    ----------
+    tickers : set[str]
+        Tickers present in the store.
+    """
+
+    def __init__(self, prices: pl.DataFrame):
+        """
+        Parameters
+        ----------
+        prices : pl.DataFrame
+            Price history with ``ticker`` (str), ``date`` (date) and ``close`` (float) columns.
+        """
+        missing = {"ticker", "date", "close"} - set(prices.columns)
+        if missing:
+            raise ValueError(f"Price history is missing columns: {sorted(missing)}")
+
+        df = (
+            prices.select([
+                pl.col("ticker").cast(pl.Utf8).str.to_uppercase(),
+                pl.col("date").cast(pl.Date),
+                pl.col("close").cast(pl.Float64).fill_null(math.nan),
+            ])
+            .drop_nulls(["ticker", "date"])
+            .sort(["ticker", "date"])
+            .rechunk()
+        )
+
+        # Dates as int32 days since epoch — the physical representation of pl.Date.
+        self._set_columns(df["ticker"], df["date"].to_physical().to_numpy(), df["close"].to_numpy(), owner=df)
+
+    def _set_columns(self, tickers: pl.Series, dates: np.ndarray, closes: np.ndarray, owner: object) -> None:
+        """Index ``tickers`` (sorted, with ``dates`` sorted within each ticker) and keep the column arrays."""
+        # Holds the buffers the arrays view (a frame or a memory-mapped file) alive.
+        self._owner = owner
+        self._dates = dates
+        self._closes = closes
+
+        bounds = (
+            tickers.alias("ticker").to_frame().with_row_index("row")
+            .group_by("ticker")
+            .agg(pl.col("row").min().alias("start"), (pl.col("row").max() + 1).alias("end"))
+        )
+        self._index: dict[str, tuple[int, int]] = {
+            t.upper(): (s, e) for t, s, e in bounds.iter_rows()
+        }
+        self.tickers = set(self._index)
+
+    @classmethod
+    def _map_ipc(cls, path: Path) -> LocalPriceStore | None:
+        """
+        Index an IPC file in place over a memory map, or return ``None`` if it does not qualify.
+
+        Qualifying files are uncompressed, hold one record batch, have
+        ``date32`` dates and ``float64`` closes without nulls, upper-case
+        tickers, and are sorted by ticker then date.
+        """
+        mapped = pa.memory_map(str(path), "r").read_buffer()
+        reader = ipc.open_file(mapped)
+        if reader.num_record_batches != 1:
+            return None
+
+        batch = reader.get_batch(0)
+        dates, closes = batch.column("date"), batch.column("close")
+        if (dates.type != pa.date32() or closes.type != pa.float64()
+                or dates.null_count or closes.null_count or batch.column("ticker").null_count):
+            return None
+
+        # Compressed buffers are decompressed onto the heap; only views into the map are zero-copy.
+        start, end = mapped.address, mapped.address + mapped.size
+        if not all(start <= buf.address < end for buf in (dates.buffers()[1], closes.buffers()[1])):
+            return None
+
+        keys = pl.from_arrow(batch.select(["ticker", "date"]))
+        ticker, nxt = pl.col("ticker"), pl.col("ticker").shift(-1)
+        out_of_order = keys.select(
+            ((ticker > nxt) | ((ticker == nxt) & (pl.col("date") > pl.col("date").shift(-1)))).any()
+            | (ticker != ticker.str.to_uppercase()).any()
+        ).item()
+        if out_of_order:
+            return None
+
+        store = cls.__new__(cls)
+        store._set_columns(
+            keys["ticker"],
+            dates.view(pa.int32()).to_numpy(zero_copy_only=True),
+            closes.to_numpy(zero_copy_only=True),
+            owner=mapped,
+        )
+        return store
+
+    @classmethod
+    def from_file(cls, path: str | os.PathLike) -> LocalPriceStore:
+        """
+        Load a price history from an Arrow IPC or Parquet file.
+
+        An uncompressed IPC file with one record batch, sorted by ticker then
+        date (upper-case tickers, ``date32`` dates, non-null ``float64``
+        closes) is memory-mapped and served without copying — write it with
+        ``df.sort("ticker", "date").rechunk().write_ipc(path)``. Any other file
+        is read into memory, normalised and sorted.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            ``.arrow`` / ``.ipc`` / ``.feather`` or ``.parquet`` file.
+        """
+        path = Path(path)
+        columns = ["ticker", "date", "close"]
+        if path.suffix.lower() in _IPC_SUFFIXES:
+            store = cls._map_ipc(path)
+            if store is not None:
+                return store
+            df = pl.read_ipc(path, columns=columns)
+        else:
+            df = pl.read_parquet(path, columns=columns)
+        return cls(df)
+
+    def price_asof(self, ticker: str, dates: Sequence[date | None]) -> list[float]:
+        bounds = self._index.get(ticker.upper())
+        if bounds is None:
+            return [math.nan] * len(dates)
+
+        start, end = bounds
+        ticker_dates = self._dates[start:end]
+        ticker_closes = self._closes[start:end]
+
+        valid = np.array([d is not None for d in dates], dtype=bool)
+        targets = np.array(
+            [(d - date(1970, 1, 1)).days if d is not None else 0 for d in dates], dtype=ticker_dates.dtype
+        )
+
+        # Index of the last trading date <= target.
+        pos = np.searchsorted(ticker_dates, targets, side="right") - 1
+        found = valid & (pos >= 0)
+
+        out = np.full(len(dates), np.nan)
+        out[found] = ticker_closes[pos[found]]
+        return out.tolist()
+
+
+__all__ = ["PriceProvider", "LocalPriceStore"]
@@ -0,0 +1,410 @@
+"""
+Vectorised ratio evaluation over wide, multi-period statement frames.
+
+Statements come out of :class:`~finqual.core.Finqual` as *wide* frames (line
+items down the first column, one column per period). :func:`statement_frame`
+turns any number of them into one *period-major* frame (one row per period,
+one column per line item), and :func:`evaluate_ratios` evaluates every ratio
+as a Polars expression over all periods at once.
+
+Ratios are written in a small expression language over the standardised
+line items of :mod:`finqual.line_items`, e.g. ``"Gross Profit / Total Revenue"``.
+:func:`compile_ratio` parses a formula once into a :class:`CompiledRatio`,
+which builds the Polars expression and records which line items — and hence
+which statements — it needs, so callers only fetch those statements.
+
+The built-in definitions below are the single source of every ratio; the
+scalar functions in :mod:`finqual.ratios` evaluate them on a one-period frame.
+A zero denominator or a missing / null line item yields ``NaN`` for that
+period instead of raising. Optional items are compiled with a default
+(e.g. ``Tax Provision`` → ``0`` in ROIC), so their absence does not turn the
+ratio into ``NaN``.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Mapping
+
+import polars as pl
+
+from finqual.line_items import ITEM_SOURCES
+
+# A column accessor: line item → expression (null literal for absent items).
+Col = Callable[[str], pl.Expr]
+
+# A ratio definition builds its expression from a column accessor.
+RatioDefinition = Callable[[Col], pl.Expr]
+
+NAN = float("nan")
+
+
+def safe_div(numerator: pl.Expr, denominator: pl.Expr) -> pl.Expr:
+    """Divide, yielding ``NaN`` where the denominator is zero (Python would raise)."""
+    return pl.when(denominator == 0).then(pl.lit(NAN)).otherwise(numerator / denominator)
+
+
+# ------------------------------------------------------------------ #
+# Ratio expression language
+# ------------------------------------------------------------------ #
+
+# Tokens: numbers, [bracketed item], bare item names (words joined by spaces or
+# intra-word hyphens, so "Other Non-Current Assets" is one item while
+# "Total Revenue - Cost Of Revenue" is a subtraction), operators and parentheses.
+_TOKEN_RE = re.compile(
+    r"""\s*(?:
+        (?P<number>\d+(?:\.\d*)?|\.\d+)
+      | \[(?P<quoted>[^\]]+)\]
+      | (?P<item>[A-Za-z&][A-Za-z0-9&]*(?:(?:\ +|-)[A-Za-z&][A-Za-z0-9&]*)*)
+      | (?P<op>[-+*/()])
+    )""",
+    re.VERBOSE,
+)
+
+
+def _tokenize(formula: str) -> list[tuple[str, str]]:
+    """Split ``formula`` into ``(kind, text)`` tokens."""
+    tokens = []
+    pos = 0
+    formula = formula.rstrip()
+    while pos < len(formula):
+        match = _TOKEN_RE.match(formula, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Unexpected character {formula[pos:].strip()[:1]!r} in ratio formula {formula!r}")
+        kind = match.lastgroup
+        text = match.group(kind)
+        tokens.append(("item" if kind == "quoted" else kind, text.strip()))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive-descent parser producing a ratio definition.
+
+    Grammar::
+
+        expr   := term (("+" | "-") term)*
+        term   := factor (("*" | "/") factor)*
+        factor := "-" factor | number | item | "(" expr ")"
+    """
+
+    def __init__(self, formula: str, known_items: Mapping[str, str]):
+        self.formula = formula
+        self.known_items = known_items
+        self.tokens = _tokenize(formula)
+        self.pos = 0
+        self.items: set[str] = set()
+
+    def parse(self) -> RatioDefinition:
+        if not self.tokens:
+            raise ValueError("Empty ratio formula.")
+        node = self._expr()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected {self.tokens[self.pos][1]!r} in ratio formula {self.formula!r}")
+        return node
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _take(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of ratio formula {self.formula!r}")
+        self.pos += 1
+        return token
+
+    def _expr(self) -> RatioDefinition:
+        node = self._term()
+        while self._peek() in (("op", "+"), ("op", "-")):
+            op = self._take()[1]
+            node = _binary(op, node, self._term())
+        return node
+
+    def _term(self) -> RatioDefinition:
+        node = self._factor()
+        while self._peek() in (("op", "*"), ("op", "/")):
+            op = self._take()[1]
+            node = _binary(op, node, self._factor())
+        return node
+
+    def _factor(self) -> RatioDefinition:
+        kind, text = self._take()
+
+        if (kind, text) == ("op", "-"):
+            inner = self._factor()
+            return lambda c: -inner(c)
+
+        if (kind, text) == ("op", "("):
+            node = self._expr()
+            if self._take() != ("op", ")"):
+                raise ValueError(f"Unbalanced parentheses in ratio formula {self.formula!r}")
+            return node
+
+        if kind == "number":
+            value = float(text)
+            return lambda c: pl.lit(value, dtype=pl.Float64)
+
+        if kind == "item":
+            name = " ".join(text.split())
+            if name not in self.known_items:
+                raise ValueError(f"Unknown line item {name!r} in ratio formula {self.formula!r}")
+            self.items.add(name)
+            return lambda c: c(name)
+
+        raise ValueError(f"Unexpected {text!r} in ratio formula {self.formula!r}")
+
+
+def _binary(op: str, left: RatioDefinition, right: RatioDefinition) -> RatioDefinition:
+    if op == "+":
+        return lambda c: left(c) + right(c)
+    if op == "-":
+        return lambda c: left(c) - right(c)
+    if op == "*":
+        return lambda c: left(c) * right(c)
+    return lambda c: safe_div(left(c), right(c))
+
+
+@dataclass(frozen=True)
+class CompiledRatio:
+    """
+    A parsed ratio formula.
+
+    Calling the instance with a column accessor returns the Polars expression,
+    so it can be used wherever a :data:`RatioDefinition` is expected.
+
+    Attributes
+    ----------
+    formula : str
+        Source formula.
+    items : frozenset[str]
+        Line items referenced by the formula.
+    sources : frozenset[str]
+        Statements (and market inputs) those items come from:
+        ``'income'``, ``'balance'``, ``'cashflow'`` and/or ``'price'``.
+    defaults : Mapping[str, float]
+        Optional items → value used where the item is missing or null.
+    """
+
+    formula: str
+    items: frozenset[str]
+    sources: frozenset[str]
+    build: RatioDefinition
+    defaults: Mapping[str, float] = field(default_factory=dict)
+
+    def __call__(self, c: Col) -> pl.Expr:
+        if not self.defaults:
+            return self.build(c)
+        defaults = self.defaults
+        return self.build(lambda name: c(name).fill_null(defaults[name]) if name in defaults else c(name))
+
+
+def compile_ratio(formula: str, known_items: Mapping[str, str] = ITEM_SOURCES,
+                  defaults: Mapping[str, float] | None = None) -> CompiledRatio:
+    """
+    Compile a ratio formula such as ``"Gross Profit / Total Revenue"``.
+
+    Formulas support ``+ - * /``, unary minus, parentheses and numeric
+    literals. Line items are referenced by their standardised names, bare or
+    in square brackets (``[Net PPE]``). A ``-`` between letters belongs to
+    the name (``Other Non-Current Assets``), so write subtraction with spaces
+    around the operator. Every division is zero-safe.
+
+    Parameters
+    ----------
+    formula : str
+        Ratio formula.
+    known_items : Mapping[str, str], optional
+        Line item → source mapping used for validation and dependency
+        derivation. Defaults to :data:`finqual.line_items.ITEM_SOURCES`.
+    defaults : Mapping[str, float] | None, optional
+        Values for optional line items, substituted where the item is missing
+        or null (e.g. ``{"Tax Provision": 0.0}``). Other missing items yield ``NaN``.
+
+    Returns
+    -------
+    CompiledRatio
+
+    Raises
+    ------
+    ValueError
+        If the formula is malformed, references an unknown line item, or
+        has a default for an item it does not reference.
+    """
+    parser = _Parser(formula, known_items)
+    build = parser.parse()
+    defaults = dict(defaults or {})
+    unused = set(defaults) - parser.items
+    if unused:
+        raise ValueError(f"Defaults for items not in ratio formula {formula!r}: {sorted(unused)}")
+    return CompiledRatio(
+        formula=formula,
+        items=frozenset(parser.items),
+        sources=frozenset(known_items[i] for i in parser.items),
+        build=build,
+        defaults=defaults,
+    )
+
+
+def compile_ratios(formulas: Mapping[str, str | CompiledRatio]) -> dict[str, CompiledRatio]:
+    """Compile a ``{name: formula}`` mapping, passing already compiled ratios through."""
+    return {
+        name: f if isinstance(f, CompiledRatio) else compile_ratio(f)
+        for name, f in formulas.items()
+    }
+
+
+def required_sources(definitions: Iterable[CompiledRatio]) -> set[str]:
+    """Union of the statements / market inputs needed by ``definitions``."""
+    return set().union(*(d.sources for d in definitions))
+
+
+# ------------------------------------------------------------------ #
+# Built-in ratio definitions (finqual.ratios wraps these for single periods)
+# ------------------------------------------------------------------ #
+
+_INVESTED_CAPITAL = "(Total Assets - Other Short Term Investments - Accounts Payable - Other Current Liabilities)"
+
+PROFITABILITY_RATIOS: dict[str, CompiledRatio] = compile_ratios({
+    "SG&A Ratio":       "Selling General And Administration / Total Revenue",
+    "R&D Ratio":        "Research And Development / Total Revenue",
+    "Operating Margin": "Operating Income / Total Revenue",
+    "Gross Margin":     "Gross Profit / Total Revenue",
+    "ROA":              "Net Income / Total Assets",
+    "ROE":              "Net Income / Stockholders Equity",
+    # A missing tax provision is treated as zero tax.
+    "ROIC":             compile_ratio(f"Operating Income * (1 - Tax Provision / Pretax Income) / {_INVESTED_CAPITAL}",
+                                      defaults={"Tax Provision": 0.0}),
+})
+
+LIQUIDITY_RATIOS: dict[str, CompiledRatio] = compile_ratios({
+    "Current Ratio":        "Current Assets / Current Liabilities",
+    "Quick Ratio":          "(Current Assets - Inventory) / Current Liabilities",
+    "Debt-to-Equity Ratio": "Total Liabilities Net Minority Interest / Stockholders Equity",
+})
+
+VALUATION_RATIOS: dict[str, CompiledRatio] = compile_ratios({
+    "EPS":       "Net Income / Shares Outstanding",
+    "P/E":       "Share Price / (Net Income / Shares Outstanding)",
+    "P/B":       "Share Price * Shares Outstanding / (Total Assets - Total Liabilities Net Minority Interest)",
+    "EV/EBITDA": "(Shares Outstanding * Share Price + End Cash Position)"
+                 " / (Operating Income + Depreciation And Amortization)",
+})
+
+
+# ------------------------------------------------------------------ #
+# Frame plumbing
+# ------------------------------------------------------------------ #
+
+def statement_frame(statements: Mapping[str, pl.DataFrame]) -> pl.DataFrame:
+    """
+    Combine wide statements into one period-major frame.
+
+    Parameters
+    ----------
+    statements : Mapping[str, pl.DataFrame]
+        Wide statements keyed by name (e.g. ``{"income": ..., "balance": ...}``),
+        each with line items in the first column and one column per period.
+
+    Returns
+    -------
+    pl.DataFrame
+        ``Period`` column plus one ``Float64`` column per line item. Periods
+        missing from a statement have nulls for that statement's items.
+    """
+    frames = []
+    for df in statements.values():
+        if df is None or df.width < 2:
+            continue
+
+        id_col = df.columns[0]
+        df_t = (
+            df.drop(id_col)
+            .cast(pl.Float64)
+            .transpose(include_header=True, header_name="Period", column_names=df[id_col].cast(pl.Utf8).to_list())
+        )
+        frames.append(df_t)
+
+    if not frames:
+        return pl.DataFrame(schema={"Period": pl.Utf8})
+
+    df_total = frames[0]
+    for df_t in frames[1:]:
+        df_total = df_total.join(df_t, on="Period", how="full", coalesce=True)
+
+    return df_total
+
+
+def evaluate_ratios(frame: pl.DataFrame, definitions: Mapping[str, RatioDefinition | str],
+                    multiplier: float = 1.0) -> pl.DataFrame:
+    """
+    Evaluate ratio definitions over every period of a period-major frame.
+
+    Parameters
+    ----------
+    frame : pl.DataFrame
+        Output of :func:`statement_frame`, optionally with extra columns
+        such as ``Ticker`` or ``Share Price``.
+    definitions : Mapping[str, RatioDefinition | str]
+        Ratio name → expression builder or formula string (compiled on the fly).
+    multiplier : float, default 1.0
+        Scale applied to every ratio (``100`` for percentages).
+
+    Returns
+    -------
+    pl.DataFrame
+        ``Ticker`` (if present), ``Period`` and one ``Float64`` column per ratio.
+    """
+    available = set(frame.columns)
+
+    def col(name: str) -> pl.Expr:
+        if name in available:
+            return pl.col(name).cast(pl.Float64)
+        return pl.lit(None, dtype=pl.Float64)
+
+    keys = [k for k in ("Ticker", "Period") if k in available]
+    definitions = {
+        name: compile_ratio(d) if isinstance(d, str) else d for name, d in definitions.items()
+    }
+    exprs = [
+        (definition(col) * multiplier).cast(pl.Float64).fill_null(NAN).alias(name)
+        for name, definition in definitions.items()
+    ]
+
+    return frame.select([*keys, *exprs])
+
+
+def stack_frames(frames: Mapping[str, pl.DataFrame]) -> pl.DataFrame:
+    """
+    Stack per-ticker period-major frames into one universe frame.
+
+    Evaluating ratios over the result computes every ratio for every ticker
+    and period in a single pass.
+
+    Parameters
+    ----------
+    frames : Mapping[str, pl.DataFrame]
+        Ticker → output of :func:`statement_frame`.
+    """
+    stacked = [df.with_columns(pl.lit(ticker).alias("Ticker")) for ticker, df in frames.items()]
+    if not stacked:
+        return pl.DataFrame(schema={"Ticker": pl.Utf8, "Period": pl.Utf8})
+    return pl.concat(stacked, how="diagonal_relaxed")
+
+
+__all__ = [
+    "Col",
+    "RatioDefinition",
+    "CompiledRatio",
+    "safe_div",
+    "compile_ratio",
+    "compile_ratios",
+    "required_sources",
+    "statement_frame",
+    "stack_frames",
+    "evaluate_ratios",
+    "PROFITABILITY_RATIOS",
+    "LIQUIDITY_RATIOS",
+    "VALUATION_RATIOS",
+]
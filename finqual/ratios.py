@@ -1,49 +1,79 @@
 """
-Pure financial ratio functions.
+Financial ratio functions over plain line-item mappings.
 
 Every function in this module takes plain ``dict`` mappings (line item → value)
 as inputs and returns a ``float``. They are deliberately decoupled from
-networking, caching and Polars so they can be unit-tested in isolation.
+networking and caching, so a ratio can be computed for a single period without
+a :class:`~finqual.core.Finqual` instance.
 
 The ``Mapping`` argument lets callers pass either a ``dict`` or a Polars row
-adapter that quacks like one. Missing keys raise ``KeyError`` and
-zero-denominator division raises ``ZeroDivisionError`` — both are caught by
-the orchestrating layer in :mod:`finqual.core`.
+adapter that quacks like one. Each function evaluates the corresponding
+definition in :mod:`finqual.ratio_engine` — the same expressions
+:class:`~finqual.core.Finqual` evaluates over all periods — on a one-row
+frame, so both always agree: a zero denominator or a missing / null line item
+yields ``NaN``, and optional items (e.g. ``Tax Provision`` in ROIC) default
+as they do in the engine.
 """
 
 from __future__ import annotations
 
 from typing import Mapping
 
+import polars as pl
+
+from finqual.ratio_engine import (
+    LIQUIDITY_RATIOS,
+    PROFITABILITY_RATIOS,
+    VALUATION_RATIOS,
+    CompiledRatio,
+    evaluate_ratios,
+)
+
 Number = float | int
 
 
+def _evaluate(ratio: CompiledRatio, *statements: Mapping[str, Number], share_price: Number | None = None) -> float:
+    """Evaluate ``ratio`` on one period made of ``statements`` (and the share price)."""
+    values: dict[str, Number | None] = {}
+    for statement in statements:
+        values.update(statement)
+    if share_price is not None:
+        values["Share Price"] = share_price
+
+    items = sorted(i for i in ratio.items if i in values)
+    frame = pl.DataFrame(
+        {"Period": [""], **{i: [values[i]] for i in items}},
+        schema={"Period": pl.Utf8, **dict.fromkeys(items, pl.Float64)},
+    )
+    return evaluate_ratios(frame, {"ratio": ratio})["ratio"][0]
+
+
 # ------------------------------------------------------------------ #
 # Profitability
 # ------------------------------------------------------------------ #
 
 def sga_ratio(income: Mapping[str, Number]) -> float:
-    return income["Selling General And Administration"] / income["Total Revenue"]
+    return _evaluate(PROFITABILITY_RATIOS["SG&A Ratio"], income)
 
 
 def rd_ratio(income: Mapping[str, Number]) -> float:
-    return income["Research And Development"] / income["Total Revenue"]
+    return _evaluate(PROFITABILITY_RATIOS["R&D Ratio"], income)
 
 
 def operating_margin(income: Mapping[str, Number]) -> float:
-    return income["Operating Income"] / income["Total Revenue"]
+    return _evaluate(PROFITABILITY_RATIOS["Operating Margin"], income)
 
 
 def gross_margin(income: Mapping[str, Number]) -> float:
-    return income["Gross Profit"] / income["Total Revenue"]
+    return _evaluate(PROFITABILITY_RATIOS["Gross Margin"], income)
 
 
 def roa(income: Mapping[str, Number], balance: Mapping[str, Number]) -> float:
-    return income["Net Income"] / balance["Total Assets"]
+    return _evaluate(PROFITABILITY_RATIOS["ROA"], income, balance)
 
 
 def roe(income: Mapping[str, Number], balance: Mapping[str, Number]) -> float:
-    return income["Net Income"] / balance["Stockholders Equity"]
+    return _evaluate(PROFITABILITY_RATIOS["ROE"], income, balance)
 
 
 def roic(income: Mapping[str, Number], balance: Mapping[str, Number]) -> float:
@@ -53,17 +83,10 @@ def roic(income: Mapping[str, Number], balance: Mapping[str, Number]) -> float:
     NOPAT / Invested Capital, with NOPAT = Operating Income × (1 − tax rate)
     and Invested Capital = Total Assets − non-interest-bearing current
     liabilities (here approximated as the sum of short-term investments,
-    accounts payable and other current liabilities).
+    accounts payable and other current liabilities). A missing tax provision
+    counts as zero tax.
     """
-    tax_rate = income.get("Tax Provision", 0) / income["Pretax Income"]
-    nopat = income["Operating Income"] * (1 - tax_rate)
-    invested_capital = (
-        balance["Total Assets"]
-        - balance["Other Short Term Investments"]
-        - balance["Accounts Payable"]
-        - balance["Other Current Liabilities"]
-    )
-    return nopat / invested_capital
+    return _evaluate(PROFITABILITY_RATIOS["ROIC"], income, balance)
 
 
 # ------------------------------------------------------------------ #
@@ -71,15 +94,15 @@ def roic(income: Mapping[str, Number], balance: Mapping[str, Number]) -> float:
 # ------------------------------------------------------------------ #
 
 def current_ratio(balance: Mapping[str, Number]) -> float:
-    return balance["Current Assets"] / balance["Current Liabilities"]
+    return _evaluate(LIQUIDITY_RATIOS["Current Ratio"], balance)
 
 
 def quick_ratio(balance: Mapping[str, Number]) -> float:
-    return (balance["Current Assets"] - balance["Inventory"]) / balance["Current Liabilities"]
+    return _evaluate(LIQUIDITY_RATIOS["Quick Ratio"], balance)
 
 
 def debt_to_equity(balance: Mapping[str, Number]) -> float:
-    return balance["Total Liabilities Net Minority Interest"] / balance["Stockholders Equity"]
+    return _evaluate(LIQUIDITY_RATIOS["Debt-to-Equity Ratio"], balance)
 
 
 # ------------------------------------------------------------------ #
@@ -87,16 +110,15 @@ def debt_to_equity(balance: Mapping[str, Number]) -> float:
 # ------------------------------------------------------------------ #
 
 def eps(income: Mapping[str, Number], balance: Mapping[str, Number]) -> float:
-    return income["Net Income"] / balance["Shares Outstanding"]
+    return _evaluate(VALUATION_RATIOS["EPS"], income, balance)
 
 
 def pe(income: Mapping[str, Number], balance: Mapping[str, Number], share_price: Number) -> float:
-    return share_price / eps(income, balance)
+    return _evaluate(VALUATION_RATIOS["P/E"], income, balance, share_price=share_price)
 
 
 def pb(income: Mapping[str, Number], balance: Mapping[str, Number], share_price: Number) -> float:
-    book_value = balance["Total Assets"] - balance["Total Liabilities Net Minority Interest"]
-    return (share_price * balance["Shares Outstanding"]) / book_value
+    return _evaluate(VALUATION_RATIOS["P/B"], income, balance, share_price=share_price)
 
 
 def ev_ebitda(
@@ -106,9 +128,7 @@ def ev_ebitda(
     share_price: Number,
 ) -> float:
     """Approximation: EV ≈ Market Cap + End Cash Position; EBITDA ≈ Operating Income + D&A."""
-    enterprise_value = balance["Shares Outstanding"] * share_price + cashflow["End Cash Position"]
-    ebitda = income["Operating Income"] + cashflow["Depreciation And Amortization"]
-    return enterprise_value / ebitda
+    return _evaluate(VALUATION_RATIOS["EV/EBITDA"], income, balance, cashflow, share_price=share_price)
 
 
 __all__ = [
@@ -0,0 +1,305 @@
+"""
+Sector-wide ratio screening.
+
+:class:`Screen` computes ratios for every company in a universe drawn from the
+packaged ``sector_mapping.parquet`` (whole sectors, or all tickers) and
+returns one long frame::
+
+    Ticker | Sector | Period | Metric | Ratio | Value
+
+Companies are processed in a process pool, since statement construction is
+CPU-bound. Each worker gets an equal share of the SEC request budget, and
+with ``FINQUAL_CACHE_DIR`` set, each company's processed ``companyfacts`` are
+read from the local :class:`~finqual.sec_edgar.facts_cache.FactsCache` and
+statements computed in earlier runs from the
+:class:`~finqual.statement_store.StatementStore`, so a repeat screen only
+downloads the (small) submissions document of companies without new filings.
+
+Results stream out as companies complete (:meth:`Screen.iter_results`), can be
+checkpointed to disk so an interrupted screen resumes where it stopped, and
+throughput is tracked in :attr:`Screen.stats`.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from importlib.resources import files
+from pathlib import Path
+from typing import Iterator, Sequence
+
+import polars as pl
+
+from .core import Finqual
+from .sec_edgar.rate_limit import SEC_MAX_CALLS, SEC_PERIOD_SECS, sec_limiter
+
+# Ratio groups a screen can compute, mapped to the Finqual method suffix.
+SCREEN_METRICS = ("profitability", "liquidity", "valuation")
+
+# Column order of screen results.
+_RESULT_COLUMNS = ["Ticker", "Sector", "Period", "Metric", "Ratio", "Value"]
+
+# Print a progress line every this many completed companies.
+_PROGRESS_EVERY = 50
+
+
+@dataclass
+class ScreenStats:
+    """
+    Progress and throughput of a screen run.
+
+    Attributes
+    ----------
+    total : int
+        Companies in the universe.
+    completed : int
+        Companies computed in this run.
+    resumed : int
+        Companies loaded from the checkpoint.
+    failed : dict[str, str]
+        Ticker → error message for companies that could not be screened.
+    started : float
+        ``time.monotonic()`` at the start of the run.
+    """
+
+    total: int = 0
+    completed: int = 0
+    resumed: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started."""
+        return time.monotonic() - self.started
+
+    @property
+    def rate(self) -> float:
+        """Companies computed per second (checkpointed companies excluded)."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        done = self.completed + self.resumed + len(self.failed)
+        return (f"{done}/{self.total} companies in {self.elapsed:.1f}s ({self.rate:.2f}/s), "
+                f"{self.resumed} resumed, {len(self.failed)} failed")
+
+
+def _worker_budget(max_workers: int) -> tuple[int, float]:
+    """
+    Split the SEC request budget across ``max_workers`` processes as ``(calls, period)`` per worker.
+
+    Up to ``SEC_MAX_CALLS`` workers share the one-second window; beyond that
+    each worker gets one call per proportionally longer window, so the pool
+    as a whole never exceeds ``SEC_MAX_CALLS`` per ``SEC_PERIOD_SECS``.
+    """
+    if max_workers <= SEC_MAX_CALLS:
+        return SEC_MAX_CALLS // max_workers, SEC_PERIOD_SECS
+    return 1, SEC_PERIOD_SECS * max_workers / SEC_MAX_CALLS
+
+
+def _init_worker(calls: int, period: float) -> None:
+    """Process-pool initializer giving each worker its share of the SEC request budget."""
+    sec_limiter.configure(calls, period)
+
+
+def _screen_company(ticker: str, sector: str, metrics: tuple[str, ...],
+                    year: int | None, quarter: int | None) -> pl.DataFrame:
+    """Compute ``metrics`` for one company as a long frame (runs in a worker)."""
+    fq = Finqual(ticker)
+
+    frames = []
+    for metric in metrics:
+        df = getattr(fq, f"{metric}_ratios")(year, quarter)
+        if df is None or df.is_empty():
+            continue
+        frames.append(
+            df.drop("Ticker", strict=False)
+            .unpivot(index="Period", variable_name="Ratio", value_name="Value")
+            .with_columns(pl.lit(metric).alias("Metric"), pl.col("Value").cast(pl.Float64))
+        )
+
+    if not frames:
+        return pl.DataFrame(schema=dict.fromkeys(_RESULT_COLUMNS, pl.Utf8) | {"Value": pl.Float64})
+
+    return (
+        pl.concat(frames, how="vertical")
+        .with_columns(pl.lit(ticker).alias("Ticker"), pl.lit(sector).alias("Sector"))
+        .select(_RESULT_COLUMNS)
+    )
+
+
+class Screen:
+    """
+    Compute ratios across a sector (or the whole ticker universe).
+
+    Attributes
+    ----------
+    universe : pl.DataFrame
+        ``ticker`` / ``sector`` rows being screened.
+    metrics : tuple[str, ...]
+        Ratio groups computed for each company.
+    stats : ScreenStats
+        Progress of the most recent run.
+    """
+
+    def __init__(self, sectors: str | Sequence[str] | None = None, tickers: Sequence[str] | None = None,
+                 metrics: Sequence[str] = ("profitability", "liquidity"), max_workers: int | None = None,
+                 processes: bool = True, checkpoint: str | os.PathLike | None = None):
+        """
+        Parameters
+        ----------
+        sectors : str | Sequence[str] | None, default=None
+            Sector name(s) from ``sector_mapping.parquet``. None screens every sector.
+        tickers : Sequence[str] | None, default=None
+            Restrict the universe to these tickers.
+        metrics : Sequence[str], default=("profitability", "liquidity")
+            Any of ``"profitability"``, ``"liquidity"``, ``"valuation"``.
+        max_workers : int | None, default=None
+            Worker count. Defaults to ``min(os.cpu_count(), SEC_MAX_CALLS)``.
+            Worker processes split the SEC request budget, so more than
+            ``SEC_MAX_CALLS`` workers each wait longer between requests.
+        processes : bool, default=True
+            Use a process pool. False uses threads, which avoids process
+            start-up cost for small universes.
+        checkpoint : str | os.PathLike | None, default=None
+            Directory where each completed company's rows are saved. Re-running
+            the same screen with the same directory skips saved companies.
+        """
+        unknown = set(metrics) - set(SCREEN_METRICS)
+        if unknown:
+            raise ValueError(f"Unknown screen metrics: {sorted(unknown)}. Choose from {SCREEN_METRICS}.")
+
+        universe = pl.scan_parquet(files("finqual.data") / "sector_mapping.parquet")
+        if sectors is not None:
+            sectors = [sectors] if isinstance(sectors, str) else list(sectors)
+            universe = universe.filter(pl.col("sector").is_in(sectors))
+        if tickers is not None:
+            universe = universe.filter(pl.col("ticker").is_in(list(tickers)))
+
+        self.universe = universe.unique("ticker", keep="first", maintain_order=True).collect()
+        self.metrics = tuple(metrics)
+        self.max_workers = max_workers or min(os.cpu_count() or 1, SEC_MAX_CALLS)
+        self.processes = processes
+        self.checkpoint = Path(checkpoint) if checkpoint is not None else None
+        self.stats = ScreenStats()
+
+    # ------------------------------------------------------------------ #
+    # Checkpointing
+    # ------------------------------------------------------------------ #
+
+    def _checkpoint_dir(self, year: int | None, quarter: int | None) -> Path | None:
+        """Checkpoint sub-directory for one (metrics, year, quarter) screen."""
+        if self.checkpoint is None:
+            return None
+        return self.checkpoint / f"{'-'.join(self.metrics)}_{year}-{quarter}"
+
+    @staticmethod
+    def _save(directory: Path, ticker: str, df: pl.DataFrame) -> None:
+        """Atomically write one company's rows to the checkpoint."""
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.write_parquet(tmp)
+            os.replace(tmp, directory / f"{ticker}.parquet")
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    # ------------------------------------------------------------------ #
+    # Running
+    # ------------------------------------------------------------------ #
+
+    def _executor(self) -> Executor:
+        if not self.processes:
+            return ThreadPoolExecutor(max_workers=self.max_workers)
+
+        return ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                   initargs=_worker_budget(self.max_workers))
+
+    def iter_results(self, year: int | None = None, quarter: int | None = None) -> Iterator[pl.DataFrame]:
+        """
+        Yield each company's rows as soon as they are available.
+
+        Checkpointed companies are yielded first, then computed companies in
+        completion order. Companies that fail are recorded in
+        ``stats.failed`` and skipped.
+
+        Parameters
+        ----------
+        year : int | None, default=None
+            Fiscal year; None for TTM.
+        quarter : int | None, default=None
+            Specific quarter; None for annual data.
+        """
+        self.stats = ScreenStats(total=len(self.universe))
+        directory = self._checkpoint_dir(year, quarter)
+
+        pending = []
+        for ticker, sector in self.universe.iter_rows():
+            saved = directory / f"{ticker}.parquet" if directory is not None else None
+            if saved is not None and saved.is_file():
+                self.stats.resumed += 1
+                yield pl.read_parquet(saved)
+            else:
+                pending.append((ticker, sector))
+
+        if not pending:
+            return
+
+        executor = self._executor()
+        try:
+            futures = {
+                executor.submit(_screen_company, ticker, sector, self.metrics, year, quarter): ticker
+                for ticker, sector in pending
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    self.stats.failed[ticker] = f"{type(e).__name__}: {e}"
+                    continue
+
+                if directory is not None:
+                    self._save(directory, ticker, df)
+
+                self.stats.completed += 1
+                if self.stats.completed % _PROGRESS_EVERY == 0:
+                    print(f"[Screen] {self.stats}")
+
+                yield df
+        finally:
+            # A consumer that stops early (break / close()) must not wait for the rest of the universe.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, year: int | None = None, quarter: int | None = None) -> pl.DataFrame:
+        """
+        Screen the whole universe and return one long frame.
+
+        Parameters
+        ----------
+        year : int | None, default=None
+            Fiscal year; None for TTM.
+        quarter : int | None, default=None
+            Specific quarter; None for annual data.
+
+        Returns
+        -------
+        pl.DataFrame
+            ``Ticker``, ``Sector``, ``Period``, ``Metric``, ``Ratio`` and ``Value``
+            columns, sorted by ticker, metric and ratio.
+        """
+        frames = list(self.iter_results(year, quarter))
+        print(f"[Screen] {self.stats}")
+
+        if not frames:
+            return pl.DataFrame(schema=dict.fromkeys(_RESULT_COLUMNS, pl.Utf8) | {"Value": pl.Float64})
+
+        return pl.concat(frames, how="vertical").sort(["Ticker", "Metric", "Ratio"])
+
+
+__all__ = ["Screen", "ScreenStats", "SCREEN_METRICS"]
@@ -0,0 +1,155 @@
+"""
+Process-wide company identity and submissions metadata.
+
+:class:`~finqual.sec_edgar.sec_api.SecApi` (fundamentals) and
+:class:`~finqual.form_parsers.FinqualForms` (insider / 13F filings) both need
+a company's CIK and its ``submissions/CIK##########.json`` document. This
+module resolves and downloads each once per process and shares the result:
+
+- :func:`resolve_company` — ticker or CIK → :class:`CompanyIdCode`, cached
+  for the life of the process. A CIK is resolved from its submissions
+  document, which is then reused rather than downloaded again.
+- :func:`company_submissions` — CIK → typed
+  :class:`~finqual.sec_edgar.submissions.Submissions`, cached for
+  ``SUBMISSIONS_TTL_SECS`` since the document changes with every new filing.
+
+Concurrent callers for the same company share one download.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import threading
+import time
+from typing import Mapping
+
+import ijson
+import requests
+
+from finqual._cache import SingleFlight
+from finqual.config.headers import sec_headers
+from finqual.sec_edgar.entities.exceptions import CompanyIdCodeNotFoundError
+from finqual.sec_edgar.entities.models import CompanyIdCode
+from finqual.sec_edgar.rate_limit import sec_limiter
+from finqual.sec_edgar.submissions import Submissions
+
+_TICKERS_URL = "https://www.sec.gov/files/company_tickers_exchange.json"
+
+_REQUEST_TIMEOUT_SECS = 30
+
+# Seconds a downloaded submissions document is reused before being fetched again.
+SUBMISSIONS_TTL_SECS = 600
+
+_flight = SingleFlight()
+_lock = threading.Lock()
+_identities: dict[str, CompanyIdCode] = {}
+_submissions: dict[str, tuple[float, Submissions]] = {}
+
+
+@sec_limiter.limited
+def _lookup_ticker(value: str, headers: Mapping[str, str]) -> CompanyIdCode:
+    """Find ``value`` in SEC's combined ticker index, streaming it until a match."""
+    with requests.get(_TICKERS_URL, headers=headers, stream=True, timeout=_REQUEST_TIMEOUT_SECS) as response:
+        response.raise_for_status()
+        gz = gzip.GzipFile(fileobj=response.raw)
+        text_stream = io.TextIOWrapper(gz, encoding="utf-8", errors="replace")
+
+        # Each item: [cik, title, ticker, exchange]
+        for cik, name, ticker, exchange in ijson.items(text_stream, "data.item"):
+            if ticker.lower() == value.lower() or str(cik) == value:
+                return CompanyIdCode(cik=str(cik).zfill(10), name=name, ticker=ticker, exchange=exchange)
+
+    raise CompanyIdCodeNotFoundError(value)
+
+
+def _fetch_submissions(cik: str, headers: Mapping[str, str]) -> Submissions:
+    """Download a submissions document and store it in the process-wide cache."""
+    try:
+        submissions = Submissions.fetch(cik, headers)
+    except requests.HTTPError as e:
+        if e.response is not None and e.response.status_code == 404:
+            raise CompanyIdCodeNotFoundError(cik) from e
+        raise
+
+    with _lock:
+        _submissions[cik] = (time.monotonic(), submissions)
+    return submissions
+
+
+def company_submissions(cik: str | int, headers: Mapping[str, str] = sec_headers) -> Submissions:
+    """
+    Return a company's typed submissions, downloading them at most once per TTL.
+
+    Parameters
+    ----------
+    cik : str | int
+        Company CIK (padding optional).
+    headers : Mapping[str, str], default=sec_headers
+        HTTP headers for SEC requests.
+
+    Raises
+    ------
+    CompanyIdCodeNotFoundError
+        If SEC has no submissions for ``cik``.
+    """
+    cik = str(cik).strip().zfill(10)
+    with _lock:
+        entry = _submissions.get(cik)
+    if entry is not None and time.monotonic() - entry[0] < SUBMISSIONS_TTL_SECS:
+        return entry[1]
+
+    return _flight.do(("submissions", cik), _fetch_submissions, cik, headers)
+
+
+def _resolve(value: str, headers: Mapping[str, str]) -> CompanyIdCode:
+    if value.isdigit():
+        # A CIK's submissions document carries its identity; keep it for the callers that need it next.
+        payload = company_submissions(value, headers).payload
+        identity = CompanyIdCode(
+            cik=value.zfill(10),
+            name=payload.get("name"),
+            ticker=(payload.get("tickers") or ["None"])[0],
+            exchange=(payload.get("exchanges") or ["None"])[0],
+        )
+    else:
+        identity = _lookup_ticker(value, headers)
+
+    with _lock:
+        _identities[value.lower()] = identity
+    return identity
+
+
+def resolve_company(ticker_or_cik: str | int, headers: Mapping[str, str] = sec_headers) -> CompanyIdCode:
+    """
+    Resolve a ticker or CIK to a :class:`CompanyIdCode`, once per process.
+
+    Parameters
+    ----------
+    ticker_or_cik : str | int
+        Ticker (e.g. ``"AAPL"``) or numeric CIK (e.g. ``"0000320193"``).
+    headers : Mapping[str, str], default=sec_headers
+        HTTP headers for SEC requests.
+
+    Raises
+    ------
+    CompanyIdCodeNotFoundError
+        If the ticker or CIK is not known to SEC.
+    """
+    value = str(ticker_or_cik).strip()
+    with _lock:
+        identity = _identities.get(value.lower())
+    if identity is not None:
+        return identity
+
+    return _flight.do(("id", value.lower()), _resolve, value, headers)
+
+
+def clear_company_cache() -> None:
+    """Forget every cached identity and submissions document."""
+    with _lock:
+        _identities.clear()
+        _submissions.clear()
+
+
+__all__ = ["resolve_company", "company_submissions", "clear_company_cache", "SUBMISSIONS_TTL_SECS"]
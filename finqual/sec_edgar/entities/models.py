@@ -20,6 +20,7 @@ class CompanyFacts(BaseModel):
 class CompanySubmission(BaseModel):
     latest_10k: int | None
     report_date: str | None
+    latest_accession: str | None = None
     sector: str | None
     reports: pl.DataFrame | None
 
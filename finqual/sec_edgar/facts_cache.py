@@ -0,0 +1,104 @@
+"""
+On-disk cache of processed SEC ``companyfacts``.
+
+Downloading and normalising ``companyfacts`` is the dominant cost of building a
+:class:`~finqual.sec_edgar.sec_api.SecApi`, yet the document only changes when
+the company files new XBRL data. Processed facts are therefore stored per
+company and keyed by the company's latest XBRL accession number (from its
+submissions document)::
+
+    <root>/<finqual version>/<CIK>/<accession>.parquet   normalised facts frame
+    <root>/<finqual version>/<CIK>/<accession>.json      taxonomy, currency and DEI block
+
+A new XBRL filing changes the accession and a new finqual release changes the
+version directory, so stale facts are never read. Older accessions of a
+company are removed when a newer one is stored.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+from finqual.config.cache import cache_dir
+from finqual.sec_edgar.entities.models import CompanyFacts
+
+
+def _write_atomic(path: Path, write) -> None:
+    """Call ``write(tmp_path)`` and move the result to ``path`` atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+class FactsCache:
+    """
+    Parquet-backed cache of :class:`CompanyFacts`, one entry per company and XBRL accession.
+
+    Attributes
+    ----------
+    root : Path
+        Directory holding the cache for the current finqual version.
+    """
+
+    def __init__(self, root: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        root : str | os.PathLike
+            Base directory; a per-version sub-directory is created underneath it.
+        """
+        from finqual import __version__
+
+        self.root = Path(root) / __version__
+
+    @classmethod
+    def default(cls) -> FactsCache | None:
+        """Return a cache under ``$FINQUAL_CACHE_DIR/facts``, or ``None`` if disk caching is disabled."""
+        root = cache_dir("facts")
+        return cls(root) if root is not None else None
+
+    def _paths(self, cik: str, accession: str) -> tuple[Path, Path]:
+        base = self.root / cik / accession
+        return base.with_suffix(".parquet"), base.with_suffix(".json")
+
+    def get(self, cik: str, accession: str) -> CompanyFacts | None:
+        """Return the cached facts for ``(cik, accession)``, or ``None`` on a miss or an unreadable entry."""
+        frame_path, meta_path = self._paths(cik, accession)
+        if not (frame_path.is_file() and meta_path.is_file()):
+            return None
+
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            df = pl.read_parquet(frame_path)
+            return CompanyFacts(sec_data=df, taxonomy=meta["taxonomy"], currency=meta["currency"], dei=meta["dei"])
+        except Exception:
+            # A truncated or foreign entry is treated as a miss and overwritten later.
+            return None
+
+    def put(self, cik: str, accession: str, facts: CompanyFacts) -> None:
+        """Store ``facts`` and drop the company's older accessions. Disk errors are ignored."""
+        frame_path, meta_path = self._paths(cik, accession)
+        meta = {"taxonomy": facts.taxonomy, "currency": facts.currency, "dei": facts.dei}
+        try:
+            if frame_path.parent.is_dir():
+                shutil.rmtree(frame_path.parent, ignore_errors=True)
+            _write_atomic(frame_path, facts.sec_data.write_parquet)
+            _write_atomic(meta_path, lambda tmp: Path(tmp).write_text(json.dumps(meta), encoding="utf-8"))
+        except OSError:
+            # The cache is an accelerator only; a read-only or full disk must not fail the call.
+            pass
+
+
+__all__ = ["FactsCache"]
@@ -0,0 +1,191 @@
+"""
+Permanent on-disk cache for immutable EDGAR filing documents.
+
+Documents under ``https://www.sec.gov/Archives/edgar/data/<CIK>/<accession>/``
+never change once filed, so they are cached forever, keyed by accession number
+and document name::
+
+    <root>/<accession>/<document>.gz
+
+Raw documents are stored gzip-compressed rather than as parsed rows, so parser
+changes never require invalidating the cache. The only eviction is explicit,
+size-based pruning (:meth:`FilingCache.prune`), which removes the least
+recently used documents first.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+import re
+import shutil
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+from finqual.config.cache import cache_dir
+
+# Archive URLs: .../Archives/edgar/data/<cik>/<accession (18 digits, dashes optional)>/<document>
+_ARCHIVE_URL_RE = re.compile(r"/Archives/edgar/data/\d+/(\d{10}-?\d{2}-?\d{6})/([^/?#]+)$")
+
+
+def archive_key(url: str) -> tuple[str, str] | None:
+    """
+    Return ``(accession, document)`` for an EDGAR archive document URL.
+
+    The accession is normalised to its undashed 18-digit form. URLs outside
+    the filing archive (e.g. submissions JSON) return ``None``, since their
+    content changes over time.
+    """
+    match = _ARCHIVE_URL_RE.search(url)
+    if match is None:
+        return None
+    accession, document = match.groups()
+    return accession.replace("-", ""), document
+
+
+class FilingCache:
+    """
+    Gzip-compressed store of EDGAR filing documents keyed by accession and document.
+
+    Attributes
+    ----------
+    root : Path
+        Cache directory.
+    """
+
+    def __init__(self, root: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        root : str | os.PathLike
+            Cache directory; created on first write.
+        """
+        self.root = Path(root)
+
+    @classmethod
+    def default(cls) -> FilingCache | None:
+        """Return a cache under ``$FINQUAL_CACHE_DIR/filings``, or ``None`` if disk caching is disabled."""
+        root = cache_dir("filings")
+        return cls(root) if root is not None else None
+
+    def path(self, accession: str, document: str) -> Path:
+        """Return the on-disk path of one document."""
+        return self.root / accession.replace("-", "") / f"{document}.gz"
+
+    def get(self, accession: str, document: str) -> bytes | None:
+        """
+        Return a cached document's bytes, or ``None`` on a miss or unreadable entry.
+
+        A hit refreshes the entry's modification time, which :meth:`prune`
+        uses as its recency order.
+        """
+        path = self.path(accession, document)
+        try:
+            with gzip.open(path, "rb") as f:
+                content = f.read()
+        except (OSError, EOFError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return content
+
+    def open(self, accession: str, document: str) -> BinaryIO | None:
+        """
+        Open a cached document for streaming reads, or return ``None`` on a miss.
+
+        Like :meth:`get`, a hit refreshes the entry's modification time.
+        """
+        path = self.path(accession, document)
+        try:
+            f = gzip.open(path, "rb")
+        except OSError:
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return f
+
+    def put(self, accession: str, document: str, content: bytes) -> None:
+        """Store a document atomically; disk errors are ignored."""
+        self._write(accession, document, lambda f: f.write(content))
+
+    def put_stream(self, accession: str, document: str, stream: BinaryIO) -> None:
+        """Store a document read from ``stream`` in chunks, without holding it in memory."""
+        self._write(accession, document, lambda f: shutil.copyfileobj(stream, f))
+
+    def _write(self, accession: str, document: str, write) -> None:
+        """Write a gzip entry through a temporary file and atomically move it into place."""
+        path = self.path(accession, document)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                    write(f)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        except OSError:
+            # The cache is an accelerator only; a read-only or full disk must not fail the fetch.
+            pass
+
+    def size(self) -> int:
+        """Total compressed size of the cache in bytes."""
+        if not self.root.is_dir():
+            return 0
+        return sum(p.stat().st_size for p in self.root.glob("*/*.gz"))
+
+    def prune(self, max_bytes: int) -> int:
+        """
+        Remove least recently used documents until the cache fits in ``max_bytes``.
+
+        Parameters
+        ----------
+        max_bytes : int
+            Target maximum compressed size.
+
+        Returns
+        -------
+        int
+            Number of documents removed.
+        """
+        if not self.root.is_dir():
+            return 0
+
+        entries = []
+        for p in self.root.glob("*/*.gz"):
+            try:
+                stat = p.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, p))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, p in sorted(entries):
+            if total <= max_bytes:
+                break
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+
+            # Drop accession directories emptied by the prune.
+            try:
+                p.parent.rmdir()
+            except OSError:
+                pass
+
+        return removed
+
+
+__all__ = ["FilingCache", "archive_key"]
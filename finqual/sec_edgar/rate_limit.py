@@ -0,0 +1,101 @@
+"""
+Process-wide rate limiting for SEC EDGAR requests.
+
+The SEC's fair-access policy allows 10 requests per second per client. The
+``ratelimit`` package's ``@limits`` decorator raises once the budget is spent
+and keeps a separate budget per decorated function, so concurrent callers
+(e.g. :class:`~finqual.cca.CCA` peers) either failed or collectively exceeded
+the limit. :data:`sec_limiter` is one shared, thread-safe budget that *blocks*
+callers until a slot is free.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import deque
+from typing import Callable, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+# SEC fair-access budget: requests per period (seconds).
+SEC_MAX_CALLS = 10
+SEC_PERIOD_SECS = 1.0
+
+
+class RateLimiter:
+    """
+    Thread-safe, blocking sliding-window rate limiter.
+
+    Attributes
+    ----------
+    calls : int
+        Maximum calls per ``period``.
+    period : float
+        Window length in seconds.
+    """
+
+    def __init__(self, calls: int, period: float):
+        """
+        Parameters
+        ----------
+        calls : int
+            Maximum calls per ``period``.
+        period : float
+            Window length in seconds.
+        """
+        self._lock = threading.Lock()
+        self._stamps: deque[float] = deque()
+        self.configure(calls, period)
+
+    def configure(self, calls: int, period: float | None = None) -> None:
+        """
+        Change the budget, e.g. to split the SEC limit across worker processes.
+
+        Parameters
+        ----------
+        calls : int
+            Maximum calls per ``period``; must be positive.
+        period : float | None, default=None
+            Window length in seconds. ``None`` keeps the current period.
+        """
+        if calls < 1:
+            raise ValueError("calls must be at least 1")
+        with self._lock:
+            self.calls = calls
+            if period is not None:
+                self.period = period
+
+    def acquire(self) -> None:
+        """Block until a call slot is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._stamps and now - self._stamps[0] >= self.period:
+                    self._stamps.popleft()
+
+                if len(self._stamps) < self.calls:
+                    self._stamps.append(now)
+                    return
+
+                wait = self.period - (now - self._stamps[0])
+
+            time.sleep(wait)
+
+    def limited(self, func: F) -> F:
+        """Decorator acquiring a slot before every call to ``func``."""
+
+        @functools.wraps(func)
+        def inner(*args, **kwargs):
+            self.acquire()
+            return func(*args, **kwargs)
+
+        return inner  # type: ignore[return-value]
+
+
+# Shared by every SEC request made in this process.
+sec_limiter = RateLimiter(SEC_MAX_CALLS, SEC_PERIOD_SECS)
+
+
+__all__ = ["RateLimiter", "sec_limiter", "SEC_MAX_CALLS", "SEC_PERIOD_SECS"]
@@ -1,15 +1,23 @@
 import requests
 import polars as pl
-from ratelimit import limits
 import gzip
 import ijson
 import io
+from datetime import date
 
-from finqual._cache import weak_lru
+from finqual import tracing
+from finqual._cache import SingleFlight, weak_lru
 from finqual.config.headers import sec_headers
-from finqual.sec_edgar.entities.exceptions import CompanyIdCodeNotFoundError
+from finqual.sec_edgar.company import company_submissions, resolve_company
+from finqual.sec_edgar.facts_cache import FactsCache
+from finqual.sec_edgar.rate_limit import sec_limiter
 from finqual.sec_edgar.entities.models import CompanyFacts, CompanySubmission, CompanyIdCode
 
+# Process-wide deduplication of company-facts downloads: two ``SecApi`` instances
+# built at the same moment for the same company share one download. Identity and
+# submissions are cached process-wide in :mod:`finqual.sec_edgar.company`.
+_download_flight = SingleFlight()
+
 
 def map_missing_frames(df: pl.DataFrame) -> pl.DataFrame:
     """
@@ -167,13 +175,43 @@ class SecApi:
             Stock ticker (e.g., "AAPL") or raw CIK (e.g., "0000320193").
         """
         self.headers = sec_headers
-        self.id_data = self.get_id_code(ticker_or_cik)
-        self.facts_data = self.process_company_facts()
-        self.submissions_data = self.process_company_submissions()
+        with tracing.span("sec.resolve", ticker_or_cik=str(ticker_or_cik)):
+            self.id_data = self.get_id_code(ticker_or_cik)
+        with tracing.span("sec.submissions", cik=self.id_data.cik) as stage:
+            self.submissions_data = self.process_company_submissions()
+            stage.set(rows=self.submissions_data.reports.height)
+        self.facts_data = _download_flight.do(("facts", self.id_data.cik), self.load_company_facts)
 
     # --- Company Facts
 
-    @limits(calls=10, period=1)
+    def load_company_facts(self) -> CompanyFacts:
+        """
+        Return the company's processed facts, from the local facts cache when it is current.
+
+        With ``FINQUAL_CACHE_DIR`` set, facts are cached under ``facts/`` keyed
+        by the company's latest XBRL accession, so repeated runs (e.g. a
+        :class:`~finqual.screen.Screen`) only download ``companyfacts`` again
+        after a new XBRL filing.
+        """
+        cache = FactsCache.default()
+        accession = self.latest_xbrl_accession() if cache is not None else None
+        if accession is None:
+            return self.process_company_facts()
+
+        facts = cache.get(self.id_data.cik, accession)
+        if facts is None:
+            facts = self.process_company_facts()
+            cache.put(self.id_data.cik, accession, facts)
+        return facts
+
+    def latest_xbrl_accession(self) -> str | None:
+        """Accession number of the company's most recent XBRL filing (the last change to ``companyfacts``)."""
+        recent = company_submissions(self.id_data.cik, self.headers).recent
+        xbrl = recent.filter(pl.col("isXBRL").fill_null(False) | pl.col("isInlineXBRL").fill_null(False))
+        return xbrl["accessionNumber"][0] if xbrl.height else None
+
+    @tracing.traced("sec.facts")
+    @sec_limiter.limited
     def process_company_facts(self) -> tuple[pl.DataFrame, str, str, dict]:
         """
         Download and process ``companyfacts`` records from the SEC API.
@@ -200,8 +238,10 @@ class SecApi:
         dei = None
         taxonomy = None
 
-        with requests.get(url, headers=self.headers, stream=True) as r:
-            gz = gzip.GzipFile(fileobj=r.raw)
+        with tracing.span("sec.facts.download", cik=self.id_data.cik) as stage, \
+                requests.get(url, headers=self.headers, stream=True) as r:
+            # Reading and parsing are interleaved; the span splits them into read_seconds / parse_seconds.
+            gz = gzip.GzipFile(fileobj=stage.reader(r.raw))
             text_stream = io.TextIOWrapper(gz, encoding="utf‑8", errors="replace")
 
             parser = ijson.kvitems(text_stream, "facts")
@@ -248,13 +288,16 @@ class SecApi:
                     # if you only want first taxonomy, break now
                     break
 
+            stage.set(rows=len(rows), bytes=r.raw.tell())
+
         preferred_currency = max(currency_counts, key=currency_counts.get)
 
-        df = (
+        # Each ``pipe_stage`` is timed on its own while tracing; otherwise the plan stays fused.
+        lf = (
             pl.LazyFrame(rows)
             .filter(pl.col("unit").is_in(["shares", preferred_currency]))
-            .pipe(map_missing_frames)  # <-- must accept LazyFrame
-            .pipe(convert_to_quarters)  # <-- must accept LazyFrame
+            .pipe(tracing.pipe_stage, "sec.facts.map_missing_frames", map_missing_frames)  # <-- must accept LazyFrame
+            .pipe(tracing.pipe_stage, "sec.facts.convert_to_quarters", convert_to_quarters)  # <-- must accept LazyFrame
             .with_columns([
                 pl.col("quarter_val").cast(pl.Float64),
                 pl.col("val").cast(pl.Float64),
@@ -269,8 +312,10 @@ class SecApi:
                 pl.col("accession_number").cast(pl.Utf8),
                 pl.col("is_amendment").cast(pl.Boolean),
             ])
-            .collect()
         )
+        with tracing.span("sec.facts.collect") as stage:
+            df = lf.collect()
+            stage.set(rows=df.height)
         
         company_facts = CompanyFacts(
             sec_data=df,
@@ -283,11 +328,13 @@ class SecApi:
 
     # --- CIK code
 
-    @weak_lru(maxsize=4)
     def get_id_code(self, ticker_or_cik: str | int) -> CompanyIdCode:
         """
         Resolve a ticker or raw CIK to a full CompanyIdCode object.
 
+        Delegates to the process-wide :func:`~finqual.sec_edgar.company.resolve_company`,
+        so :class:`~finqual.form_parsers.FinqualForms` reuses the same resolution.
+
         Parameters
         ----------
         ticker_or_cik : str or int
@@ -303,33 +350,17 @@ class SecApi:
         CompanyIdCodeNotFoundError
             If the ticker or CIK is not found in the SEC index.
         """
-        url = "https://www.sec.gov/files/company_tickers_exchange.json"
-        ticker_or_cik = str(ticker_or_cik)
-
-        with requests.get(url, headers=self.headers, stream=True) as r:
-            gz = gzip.GzipFile(fileobj=r.raw)
-            text_stream = io.TextIOWrapper(gz, encoding="utf‑8", errors="replace")
-
-            # Each item in the JSON array is like: [cik, title, ticker, exchange]
-            for item in ijson.items(text_stream, "data.item"):
-                cik, name, ticker, exchange = item
-                if ticker.lower() == ticker_or_cik.lower() or str(cik) == ticker_or_cik:
-                    payload = {
-                        "cik": str(cik).zfill(10),
-                        "name": name,
-                        "ticker": ticker,
-                        "exchange": exchange
-                        }
-                    return CompanyIdCode(**payload)
-
-            raise CompanyIdCodeNotFoundError(ticker_or_cik)
+        return resolve_company(ticker_or_cik, self.headers)
 
     # --- Company submissions
 
-    @limits(calls=10, period=1)
     def process_company_submissions(self) -> CompanySubmission:
         """
-        Download and parse the SEC `submissions` file for the company.
+        Summarise the company's SEC `submissions` file.
+
+        The file is downloaded through the process-wide
+        :func:`~finqual.sec_edgar.company.company_submissions` cache, shared
+        with :class:`~finqual.form_parsers.FinqualForms`.
 
         Returns
         -------
@@ -342,18 +373,21 @@ class SecApi:
                 SIC industry description.
             - reports : polars.DataFrame
                 Filtered filings with URLs.
+            - latest_accession : str or None
+                Accession number of the most recent periodic report,
+                amendments (10-K/A, 10-Q/A, 20-F/A, 40-F/A) included.
         """
 
-        url = f"https://data.sec.gov/submissions/CIK{self.id_data.cik}.json"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-
-        json_request = response.json()
+        submissions = company_submissions(self.id_data.cik, self.headers)
+        df = submissions.recent
 
-        df = pl.DataFrame(json_request["filings"]["recent"])
+        # --- Statement-store key: an amendment restates financials, so it must invalidate cached statements
+        periodic = ["10-K", "10-Q", "20-F", "40-F"]
+        df_periodic = df.filter(pl.col("form").is_in(periodic + [f"{form}/A" for form in periodic]))
+        latest_accession = df_periodic["accessionNumber"][0] if len(df_periodic) > 0 else None
 
         # --- Filter relevant filings
-        df = df.filter(pl.col("primaryDocDescription").is_in(["10-K", "10-Q", "20-F", "40-F"]))
+        df = df.filter(pl.col("primaryDocDescription").is_in(periodic))
 
         # --- Build document URLs
         df = df.with_columns(
@@ -366,12 +400,13 @@ class SecApi:
             ).alias("URL")
         )
 
-        df = df.select(["reportDate", "primaryDocDescription", "URL"])
+        # Typed submissions carry dates; ``reports`` keeps its ISO-string reportDate ("" when unreported).
+        df = df.select([pl.col("reportDate").cast(pl.Utf8).fill_null(""), "primaryDocDescription", "URL"])
 
         # --- Latest Annual Reports
         df_latest_annual = (df.filter(pl.col("primaryDocDescription").is_in(["10-K", "20-F"])).head(1))
 
-        if len(df_latest_annual) > 0:
+        if len(df_latest_annual) > 0 and df_latest_annual["reportDate"][0]:
             report_date = df_latest_annual["reportDate"][0]
             latest_10k = int(report_date[:4])
 
@@ -380,13 +415,14 @@ class SecApi:
             latest_10k = None
 
         # --- Sector
-        sector = json_request.get("sicDescription")
+        sector = submissions.payload.get("sicDescription")
 
         return CompanySubmission(
             latest_10k=latest_10k,
             report_date=report_date,
             sector=sector,
             reports=df,
+            latest_accession=latest_accession,
         )
 
     # --- In-class methods (no downloads)
@@ -613,7 +649,43 @@ class SecApi:
         dur_lookup_val = f"CY{year}" if quarter is None else f"CY{year}Q{quarter}"
         inst_lookup_val = f"CY{year}Q{annual_quarter}I" if quarter is None else f"CY{year}Q{quarter}I"
 
-        data = self.facts_data.sec_data.filter(pl.col("frame_map").cast(pl.Utf8).is_in([dur_lookup_val, inst_lookup_val]))
-        data = data.unique()
+        with tracing.span("sec.financial_data_period", year=year, quarter=quarter) as stage:
+            data = self.facts_data.sec_data.filter(pl.col("frame_map").cast(pl.Utf8).is_in([dur_lookup_val, inst_lookup_val]))
+            data = data.unique()
+            stage.set(rows=data.height)
 
         return data
+
+    @weak_lru(maxsize=1)
+    def period_end_dates(self) -> dict[str, date]:
+        """
+        Map every instant frame (e.g. ``"CY2024Q3I"``) to its report (period-end) date.
+
+        Returns
+        -------
+        dict[str, date]
+            ``frame_map`` → latest ``end`` date reported for that frame.
+        """
+        df = (
+            self.facts_data.sec_data
+            .select(pl.col("frame_map").cast(pl.Utf8), "end")
+            .filter(pl.col("frame_map").str.ends_with("I") & pl.col("end").is_not_null())
+            .group_by("frame_map")
+            .agg(pl.col("end").max())
+        )
+        return dict(zip(df["frame_map"], df["end"]))
+
+    def period_end_date(self, year: int, quarter: int | None = None) -> date | None:
+        """
+        Report date of a fiscal year or year-quarter.
+
+        Uses the same instant frame as :meth:`financial_data_period`, i.e. the
+        fiscal year-end quarter when ``quarter`` is omitted.
+
+        Returns
+        -------
+        date or None
+            Period-end date, or None if the period has no instant facts.
+        """
+        q = self.get_annual_quarter() if quarter is None else quarter
+        return self.period_end_dates().get(f"CY{year}Q{q}I")
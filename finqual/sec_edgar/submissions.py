@@ -0,0 +1,207 @@
+"""
+Complete, typed SEC submissions history for one company.
+
+``https://data.sec.gov/submissions/CIK##########.json`` lists only the most
+recent filings (``filings.recent``, roughly the last thousand). Older filings
+live in additional pages named under ``filings.files``::
+
+    {"name": "CIK0000320193-submissions-001.json", "filingCount": 1234,
+     "filingFrom": "1994-01-26", "filingTo": "2014-06-20"}
+
+:class:`Submissions` reads the recent table eagerly and the older pages on
+demand (:meth:`Submissions.filings`), fetching only the pages whose date range
+overlaps the query, concurrently, under the shared SEC rate limiter. Rolled-over
+pages never change, so with ``FINQUAL_CACHE_DIR`` set they are cached
+permanently under ``submissions/``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Mapping
+
+import polars as pl
+import requests
+
+from finqual.config.cache import cache_dir
+from finqual.sec_edgar.filing_cache import FilingCache
+from finqual.sec_edgar.rate_limit import sec_limiter
+
+_SUBMISSIONS_URL = "https://data.sec.gov/submissions/"
+
+_REQUEST_TIMEOUT_SECS = 30
+
+# Older submission pages fetched concurrently; requests are still paced by the shared SEC rate limiter.
+_PAGE_FETCH_WORKERS = 4
+
+# Typed columns of a submissions table, in output order.
+SUBMISSION_SCHEMA = {
+    "accessionNumber": pl.Utf8,
+    "filingDate": pl.Date,
+    "reportDate": pl.Date,
+    "acceptanceDateTime": pl.Datetime("ms"),
+    "act": pl.Utf8,
+    "form": pl.Utf8,
+    "fileNumber": pl.Utf8,
+    "filmNumber": pl.Utf8,
+    "items": pl.Utf8,
+    "core_type": pl.Utf8,
+    "size": pl.Int64,
+    "isXBRL": pl.Boolean,
+    "isInlineXBRL": pl.Boolean,
+    "primaryDocument": pl.Utf8,
+    "primaryDocDescription": pl.Utf8,
+}
+
+
+def submissions_frame(table: Mapping[str, list]) -> pl.DataFrame:
+    """
+    Convert one columnar submissions table (``filings.recent`` or an older page) to a typed frame.
+
+    Columns missing from ``table`` are filled with nulls and unknown columns
+    are dropped, so frames from every page share :data:`SUBMISSION_SCHEMA`.
+    Empty date strings become null.
+    """
+    n_rows = len(table.get("accessionNumber", []))
+    raw = pl.DataFrame(
+        {col: table.get(col, [None] * n_rows) for col in SUBMISSION_SCHEMA},
+        schema={col: pl.Int64 if dtype in (pl.Int64, pl.Boolean) else pl.Utf8
+                for col, dtype in SUBMISSION_SCHEMA.items()},
+        strict=False,
+    )
+    return raw.select(
+        pl.col("accessionNumber"),
+        pl.col("filingDate", "reportDate").str.to_date("%Y-%m-%d", strict=False),
+        pl.col("acceptanceDateTime").str.to_datetime("%Y-%m-%dT%H:%M:%S%.fZ", time_unit="ms", strict=False),
+        pl.col("act", "form", "fileNumber", "filmNumber", "items", "core_type"),
+        pl.col("size"),
+        pl.col("isXBRL", "isInlineXBRL").cast(pl.Boolean),
+        pl.col("primaryDocument", "primaryDocDescription"),
+    )
+
+
+class Submissions:
+    """
+    One company's submissions: metadata, recent filings and older pages on demand.
+
+    Attributes
+    ----------
+    cik : str
+        Zero-padded 10-digit CIK.
+    payload : dict
+        The submissions JSON without its ``filings`` tables (name, SIC
+        description, tickers, ...).
+    recent : pl.DataFrame
+        Typed ``filings.recent`` table, newest first.
+    pages : list[dict]
+        Older page descriptors from ``filings.files`` (``name``,
+        ``filingCount``, ``filingFrom``, ``filingTo``).
+    """
+
+    def __init__(self, cik: str, payload: dict, headers: Mapping[str, str], cache: FilingCache | None = None):
+        """
+        Parameters
+        ----------
+        cik : str
+            Company CIK.
+        payload : dict
+            Parsed ``CIK##########.json`` submissions document.
+        headers : Mapping[str, str]
+            HTTP headers used for older pages.
+        cache : FilingCache | None, default=None
+            Page cache; defaults to ``$FINQUAL_CACHE_DIR/submissions`` when disk caching is enabled.
+        """
+        filings = payload.get("filings", {})
+        self.cik = str(cik).zfill(10)
+        self.payload = {k: v for k, v in payload.items() if k != "filings"}
+        self.recent = submissions_frame(filings.get("recent", {}))
+        self.pages: list[dict] = list(filings.get("files", []))
+        self.headers = headers
+
+        if cache is None and (root := cache_dir("submissions")) is not None:
+            cache = FilingCache(root)
+        self._cache = cache
+
+        self._lock = threading.Lock()
+        self._page_frames: dict[str, pl.DataFrame] = {}
+
+    @classmethod
+    @sec_limiter.limited
+    def fetch(cls, cik: str, headers: Mapping[str, str]) -> Submissions:
+        """Download the company's main submissions document (never cached: it changes with every filing)."""
+        url = f"{_SUBMISSIONS_URL}CIK{str(cik).zfill(10)}.json"
+        response = requests.get(url, headers=headers, timeout=_REQUEST_TIMEOUT_SECS)
+        response.raise_for_status()
+        return cls(cik, response.json(), headers)
+
+    # ------------------------------------------------------------------ #
+    # Older pages
+    # ------------------------------------------------------------------ #
+
+    def _load_page(self, name: str) -> pl.DataFrame:
+        """Return one older page as a typed frame, from memory, the page cache or the network."""
+        with self._lock:
+            if name in self._page_frames:
+                return self._page_frames[name]
+
+        content = self._cache.get(self.cik, name) if self._cache is not None else None
+        if content is None:
+            sec_limiter.acquire()
+            response = requests.get(_SUBMISSIONS_URL + name, headers=self.headers, timeout=_REQUEST_TIMEOUT_SECS)
+            response.raise_for_status()
+            content = response.content
+            if self._cache is not None:
+                self._cache.put(self.cik, name, content)
+
+        df = submissions_frame(json.loads(content))
+        with self._lock:
+            self._page_frames[name] = df
+        return df
+
+    def filings(self, since: date | None = None, max_workers: int = _PAGE_FETCH_WORKERS) -> pl.DataFrame:
+        """
+        Return every filing on or after ``since``, fetching older pages only when needed.
+
+        Parameters
+        ----------
+        since : date | None, default=None
+            Earliest filing date wanted. None returns the complete history.
+        max_workers : int, default=4
+            Older pages fetched concurrently.
+
+        Returns
+        -------
+        pl.DataFrame
+            Typed filings (:data:`SUBMISSION_SCHEMA`), newest first.
+        """
+        # Only pages whose filing range reaches back past the recent table, and
+        # forward past ``since``, can hold wanted filings.
+        oldest_recent = self.recent["filingDate"].min()
+        if since is not None and oldest_recent is not None and since >= oldest_recent:
+            names = []
+        else:
+            names = [
+                page["name"] for page in self.pages
+                if since is None or not page.get("filingTo") or date.fromisoformat(page["filingTo"]) >= since
+            ]
+
+        if not names:
+            df = self.recent
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                older = list(executor.map(self._load_page, names))
+            df = (
+                pl.concat([self.recent, *older], how="vertical")
+                .unique("accessionNumber", keep="first", maintain_order=True)
+                .sort("filingDate", descending=True, nulls_last=True, maintain_order=True)
+            )
+
+        if since is not None:
+            df = df.filter(pl.col("filingDate") >= since)
+        return df
+
+
+__all__ = ["Submissions", "submissions_frame", "SUBMISSION_SCHEMA"]
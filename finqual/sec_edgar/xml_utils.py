@@ -3,6 +3,8 @@ Shared helpers for SEC XML form parsing.
 
 Centralises:
 - ``gettext``               — namespace-aware safe text extraction.
+- ``fetch_document``        — rate-limited HTTP fetch, served from the filing cache when possible.
+- ``open_document``         — streaming variant of ``fetch_document`` for incremental parsers.
 - ``safe_get_xml``          — HTTP fetch with timeout, status handling and parse-error wrapping.
 
 Previously ``gettext`` was duplicated verbatim across :mod:`form_4` and
@@ -12,10 +14,14 @@ Previously ``gettext`` was duplicated verbatim across :mod:`form_4` and
 from __future__ import annotations
 
 import xml.etree.ElementTree as ET
-from typing import Mapping, Optional
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Mapping, Optional
 
 import requests
 
+from finqual.sec_edgar.filing_cache import FilingCache, archive_key
+from finqual.sec_edgar.rate_limit import sec_limiter
+
 # Default network timeout for SEC XML fetches.
 DEFAULT_TIMEOUT_SECS = 30
 
@@ -42,10 +48,115 @@ def gettext(parent: Optional[ET.Element], path: str, namespaces: Optional[Mappin
     return el.text if el is not None else None
 
 
+def fetch_document(url: str, headers: Mapping[str, str], timeout: int = DEFAULT_TIMEOUT_SECS,
+                   cache: FilingCache | None = None) -> bytes:
+    """
+    Return the body of ``url``, using the permanent filing cache for archive documents.
+
+    Filing documents (``/Archives/edgar/data/<CIK>/<accession>/<document>``)
+    are immutable, so a cached copy is returned without any request. Other
+    URLs are always fetched. Requests count against the shared
+    :data:`~finqual.sec_edgar.rate_limit.sec_limiter` budget.
+
+    Parameters
+    ----------
+    url : str
+        Target URL.
+    headers : Mapping[str, str]
+        HTTP headers (typically the project's :data:`sec_headers`).
+    timeout : int, default ``DEFAULT_TIMEOUT_SECS``
+        Network timeout in seconds.
+    cache : FilingCache, optional
+        Cache to use; defaults to :meth:`FilingCache.default` (enabled by ``FINQUAL_CACHE_DIR``).
+
+    Raises
+    ------
+    requests.HTTPError
+        If the HTTP response indicates failure.
+    """
+    cache = cache if cache is not None else FilingCache.default()
+    key = archive_key(url) if cache is not None else None
+
+    if key is not None:
+        content = cache.get(*key)
+        if content is not None:
+            return content
+
+    sec_limiter.acquire()
+    resp = requests.get(url, headers=dict(headers), timeout=timeout)
+    resp.raise_for_status()
+
+    if key is not None:
+        cache.put(*key, resp.content)
+    return resp.content
+
+
+def _stream_get(url: str, headers: Mapping[str, str], timeout: int) -> requests.Response:
+    """Issue a rate-limited streaming GET whose ``raw`` body is transparently decompressed."""
+    sec_limiter.acquire()
+    resp = requests.get(url, headers=dict(headers), timeout=timeout, stream=True)
+    try:
+        resp.raise_for_status()
+    except requests.HTTPError:
+        resp.close()
+        raise
+    resp.raw.decode_content = True
+    return resp
+
+
+@contextmanager
+def open_document(url: str, headers: Mapping[str, str], timeout: int = DEFAULT_TIMEOUT_SECS,
+                  cache: FilingCache | None = None) -> Iterator[BinaryIO]:
+    """
+    Open ``url`` as a binary stream without reading the whole body into memory.
+
+    Archive documents are streamed into the filing cache on a miss and then
+    read back from it; other URLs are read straight from the response.
+
+    Parameters
+    ----------
+    url : str
+        Target URL.
+    headers : Mapping[str, str]
+        HTTP headers (typically the project's :data:`sec_headers`).
+    timeout : int, default ``DEFAULT_TIMEOUT_SECS``
+        Network timeout in seconds.
+    cache : FilingCache, optional
+        Cache to use; defaults to :meth:`FilingCache.default`.
+
+    Yields
+    ------
+    BinaryIO
+        Readable binary stream of the document body.
+    """
+    cache = cache if cache is not None else FilingCache.default()
+    key = archive_key(url) if cache is not None else None
+
+    stream = None
+    if key is not None:
+        stream = cache.open(*key)
+        if stream is None:
+            with _stream_get(url, headers, timeout) as resp:
+                cache.put_stream(*key, resp.raw)
+            stream = cache.open(*key)
+
+    if stream is not None:
+        with stream:
+            yield stream
+        return
+
+    # No cache, or the cache could not be written: read from the response itself.
+    with _stream_get(url, headers, timeout) as resp:
+        yield resp.raw
+
+
 def safe_get_xml(url: str, headers: Mapping[str, str], timeout: int = DEFAULT_TIMEOUT_SECS) -> ET.Element:
     """
     Fetch ``url`` and return its parsed XML root element.
 
+    Fetched through :func:`fetch_document`, so filing documents are read from
+    the permanent filing cache when available.
+
     Parameters
     ----------
     url : str
@@ -67,9 +178,7 @@ def safe_get_xml(url: str, headers: Mapping[str, str], timeout: int = DEFAULT_TI
     xml.etree.ElementTree.ParseError
         If the response body is not valid XML.
     """
-    resp = requests.get(url, headers=dict(headers), timeout=timeout)
-    resp.raise_for_status()
-    return ET.fromstring(resp.content)
+    return ET.fromstring(fetch_document(url, headers, timeout))
 
 
-__all__ = ["gettext", "safe_get_xml", "DEFAULT_TIMEOUT_SECS"]
+__all__ = ["gettext", "fetch_document", "open_document", "safe_get_xml", "DEFAULT_TIMEOUT_SECS"]
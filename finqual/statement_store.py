@@ -0,0 +1,204 @@
+"""
+Persistent on-disk store for computed (standardised) financial statements.
+
+Building a statement from raw company facts walks every taxonomy tree and
+joins against the label mappings, which is the expensive part of a
+:class:`~finqual.core.Finqual` call. The result only changes when the company
+files a new report or finqual ships a new mapping, so computed frames are
+written to Parquet keyed by::
+
+    <root>/<finqual version>-<mapping digest>/<CIK>/<latest accession>/<statement>/<period>.parquet
+
+A new filing changes the latest accession and a new release changes the
+version directory, so stale entries are never read — they are simply orphaned
+and removed by :meth:`StatementStore.prune`.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os
+import shutil
+import tempfile
+from importlib.resources import files
+from pathlib import Path
+from typing import Callable, TypeVar
+
+import polars as pl
+
+from finqual.config.cache import cache_dir
+
+F = TypeVar("F", bound=Callable[..., pl.DataFrame])
+
+# Packaged mapping resources whose contents determine the computed statements.
+_MAPPING_FILES = (
+    "gaap_trees.json",
+    "ifrs_trees.json",
+    "gaap_labels.parquet",
+    "gaap_labels_v2.parquet",
+    "ifrs_labels.parquet",
+)
+
+
+@functools.cache
+def mapping_version() -> str:
+    """
+    Return ``"<finqual version>-<digest>"`` identifying the packaged mappings.
+
+    The digest covers the taxonomy trees and label files, so editing a mapping
+    invalidates stored statements even without a version bump.
+    """
+    from finqual import __version__
+
+    digest = hashlib.sha256()
+    data = files("finqual.data")
+    for name in _MAPPING_FILES:
+        resource = data / name
+        if resource.is_file():
+            digest.update(name.encode())
+            digest.update(resource.read_bytes())
+
+    return f"{__version__}-{digest.hexdigest()[:12]}"
+
+
+class StatementStore:
+    """
+    Parquet-backed store of computed statement frames.
+
+    Attributes
+    ----------
+    root : Path
+        Directory holding the store for the current :func:`mapping_version`.
+    """
+
+    def __init__(self, root: str | os.PathLike):
+        """
+        Parameters
+        ----------
+        root : str | os.PathLike
+            Base directory of the store. Versioned sub-directories are created
+            underneath it.
+        """
+        self.root = Path(root) / mapping_version()
+
+    @classmethod
+    def default(cls) -> StatementStore | None:
+        """Return a store under ``$FINQUAL_CACHE_DIR/statements``, or ``None`` if disk caching is disabled."""
+        root = cache_dir("statements")
+        return cls(root) if root is not None else None
+
+    def path(self, cik: str, accession: str, statement: str, period: str) -> Path:
+        """Return the Parquet path for a single statement entry."""
+        return self.root / cik / accession / statement / f"{period}.parquet"
+
+    def get(self, cik: str, accession: str, statement: str, period: str) -> pl.DataFrame | None:
+        """
+        Load a stored statement frame.
+
+        Returns
+        -------
+        pl.DataFrame | None
+            The stored frame, or ``None`` on a miss or an unreadable entry.
+        """
+        path = self.path(cik, accession, statement, period)
+        if not path.is_file():
+            return None
+
+        try:
+            return pl.read_parquet(path, memory_map=True)
+        except Exception:
+            # A truncated or foreign file is treated as a miss and overwritten later.
+            return None
+
+    def put(self, cik: str, accession: str, statement: str, period: str, df: pl.DataFrame) -> None:
+        """
+        Store a statement frame atomically.
+
+        Writing the first entry for a new accession prunes the company's older
+        accessions, since they can no longer be read.
+        """
+        path = self.path(cik, accession, statement, period)
+        accession_dir = self.root / cik / accession
+
+        try:
+            if not accession_dir.exists():
+                self.prune(cik, keep=accession)
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            os.close(fd)
+            try:
+                df.write_parquet(tmp)
+                os.replace(tmp, path)
+            finally:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+        except OSError:
+            # The store is an accelerator only; a read-only or full disk must not fail the call.
+            pass
+
+    def prune(self, cik: str, keep: str | None = None) -> int:
+        """
+        Remove stored accessions for ``cik`` other than ``keep``.
+
+        Returns
+        -------
+        int
+            Number of accession directories removed.
+        """
+        company_dir = self.root / cik
+        if not company_dir.is_dir():
+            return 0
+
+        removed = 0
+        for child in company_dir.iterdir():
+            if child.is_dir() and child.name != keep:
+                shutil.rmtree(child, ignore_errors=True)
+                removed += 1
+        return removed
+
+
+def persisted(statement: str) -> Callable[[F], F]:
+    """
+    Decorator serving a statement method from the owner's :class:`StatementStore`.
+
+    The decorated method's owner must expose ``statement_store``
+    (:class:`StatementStore` or ``None``), ``cik`` and ``latest_accession``.
+    The period key is built from the bound arguments, e.g. ``2024-None`` or
+    ``2024-3``; methods without arguments (TTM) use ``TTM``.
+
+    Parameters
+    ----------
+    statement : str
+        Statement type used in the store key (e.g. ``"income_stmt"``).
+    """
+
+    def wrapper(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def inner(self, *args, **kwargs):
+            store = getattr(self, "statement_store", None)
+            accession = getattr(self, "latest_accession", None)
+            if store is None or accession is None:
+                return func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            values = [str(v) for k, v in bound.arguments.items() if k != "self"]
+            period = "-".join(values) if values else "TTM"
+
+            df = store.get(self.cik, accession, statement, period)
+            if df is None:
+                df = func(self, *args, **kwargs)
+                store.put(self.cik, accession, statement, period, df)
+            return df
+
+        return inner  # type: ignore[return-value]
+
+    return wrapper
+
+
+__all__ = ["StatementStore", "mapping_version", "persisted"]
@@ -2,20 +2,209 @@
 Thin wrapper around StockTwits' batch quote endpoint.
 
 Returns a ``{ticker: previous_close}`` mapping for one or many tickers.
+
+All lookups go through a process-wide :class:`QuoteService`, which reuses one
+``cloudscraper`` session (so the anti-bot handshake happens once), merges
+tickers requested concurrently into batch calls, and caches quotes for a
+short TTL.
 """
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import Future
 from urllib.parse import quote
 
-import cloudscraper
-
 # Public StockTwits batch-quote endpoint.
 _STOCKTWITS_BATCH_URL = "https://ql.stocktwits.com/batch"
 
 # Network timeout for HTTP calls (seconds).
 _REQUEST_TIMEOUT_SECS = 30
 
+# Quote cache lifetime (seconds); previous-close prices change at most daily.
+_QUOTE_TTL_SECS = 300.0
+
+# How long the first caller waits for concurrent callers to join its batch (seconds).
+_BATCH_WINDOW_SECS = 0.05
+
+# Maximum symbols per batch request.
+_MAX_BATCH_SIZE = 100
+
+
+class QuoteService:
+    """
+    Shared, batching, TTL-caching client for StockTwits previous-close quotes.
+
+    The first caller with uncached tickers becomes the batch *leader*: it
+    waits ``batch_window`` seconds for concurrent callers to queue their
+    tickers, then fetches every queued ticker in as few requests as possible.
+    Other callers wait on per-ticker futures.
+
+    Attributes
+    ----------
+    ttl : float
+        Quote cache lifetime in seconds.
+    batch_window : float
+        Seconds the leader waits for concurrent requests to join its batch.
+    max_batch : int
+        Maximum symbols per request.
+    """
+
+    def __init__(self, ttl: float = _QUOTE_TTL_SECS, batch_window: float = _BATCH_WINDOW_SECS,
+                 max_batch: int = _MAX_BATCH_SIZE):
+        self.ttl = ttl
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()
+        self._scraper = None
+        self._cache: dict[str, tuple[float, float]] = {}  # ticker → (price, fetched_at)
+        self._pending: dict[str, Future] = {}
+        self._queue: list[str] = []
+        self._flushing = False
+
+    def _session(self):
+        """Return the shared scraper, creating it (and its handshake) once."""
+        with self._lock:
+            if self._scraper is None:
+                import cloudscraper  # deferred: slow to import and only needed for live quotes
+
+                self._scraper = cloudscraper.create_scraper()
+            return self._scraper
+
+    def _fetch(self, tickers: list[str]) -> dict[str, float]:
+        """Fetch previous closes for ``tickers`` in a single request."""
+        # URL-encode each symbol to defend against unusual characters.
+        encoded = ",".join(quote(t, safe="") for t in tickers)
+        url = f"{_STOCKTWITS_BATCH_URL}?symbols={encoded}"
+
+        response = self._session().get(url, timeout=_REQUEST_TIMEOUT_SECS)
+        response.raise_for_status()
+        payload = response.json()
+
+        last_prices: dict[str, float] = {}
+        for ticker in tickers:
+            entry = payload.get(ticker)
+            if entry is None or "PreviousClose" not in entry:
+                continue
+            last_prices[ticker] = entry["PreviousClose"]
+        return last_prices
+
+    def _fail(self, tickers: list[str], error: BaseException) -> None:
+        """Resolve the pending futures of ``tickers`` with ``error``."""
+        with self._lock:
+            futures = [f for f in (self._pending.pop(t, None) for t in tickers) if f is not None]
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+
+    def _flush(self) -> None:
+        """
+        Wait ``batch_window``, then drain the queue in ``max_batch`` chunks, resolving waiting futures.
+
+        Whatever happens, every queued future is resolved and ``_flushing``
+        is cleared: if the flush itself is interrupted (e.g. ``KeyboardInterrupt``),
+        the in-flight batch and the rest of the queue fail with a ``RuntimeError``
+        and the interruption propagates to the leader.
+        """
+        batch: list[str] = []
+        try:
+            time.sleep(self.batch_window)
+            while True:
+                with self._lock:
+                    batch = self._queue[:self.max_batch]
+                    del self._queue[:self.max_batch]
+                    if not batch:
+                        self._flushing = False
+                        return
+
+                try:
+                    prices = self._fetch(batch)
+                except Exception as e:
+                    self._fail(batch, e)
+                    continue
+
+                now = time.monotonic()
+                with self._lock:
+                    futures = []
+                    for t in batch:
+                        price = prices.get(t)
+                        if price is not None:
+                            self._cache[t] = (price, now)
+                        futures.append((self._pending.pop(t), price))
+                for future, price in futures:
+                    future.set_result(price)
+        except BaseException as e:
+            with self._lock:
+                stranded = batch + self._queue
+                self._queue.clear()
+                self._flushing = False
+            error = RuntimeError("Quote request was interrupted.")
+            error.__cause__ = e
+            self._fail(stranded, error)
+            raise
+
+    def get_quotes(self, tickers: list[str]) -> dict[str, float]:
+        """
+        Return previous closes for ``tickers``, from cache where fresh.
+
+        Parameters
+        ----------
+        tickers : list[str]
+            Ticker symbols.
+
+        Returns
+        -------
+        dict[str, float]
+            Ticker → ``PreviousClose``. Tickers absent from the response are omitted.
+        """
+        now = time.monotonic()
+        result: dict[str, float] = {}
+        waiting: dict[str, Future] = {}
+        leader = False
+
+        with self._lock:
+            for t in dict.fromkeys(tickers):
+                hit = self._cache.get(t)
+                if hit is not None and now - hit[1] < self.ttl:
+                    result[t] = hit[0]
+                    continue
+
+                future = self._pending.get(t)
+                if future is None:
+                    future = Future()
+                    self._pending[t] = future
+                    self._queue.append(t)
+                waiting[t] = future
+
+            if self._queue and not self._flushing:
+                self._flushing = True
+                leader = True
+
+        if leader:
+            self._flush()
+
+        for t, future in waiting.items():
+            price = future.result()
+            if price is not None:
+                result[t] = price
+
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached quotes."""
+        with self._lock:
+            self._cache.clear()
+
+
+_default_service = QuoteService()
+
+
+def quote_service() -> QuoteService:
+    """Return the process-wide :class:`QuoteService`."""
+    return _default_service
+
 
 class StockTwit:
     """
@@ -49,25 +238,13 @@ class StockTwit:
         """
         Retrieve the previous closing prices for the tickers.
 
+        Served by the shared :class:`QuoteService`, so repeated and concurrent
+        lookups reuse one session, batch together and hit the quote cache.
+
         Returns
         -------
         dict[str, float]
             Dictionary mapping ticker → ``PreviousClose``. Tickers absent
             from the response are silently omitted (rather than raising).
         """
-        # URL-encode each symbol to defend against unusual characters.
-        encoded = ",".join(quote(t, safe="") for t in self.tickers)
-        url = f"{_STOCKTWITS_BATCH_URL}?symbols={encoded}"
-
-        scraper = cloudscraper.create_scraper()
-        response = scraper.get(url, timeout=_REQUEST_TIMEOUT_SECS)
-        response.raise_for_status()
-        payload = response.json()
-
-        last_prices: dict[str, float] = {}
-        for ticker in self.tickers:
-            entry = payload.get(ticker)
-            if entry is None or "PreviousClose" not in entry:
-                continue
-            last_prices[ticker] = entry["PreviousClose"]
-        return last_prices
+        return quote_service().get_quotes(self.tickers)
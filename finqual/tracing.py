@@ -0,0 +1,408 @@
+"""
+Stage-level timing for the finqual pipeline.
+
+Spans are opened around each pipeline stage (SEC download and JSON parsing,
+``map_missing_frames``, ``convert_to_quarters``, tree evaluation, the label
+join, triangulation, ...) and carry a duration plus optional ``rows`` /
+``bytes`` counts. Finished spans go to pluggable exporters:
+
+- :class:`InMemoryExporter`   — keeps spans in a list (tests, notebooks).
+- :class:`JsonLinesExporter`  — one JSON object per span, to a file or stream.
+- :class:`PrometheusExporter` — per-stage counters in Prometheus text format.
+
+Tracing is off by default and then costs one context-variable lookup per
+stage. Turn it on for the current context only::
+
+    from finqual import tracing
+
+    exporter = tracing.InMemoryExporter()
+    with tracing.tracing(exporter):
+        Finqual("AAPL").income_stmt(2024)
+    print(exporter.totals())
+
+or process-wide with :func:`enable` / :func:`disable`. Context variables are
+not copied into ``ThreadPoolExecutor`` workers, so spans opened inside the
+``*_period`` worker pools are recorded only under :func:`enable`, as roots.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import itertools
+import json
+import os
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Callable, Iterator, Protocol, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Span:
+    """
+    One finished pipeline stage.
+
+    Attributes
+    ----------
+    name : str
+        Stage name, e.g. ``"sec.facts.download"``.
+    span_id : int
+        Process-unique id.
+    parent_id : int | None
+        Id of the enclosing span, None for a root.
+    start : float
+        Wall-clock start (seconds since the epoch).
+    duration : float
+        Elapsed seconds.
+    attributes : dict
+        Stage attributes such as ``rows``, ``bytes``, ``year`` or ``cik``.
+    error : str | None
+        Exception type name if the stage raised.
+    """
+
+    name: str
+    span_id: int
+    parent_id: int | None
+    start: float
+    duration: float
+    attributes: dict = field(default_factory=dict)
+    error: str | None = None
+
+
+class Exporter(Protocol):
+    """Anything with an ``export(span)`` method can receive finished spans."""
+
+    def export(self, span: Span) -> None: ...
+
+
+# ---------------------------------------------------------------------------
+# Exporters
+# ---------------------------------------------------------------------------
+
+class InMemoryExporter:
+    """Collect finished spans in memory."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    def totals(self) -> dict[str, dict[str, float]]:
+        """Per-stage ``count``, total ``seconds``, ``rows`` and ``bytes``, slowest stage first."""
+        totals: dict[str, dict[str, float]] = {}
+        with self._lock:
+            for span in self.spans:
+                entry = totals.setdefault(span.name, {"count": 0, "seconds": 0.0, "rows": 0, "bytes": 0})
+                entry["count"] += 1
+                entry["seconds"] += span.duration
+                entry["rows"] += span.attributes.get("rows", 0)
+                entry["bytes"] += span.attributes.get("bytes", 0)
+        return dict(sorted(totals.items(), key=lambda item: item[1]["seconds"], reverse=True))
+
+
+class JsonLinesExporter:
+    """
+    Write each finished span as one JSON line.
+
+    Parameters
+    ----------
+    target : str | Path | IO[str]
+        File path (opened for append) or an open text stream.
+    """
+
+    def __init__(self, target: str | Path | IO[str]):
+        self._lock = threading.Lock()
+        if isinstance(target, (str, Path)):
+            self._stream = open(target, "a", encoding="utf-8")
+            self._owned = True
+        else:
+            self._stream = target
+            self._owned = False
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(asdict(span), default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self) -> None:
+        if self._owned:
+            self._stream.close()
+
+
+class PrometheusExporter:
+    """
+    Aggregate spans into per-stage counters and render them in Prometheus text format.
+
+    Metrics, each labelled by ``stage``: ``<prefix>_stage_seconds_total``,
+    ``<prefix>_stage_calls_total``, ``<prefix>_stage_errors_total``,
+    ``<prefix>_stage_rows_total`` and ``<prefix>_stage_bytes_total``.
+    """
+
+    _METRICS = (
+        ("seconds", "Total seconds spent in the stage."),
+        ("calls", "Number of times the stage ran."),
+        ("errors", "Number of times the stage raised."),
+        ("rows", "Rows produced by the stage."),
+        ("bytes", "Bytes read by the stage."),
+    )
+
+    def __init__(self, prefix: str = "finqual"):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[str, float]] = {}
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            c = self._counters.setdefault(span.name, dict.fromkeys(("seconds", "calls", "errors", "rows", "bytes"), 0))
+            c["seconds"] += span.duration
+            c["calls"] += 1
+            c["errors"] += span.error is not None
+            c["rows"] += span.attributes.get("rows", 0)
+            c["bytes"] += span.attributes.get("bytes", 0)
+
+    def render(self) -> str:
+        """Return the current counters as Prometheus exposition text."""
+        with self._lock:
+            counters = {name: dict(c) for name, c in sorted(self._counters.items())}
+
+        lines = []
+        for metric, help_text in self._METRICS:
+            full_name = f"{self.prefix}_stage_{metric}_total"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} counter")
+            for stage, c in counters.items():
+                value = c[metric]
+                lines.append(f'{full_name}{{stage="{stage}"}} {value:.6f}' if metric == "seconds"
+                             else f'{full_name}{{stage="{stage}"}} {int(value)}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> None:
+        """Atomically write :meth:`render` to ``path`` (e.g. for node_exporter's textfile collector)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render())
+            os.replace(tmp, path)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+
+# ---------------------------------------------------------------------------
+# Tracer state
+# ---------------------------------------------------------------------------
+
+_ids = itertools.count(1)
+
+# Exporters enabled process-wide; a ``tracing()`` block overrides them for its context.
+_global_exporters: tuple[Exporter, ...] = ()
+_scoped_exporters: ContextVar[tuple[Exporter, ...] | None] = ContextVar("finqual_trace_exporters", default=None)
+_current: ContextVar[_ActiveSpan | None] = ContextVar("finqual_trace_span", default=None)
+
+
+def _exporters() -> tuple[Exporter, ...]:
+    scoped = _scoped_exporters.get()
+    return _global_exporters if scoped is None else scoped
+
+
+def is_enabled() -> bool:
+    """True when spans opened in the current context are recorded."""
+    return bool(_exporters())
+
+
+def enable(*exporters: Exporter) -> None:
+    """Record spans process-wide (in every thread) to ``exporters``."""
+    global _global_exporters
+    _global_exporters = tuple(exporters)
+
+
+def disable() -> None:
+    """Stop process-wide recording (``tracing()`` blocks are unaffected)."""
+    global _global_exporters
+    _global_exporters = ()
+
+
+@contextlib.contextmanager
+def tracing(*exporters: Exporter) -> Iterator[None]:
+    """Record spans to ``exporters`` for the duration of the block, in the current context only."""
+    token = _scoped_exporters.set(tuple(exporters))
+    try:
+        yield
+    finally:
+        _scoped_exporters.reset(token)
+
+
+# ---------------------------------------------------------------------------
+# Spans
+# ---------------------------------------------------------------------------
+
+class _NoopSpan:
+    """Stand-in returned by :func:`span` while tracing is off."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def reader(self, stream: IO[bytes]) -> IO[bytes]:
+        return stream
+
+
+_NOOP = _NoopSpan()
+
+
+class _TimedReader:
+    """Binary stream wrapper that charges the time spent in ``read`` to a span's ``read_seconds``."""
+
+    __slots__ = ("_stream", "_span")
+
+    def __init__(self, stream: IO[bytes], span: _ActiveSpan):
+        self._stream = stream
+        self._span = span
+
+    def read(self, size: int = -1) -> bytes:
+        t0 = time.perf_counter()
+        try:
+            return self._stream.read(size)
+        finally:
+            self._span.attributes["read_seconds"] += time.perf_counter() - t0
+
+    def __getattr__(self, name: str):
+        return getattr(self._stream, name)
+
+
+class _ActiveSpan:
+    __slots__ = ("name", "span_id", "parent_id", "attributes", "exporters", "_start", "_t0", "_token")
+
+    def __init__(self, name: str, attributes: dict, exporters: tuple[Exporter, ...]):
+        self.name = name
+        self.attributes = attributes
+        self.exporters = exporters
+
+    def __enter__(self) -> _ActiveSpan:
+        parent = _current.get()
+        self.span_id = next(_ids)
+        self.parent_id = parent.span_id if parent is not None else None
+        self._token = _current.set(self)
+        self._start = time.time()
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        duration = time.perf_counter() - self._t0
+        _current.reset(self._token)
+        if "read_seconds" in self.attributes:
+            # A streamed stage interleaves reading and parsing; the time not spent waiting on reads is parsing.
+            self.attributes["parse_seconds"] = max(duration - self.attributes["read_seconds"], 0.0)
+        finished = Span(
+            name=self.name,
+            span_id=self.span_id,
+            parent_id=self.parent_id,
+            start=self._start,
+            duration=duration,
+            attributes=self.attributes,
+            error=exc_type.__name__ if exc_type is not None else None,
+        )
+        for exporter in self.exporters:
+            try:
+                exporter.export(finished)
+            except Exception as e:
+                print(f"[finqual.tracing] {type(exporter).__name__} failed: {e}")
+
+    def set(self, **attributes) -> None:
+        """Attach or update attributes (e.g. ``rows=``, ``bytes=``) before the span ends."""
+        self.attributes.update(attributes)
+
+    def reader(self, stream: IO[bytes]) -> IO[bytes]:
+        """
+        Wrap the stage's input ``stream`` so read time is split from processing time.
+
+        The span then records ``read_seconds`` (time blocked in ``stream.read``)
+        and ``parse_seconds`` (the rest of the span's duration).
+        """
+        self.attributes.setdefault("read_seconds", 0.0)
+        return _TimedReader(stream, self)
+
+
+def span(name: str, **attributes) -> _ActiveSpan | _NoopSpan:
+    """
+    Time a block as one pipeline stage.
+
+    Parameters
+    ----------
+    name : str
+        Stage name.
+    **attributes
+        Initial span attributes; more can be added with ``.set(...)``.
+
+    Returns
+    -------
+    context manager
+        Yields an object with ``set(**attributes)`` and ``reader(stream)``;
+        a shared no-op while tracing is off.
+    """
+    exporters = _exporters()
+    if not exporters:
+        return _NOOP
+    return _ActiveSpan(name, attributes, exporters)
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Decorator form of :func:`span`; the wrapped call is the stage."""
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            exporters = _exporters()
+            if not exporters:
+                return fn(*args, **kwargs)
+            with _ActiveSpan(name, {}, exporters):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def pipe_stage(lf, name: str, fn: Callable, *args):
+    """
+    Apply ``fn`` to a polars LazyFrame as a separately timed stage.
+
+    While tracing is off this is ``fn(lf, *args)`` and the query plan stays
+    fused. While tracing is on, the stage is collected inside its own span
+    (recording ``rows``) and handed on as a LazyFrame, so per-stage timings
+    come at the cost of cross-stage query optimisation.
+    """
+    exporters = _exporters()
+    if not exporters:
+        return fn(lf, *args)
+    with _ActiveSpan(name, {}, exporters) as s:
+        df = fn(lf, *args).collect()
+        s.set(rows=df.height)
+    return df.lazy()
+
+
+__all__ = [
+    "Span", "Exporter", "InMemoryExporter", "JsonLinesExporter", "PrometheusExporter",
+    "span", "traced", "pipe_stage", "tracing", "enable", "disable", "is_enabled",
+]
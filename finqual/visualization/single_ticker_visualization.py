@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 from finqual.core import Finqual
 import pandas as pd
 
@@ -38,7 +37,9 @@ def plot_profitability_ratios(
 
     df_plot = df_plot.sort_index()
 
-    # Plot
+    # Plot (matplotlib is imported only when a chart is actually drawn)
+    import matplotlib.pyplot as plt
+
     df_plot.plot(
         title=f"{ticker} Profitability Ratios ({start_year}–{end_year})", marker="o"
     )
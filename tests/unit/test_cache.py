@@ -0,0 +1,97 @@
+"""Unit tests for ``finqual._cache``."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from finqual._cache import SingleFlight, weak_lru
+
+
+def test_single_flight_shares_one_computation():
+    flight = SingleFlight()
+    calls = []
+    gate = threading.Event()
+
+    def slow():
+        calls.append(1)
+        gate.wait(timeout=2)
+        return 42
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flight.do, "k", slow) for _ in range(4)]
+        time.sleep(0.05)
+        gate.set()
+        results = [f.result() for f in futures]
+
+    assert results == [42] * 4
+    assert len(calls) == 1
+    assert len(flight) == 0
+
+
+def test_single_flight_propagates_exception_to_waiters():
+    flight = SingleFlight()
+    gate = threading.Event()
+
+    def boom():
+        gate.wait(timeout=2)
+        raise RuntimeError("failed")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(flight.do, "k", boom) for _ in range(2)]
+        time.sleep(0.05)
+        gate.set()
+        for f in futures:
+            with pytest.raises(RuntimeError):
+                f.result()
+
+    # The key is released, so a retry runs again.
+    assert flight.do("k", lambda: "ok") == "ok"
+
+
+def test_weak_lru_coalesces_concurrent_misses():
+    gate = threading.Event()
+
+    class Statement:
+        def __init__(self):
+            self.calls = 0
+
+        @weak_lru(maxsize=4)
+        def compute(self, year, quarter=None):
+            self.calls += 1
+            gate.wait(timeout=2)
+            return (year, quarter)
+
+    stmt = Statement()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(stmt.compute, 2024, 3) for _ in range(4)]
+        time.sleep(0.05)
+        gate.set()
+        assert [f.result() for f in futures] == [(2024, 3)] * 4
+
+    assert stmt.calls == 1
+    # Subsequent calls are served by the LRU cache.
+    assert stmt.compute(2024, 3) == (2024, 3)
+    assert stmt.calls == 1
+
+
+def test_weak_lru_hits_bypass_single_flight(monkeypatch):
+    flights = []
+    do = SingleFlight.do
+
+    def counting_do(self, key, fn, *args, **kwargs):
+        flights.append(key)
+        return do(self, key, fn, *args, **kwargs)
+
+    monkeypatch.setattr(SingleFlight, "do", counting_do)
+
+    class Statement:
+        @weak_lru(maxsize=4)
+        def compute(self, year):
+            return year
+
+    stmt = Statement()
+    assert [stmt.compute(2024) for _ in range(5)] == [2024] * 5
+    assert len(flights) == 1
+    assert Statement.compute.cache_info().hits == 4
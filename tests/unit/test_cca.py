@@ -0,0 +1,96 @@
+"""Unit tests for ``finqual.cca.CCA`` peer pooling (no network)."""
+
+import threading
+
+import polars as pl
+
+import finqual.cca as cca_module
+from finqual.cca import CCA
+from finqual._cache import SingleFlight
+
+
+class FakeFinqual:
+    """Stand-in for ``Finqual`` counting constructions."""
+
+    created = []
+    lock = threading.Lock()
+
+    def __init__(self, ticker):
+        with FakeFinqual.lock:
+            FakeFinqual.created.append(ticker)
+        self.ticker = ticker
+
+    def profitability_ratios(self, year, quarter):
+        if self.ticker == "BAD":
+            raise RuntimeError("boom")
+        return pl.DataFrame({"Period": [str(year)], "ROE": [len(self.ticker) / 10]})
+
+    liquidity_ratios = profitability_ratios
+
+
+def make_cca(monkeypatch, peers):
+    FakeFinqual.created = []
+    monkeypatch.setattr(cca_module, "Finqual", FakeFinqual)
+
+    cca = CCA.__new__(CCA)
+    cca.ticker = peers[0]
+    cca.max_workers = 4
+    cca._peers = {}
+    cca._pool_lock = threading.Lock()
+    cca._peer_flight = SingleFlight()
+    cca.get_c = lambda n=None: tuple(peers)
+    return cca
+
+
+def test_peers_are_reused_across_methods(monkeypatch):
+    cca = make_cca(monkeypatch, ["AAPL", "MSFT", "GOOG"])
+
+    cca._get_ratios(2024, "profitability_ratios")
+    cca._get_ratios(2024, "liquidity_ratios")
+
+    assert sorted(FakeFinqual.created) == ["AAPL", "GOOG", "MSFT"]
+
+
+def test_results_keep_peer_order_and_skip_failures(monkeypatch, capsys):
+    cca = make_cca(monkeypatch, ["MSFT", "BAD", "A"])
+
+    df = cca._get_ratios(2024, "profitability_ratios")
+
+    assert df["Ticker"].to_list() == ["MSFT", "A"]
+    assert "Skipping BAD" in capsys.readouterr().out
+
+
+def test_peer_statistics_per_period_and_ratio():
+    import math
+    from finqual.cca import peer_statistics
+
+    df = pl.DataFrame({
+        "Ticker": ["A", "B", "C", "D", "A", "B"],
+        "Period": ["2024", "2024", "2024", "2024", "2023", "2023"],
+        "ROE": [0.1, 0.2, 0.3, 0.4, 0.5, float("nan")],
+        "ROA": [1.0, 1.0, 2.0, 3.0, 1.0, 2.0],
+    })
+    out = peer_statistics(df, "B").collect()
+
+    roe = out.filter((pl.col("Period") == "2024") & (pl.col("Ratio") == "ROE")).row(0, named=True)
+    assert roe["Peers"] == 4
+    assert math.isclose(roe["Median"], 0.25)
+    assert math.isclose(roe["P25"], 0.175)
+    assert roe["Target"] == 0.2
+    assert roe["Target Percentile"] == 37.5  # one below, itself counted as half, of four
+
+    roa = out.filter((pl.col("Period") == "2024") & (pl.col("Ratio") == "ROA")).row(0, named=True)
+    assert roa["Target Percentile"] == 25.0  # tie with A
+
+    # NaN target values are excluded, leaving no target rank.
+    roe_2023 = out.filter((pl.col("Period") == "2023") & (pl.col("Ratio") == "ROE")).row(0, named=True)
+    assert roe_2023["Peers"] == 1 and roe_2023["Target"] is None and roe_2023["Target Percentile"] is None
+
+    assert out["Period"].to_list()[0] == "2024"
+
+
+def test_summary_through_cca(monkeypatch):
+    cca = make_cca(monkeypatch, ["MSFT", "A", "GOOG"])
+    out = cca._get_ratios(2024, "profitability_ratios", summary=True)
+    assert out.columns[:3] == ["Period", "Ratio", "Peers"]
+    assert out.row(0, named=True)["Target"] == 0.4
@@ -0,0 +1,163 @@
+"""Unit tests for ``finqual.sec_edgar.company`` (network stubbed)."""
+
+import gzip
+import io
+import json
+import threading
+import time
+
+import polars as pl
+import pytest
+import requests
+
+import finqual.sec_edgar.company as company
+import finqual.sec_edgar.submissions as submissions
+from finqual.form_parsers import FinqualForms
+from finqual.sec_edgar.company import clear_company_cache, company_submissions, resolve_company
+from finqual.sec_edgar.entities.exceptions import CompanyIdCodeNotFoundError
+from finqual.sec_edgar.sec_api import SecApi
+
+SUBMISSIONS = {
+    "cik": "1045810",
+    "name": "NVIDIA CORP",
+    "tickers": ["NVDA"],
+    "exchanges": ["Nasdaq"],
+    "sicDescription": "Semiconductors & Related Devices",
+    "filings": {
+        "recent": {
+            "accessionNumber": ["0001045810-24-000001", "0001045810-24-000002"],
+            "form": ["4", "10-K"],
+            "filingDate": ["2024-06-01", "2024-02-21"],
+            "reportDate": ["2024-05-30", "2024-01-28"],
+            "primaryDocument": ["form4.xml", "nvda-20240128.htm"],
+            "primaryDocDescription": ["FORM 4", "10-K"],
+        },
+        "files": [],
+    },
+}
+
+TICKERS = {"fields": ["cik", "name", "ticker", "exchange"], "data": [[320193, "Apple Inc.", "AAPL", "Nasdaq"],
+                                                                   [1045810, "NVIDIA CORP", "NVDA", "Nasdaq"]]}
+
+
+class Response:
+    def __init__(self, body, status_code=200):
+        self.content = json.dumps(body).encode()
+        self.raw = io.BytesIO(gzip.compress(self.content))
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(response=self)
+
+    def json(self):
+        return json.loads(self.content)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+@pytest.fixture
+def requested(monkeypatch):
+    clear_company_cache()
+    urls = []
+    lock = threading.Lock()
+
+    def fake_get(url, headers, timeout, stream=False):
+        with lock:
+            urls.append(url)
+        time.sleep(0.01)
+        if url.endswith("company_tickers_exchange.json"):
+            return Response(TICKERS)
+        if url.endswith("CIK0001045810.json"):
+            return Response(SUBMISSIONS)
+        return Response({}, status_code=404)
+
+    monkeypatch.setattr(company.requests, "get", fake_get)
+    monkeypatch.setattr(submissions.requests, "get", fake_get)
+    yield urls
+    clear_company_cache()
+
+
+def test_cik_resolution_reuses_the_submissions_download(requested):
+    identity = resolve_company("1045810")
+
+    assert (identity.cik, identity.ticker, identity.name) == ("0001045810", "NVDA", "NVIDIA CORP")
+    assert company_submissions(1045810).recent.height == 2
+    assert len(requested) == 1
+
+
+def test_ticker_resolution_is_cached(requested):
+    assert resolve_company("nvda").cik == "0001045810"
+    assert resolve_company("NVDA") is resolve_company(" nvda ")
+    assert sum(url.endswith("company_tickers_exchange.json") for url in requested) == 1
+
+    with pytest.raises(CompanyIdCodeNotFoundError):
+        resolve_company("ZZZZ")
+    with pytest.raises(CompanyIdCodeNotFoundError):
+        resolve_company("1")
+
+
+def test_concurrent_callers_share_one_download(requested):
+    threads = [threading.Thread(target=company_submissions, args=("1045810",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(requested) == 1
+
+
+def test_submissions_refetched_after_ttl(requested, monkeypatch):
+    first = company_submissions("1045810")
+    monkeypatch.setattr(company, "SUBMISSIONS_TTL_SECS", 0)
+    assert company_submissions("1045810") is not first
+    assert len(requested) == 2
+
+
+def test_sec_api_and_forms_share_one_cold_start(requested):
+    forms = FinqualForms("NVDA")
+
+    api = SecApi.__new__(SecApi)
+    api.headers = {}
+    api.id_data = api.get_id_code("NVDA")
+    summary = api.process_company_submissions()
+
+    # One ticker lookup and one submissions download between both classes.
+    assert len(requested) == 2
+    assert forms.submissions is company_submissions(api.id_data.cik)
+    assert (summary.latest_10k, summary.report_date, summary.sector) == (
+        2024, "2024-01-28", "Semiconductors & Related Devices"
+    )
+    assert summary.latest_accession == "0001045810-24-000002"
+
+
+def test_latest_accession_includes_amendments(requested, monkeypatch):
+    recent = {k: list(v) for k, v in SUBMISSIONS["filings"]["recent"].items()}
+    amendment = {"accessionNumber": "0001045810-24-000003", "form": "10-K/A", "filingDate": "2024-07-01",
+                 "reportDate": "2024-01-28", "primaryDocument": "nvda-10ka.htm", "primaryDocDescription": "10-K/A"}
+    for k, v in amendment.items():
+        recent[k].insert(0, v)
+    monkeypatch.setitem(SUBMISSIONS, "filings", {"recent": recent, "files": []})
+
+    api = SecApi.__new__(SecApi)
+    api.headers = {}
+    api.id_data = api.get_id_code("1045810")
+    summary = api.process_company_submissions()
+
+    assert summary.latest_accession == "0001045810-24-000003"
+    # The amendment changes the cache key only; the original 10-K stays the reference report.
+    assert (summary.latest_10k, summary.report_date) == (2024, "2024-01-28")
+
+
+def test_sec_api_reports_keep_string_report_dates(requested):
+    api = SecApi.__new__(SecApi)
+    api.headers = {}
+    api.id_data = api.get_id_code("1045810")
+
+    reports = api.process_company_submissions().reports
+    assert reports["reportDate"].dtype == pl.Utf8
+    assert reports["reportDate"].to_list() == ["2024-01-28"]
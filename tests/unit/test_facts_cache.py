@@ -0,0 +1,51 @@
+"""Unit tests for ``finqual.sec_edgar.facts_cache`` and its use by ``SecApi``."""
+
+from types import SimpleNamespace
+
+import polars as pl
+
+import finqual.sec_edgar.sec_api as sec_api
+from finqual.sec_edgar.entities.models import CompanyFacts, CompanyIdCode
+from finqual.sec_edgar.facts_cache import FactsCache
+from finqual.sec_edgar.sec_api import SecApi
+
+
+def facts(value=1.0):
+    return CompanyFacts(sec_data=pl.DataFrame({"key": ["Revenues"], "val": [value]}),
+                        taxonomy="us-gaap", currency="USD", dei={"EntityCommonStockSharesOutstanding": {}})
+
+
+def test_round_trip_and_older_accessions_dropped(tmp_path):
+    cache = FactsCache(tmp_path)
+    assert cache.get("0000000001", "a1") is None
+
+    cache.put("0000000001", "a1", facts(1.0))
+    hit = cache.get("0000000001", "a1")
+    assert hit.sec_data.equals(facts(1.0).sec_data)
+    assert (hit.taxonomy, hit.currency, hit.dei) == ("us-gaap", "USD", facts().dei)
+
+    cache.put("0000000001", "a2", facts(2.0))
+    assert cache.get("0000000001", "a1") is None
+    assert cache.get("0000000001", "a2").sec_data["val"].to_list() == [2.0]
+
+
+def test_sec_api_downloads_facts_once_per_xbrl_filing(monkeypatch, tmp_path):
+    monkeypatch.setenv("FINQUAL_CACHE_DIR", str(tmp_path))
+    recent = pl.DataFrame({"accessionNumber": ["f4", "k1"], "isXBRL": [False, True], "isInlineXBRL": [False, True]})
+    monkeypatch.setattr(sec_api, "company_submissions", lambda cik, headers: SimpleNamespace(recent=recent))
+
+    downloads = []
+    api = SecApi.__new__(SecApi)
+    api.headers = {}
+    api.id_data = CompanyIdCode(cik="0000000001", name="Test", ticker="TST", exchange=None)
+    api.process_company_facts = lambda: downloads.append(1) or facts()
+
+    assert api.latest_xbrl_accession() == "k1"
+    first = api.load_company_facts()
+    second = api.load_company_facts()
+    assert len(downloads) == 1
+    assert second.sec_data.equals(first.sec_data)
+
+    monkeypatch.delenv("FINQUAL_CACHE_DIR")
+    api.load_company_facts()
+    assert len(downloads) == 2
@@ -0,0 +1,80 @@
+"""Unit tests for ``finqual.sec_edgar.filing_cache`` and cached document fetches."""
+
+import os
+
+import pytest
+
+import finqual.sec_edgar.xml_utils as xml_utils
+from finqual.sec_edgar.filing_cache import FilingCache, archive_key
+
+URL = "https://www.sec.gov/Archives/edgar/data/1045810/000104581025000123/wk-form4_1.xml"
+
+
+def test_archive_key_parses_filing_urls():
+    assert archive_key(URL) == ("000104581025000123", "wk-form4_1.xml")
+    assert archive_key("https://www.sec.gov/Archives/edgar/data/1045810/0001045810-25-000123/a.xml") == (
+        "000104581025000123", "a.xml")
+    assert archive_key("https://data.sec.gov/submissions/CIK0001045810.json") is None
+    assert archive_key("https://www.sec.gov/Archives/edgar/data/1045810/000104581025000123/") is None
+
+
+def test_round_trip_is_compressed(tmp_path):
+    cache = FilingCache(tmp_path)
+    content = b"<xml>" + b"a" * 10_000 + b"</xml>"
+    assert cache.get("0001045810-25-000123", "doc.xml") is None
+
+    cache.put("0001045810-25-000123", "doc.xml", content)
+    assert cache.get("000104581025000123", "doc.xml") == content
+    assert cache.size() < len(content)
+
+
+def test_prune_removes_least_recently_used(tmp_path):
+    cache = FilingCache(tmp_path)
+    for i in range(3):
+        cache.put(f"{i:018d}", "doc.xml", os.urandom(1000))
+        os.utime(cache.path(f"{i:018d}", "doc.xml"), (i, i))
+
+    cache.get(f"{0:018d}", "doc.xml")  # refreshes entry 0
+    removed = cache.prune(max_bytes=cache.size() - 1)
+
+    assert removed == 1
+    assert cache.get(f"{1:018d}", "doc.xml") is None
+    assert cache.get(f"{0:018d}", "doc.xml") is not None
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+def test_fetch_document_serves_archive_documents_from_cache(tmp_path, monkeypatch):
+    requests_made = []
+
+    def fake_get(url, headers, timeout):
+        requests_made.append(url)
+        return FakeResponse(b"<root><a>1</a></root>")
+
+    monkeypatch.setattr(xml_utils.requests, "get", fake_get)
+    cache = FilingCache(tmp_path)
+
+    assert xml_utils.fetch_document(URL, {}, cache=cache) == b"<root><a>1</a></root>"
+    assert xml_utils.fetch_document(URL, {}, cache=cache) == b"<root><a>1</a></root>"
+    assert len(requests_made) == 1
+
+    # Mutable endpoints are never cached.
+    other = "https://data.sec.gov/submissions/CIK0001045810.json"
+    xml_utils.fetch_document(other, {}, cache=cache)
+    xml_utils.fetch_document(other, {}, cache=cache)
+    assert len(requests_made) == 3
+
+
+def test_safe_get_xml_uses_env_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("FINQUAL_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(xml_utils.requests, "get", lambda *a, **k: FakeResponse(b"<root><a>hi</a></root>"))
+    assert xml_utils.safe_get_xml(URL, {}).find("a").text == "hi"
+
+    monkeypatch.setattr(xml_utils.requests, "get", lambda *a, **k: pytest.fail("should be cached"))
+    assert xml_utils.safe_get_xml(URL, {}).find("a").text == "hi"
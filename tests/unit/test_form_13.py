@@ -0,0 +1,146 @@
+"""Unit tests for ``finqual.form_13`` streaming information-table parsing."""
+
+import io
+
+import polars as pl
+import pytest
+
+from finqual.form_13 import aggregate_holdings, parse_amendment_type, parse_information_table, position_changes
+
+INFO_TABLE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable">
+  <infoTable>
+    <nameOfIssuer>APPLE INC</nameOfIssuer><titleOfClass>COM</titleOfClass><cusip>037833100</cusip>
+    <value>1000</value><shrsOrPrnAmt><sshPrnamt>50</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>
+  </infoTable>
+  <infoTable>
+    <nameOfIssuer>APPLE INC</nameOfIssuer><titleOfClass>COM</titleOfClass><cusip>037833100</cusip>
+    <value>500</value><shrsOrPrnAmt><sshPrnamt>25</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>
+  </infoTable>
+  <infoTable>
+    <nameOfIssuer>APPLE INC</nameOfIssuer><titleOfClass>COM</titleOfClass><cusip>037833100</cusip>
+    <value>250</value><shrsOrPrnAmt><sshPrnamt>10</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>
+    <putCall>PUT</putCall>
+  </infoTable>
+  <infoTable>
+    <nameOfIssuer>NVIDIA CORP</nameOfIssuer><titleOfClass>COM</titleOfClass><cusip>67066G104</cusip>
+    <value></value><shrsOrPrnAmt><sshPrnamt>5</sshPrnamt><sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>
+  </infoTable>
+</informationTable>
+"""
+
+
+def test_parse_information_table_rows():
+    df = parse_information_table(io.BytesIO(INFO_TABLE))
+    assert df.columns == ["CUSIP", "Issuer", "TitleOfClass", "AssetType", "Shares", "Value_USD"]
+    assert df["AssetType"].to_list() == ["Equity", "Equity", "Put", "Equity"]
+    assert df["Shares"].to_list() == [50.0, 25.0, 10.0, 5.0]
+    assert df["Value_USD"].to_list() == [1_000_000.0, 500_000.0, 250_000.0, 0.0]
+
+
+def test_prefixed_namespace_is_supported():
+    xml = INFO_TABLE.replace(b"<informationTable xmlns=", b"<n1:informationTable xmlns:n1=")
+    xml = xml.replace(b"</informationTable>", b"</n1:informationTable>")
+    for tag in (b"infoTable", b"nameOfIssuer", b"titleOfClass", b"cusip", b"value", b"shrsOrPrnAmt",
+                b"sshPrnamtType", b"sshPrnamt", b"putCall"):
+        xml = xml.replace(b"<" + tag + b">", b"<n1:" + tag + b">").replace(b"</" + tag + b">", b"</n1:" + tag + b">")
+    assert parse_information_table(io.BytesIO(xml)).height == 4
+
+
+def test_non_numeric_amounts_raise():
+    xml = INFO_TABLE.replace(b"<sshPrnamt>25</sshPrnamt>", b"<sshPrnamt>25 SH</sshPrnamt>", 1)
+    with pytest.raises(ValueError, match="037833100"):
+        parse_information_table(io.BytesIO(xml))
+
+    padded = INFO_TABLE.replace(b"<value>500</value>", b"<value> 500\n</value>", 1)
+    assert parse_information_table(io.BytesIO(padded))["Value_USD"][1] == 500_000.0
+
+
+def test_aggregate_holdings():
+    agg = aggregate_holdings(parse_information_table(io.BytesIO(INFO_TABLE)))
+    top = agg.row(0, named=True)
+    assert (top["CUSIP"], top["AssetType"], top["TotalShares"], top["TotalValue_USD"]) == (
+        "037833100", "Equity", 75.0, 1_500_000.0)
+    assert abs(agg["PortfolioWeight"].sum() - 1.0) < 1e-12
+    assert agg.height == 3
+
+
+def test_empty_table():
+    empty = b'<informationTable xmlns="http://www.sec.gov/edgar/document/thirteenf/informationtable"/>'
+    assert aggregate_holdings(parse_information_table(io.BytesIO(empty))).is_empty()
+    assert isinstance(aggregate_holdings(pl.DataFrame()), pl.DataFrame)
+
+
+def quarter(report_date, accession, positions, filing_date=None):
+    return pl.DataFrame({
+        "CUSIP": list(positions),
+        "Issuer": [f"ISSUER {c}" for c in positions],
+        "TitleOfClass": "COM",
+        "AssetType": "Equity",
+        "TotalShares": [float(s) for s in positions.values()],
+        "TotalValue_USD": [float(s) * 2 for s in positions.values()],
+        "PortfolioWeight": [1.0 / len(positions)] * len(positions),
+        "filingDate": filing_date or report_date,
+        "reportDate": report_date,
+        "accessionNumber": accession,
+    })
+
+
+def test_position_changes():
+    from finqual.form_13 import position_changes
+
+    df = pl.concat([
+        quarter("2024-06-30", "a", {"AAA": 10, "BBB": 5}),
+        quarter("2024-09-30", "b", {"AAA": 15, "CCC": 1}),
+        # Amendment refiled later for the same report date replaces the original.
+        quarter("2024-09-30", "b2", {"AAA": 12, "CCC": 1}, filing_date="2024-11-20"),
+    ])
+    out = position_changes(df)
+    latest = {r["CUSIP"]: r for r in out.filter(pl.col("reportDate") == "2024-09-30").iter_rows(named=True)}
+
+    assert latest["AAA"]["SharesChange"] == 2.0 and latest["AAA"]["ValueChange"] == 4.0
+    assert latest["AAA"]["WeightChange"] == 0.0
+    assert latest["CCC"]["New"] and latest["CCC"]["PrevTotalShares"] == 0.0
+    assert latest["BBB"]["Closed"] and latest["BBB"]["Issuer"] == "ISSUER BBB"
+
+    first = out.filter(pl.col("reportDate") == "2024-06-30")
+    assert first["PrevTotalShares"].null_count() == first.height
+    assert not first["New"].any() and not first["Closed"].any()
+    assert out["reportDate"][0] == "2024-09-30"
+
+
+COVER_PAGE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<edgarSubmission xmlns="http://www.sec.gov/edgar/thirteenffiler">
+  <formData><coverPage>
+    <reportCalendarOrQuarter>12-31-2024</reportCalendarOrQuarter>
+    <isAmendment>true</isAmendment><amendmentNo>1</amendmentNo>
+    <amendmentInfo><amendmentType>New Holdings</amendmentType></amendmentInfo>
+  </coverPage></formData>
+</edgarSubmission>
+"""
+
+
+def test_parse_amendment_type():
+    assert parse_amendment_type(io.BytesIO(COVER_PAGE)) == "NEW HOLDINGS"
+    original = COVER_PAGE.replace(b"<amendmentInfo><amendmentType>New Holdings</amendmentType></amendmentInfo>", b"")
+    assert parse_amendment_type(io.BytesIO(original)) is None
+
+
+def test_additive_amendment_keeps_the_original_positions():
+    previous = quarter("2024-09-30", "q3", {"AAA": 10, "BBB": 5})
+    original = quarter("2024-12-31", "q4", {"AAA": 12, "BBB": 5}, filing_date="2025-02-14")
+    additive = quarter("2024-12-31", "q4a", {"CCC": 7}, filing_date="2025-03-01").with_columns(
+        amendmentType=pl.lit("NEW HOLDINGS"))
+
+    out = position_changes(pl.concat([previous, original, additive], how="diagonal"))
+    latest = {r["CUSIP"]: r for r in out.filter(pl.col("reportDate") == "2024-12-31").iter_rows(named=True)}
+    assert set(latest) == {"AAA", "BBB", "CCC"}
+    assert not any(r["Closed"] for r in latest.values())
+    assert latest["CCC"]["New"] and latest["AAA"]["SharesChange"] == 2.0
+
+    restated = quarter("2024-12-31", "q4b", {"AAA": 12}, filing_date="2025-04-01").with_columns(
+        amendmentType=pl.lit("RESTATEMENT"))
+    out = position_changes(pl.concat([previous, original, additive, restated], how="diagonal"))
+    latest = out.filter(pl.col("reportDate") == "2024-12-31")
+    assert latest.filter(pl.col("Closed"))["CUSIP"].to_list() == ["BBB"]
+    assert "CCC" not in latest["CUSIP"].to_list()
@@ -0,0 +1,92 @@
+"""Unit tests for ``finqual.form_4`` parsing, against Form 4 XML fixtures."""
+
+import xml.etree.ElementTree as ET
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+from finqual.form_4 import OUTPUT_SCHEMA, form_4_frame, parse_form_4, parse_form_4_columns
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "form4"
+
+
+def load(name):
+    return ET.parse(FIXTURES / f"{name}.xml").getroot()
+
+
+def test_open_market_sale():
+    df = parse_form_4(load("open_market_sale"))
+
+    assert df.schema == pl.Schema(OUTPUT_SCHEMA)
+    assert df.height == 3
+    assert df["Ticker"].unique().to_list() == ["NVDA"]
+    assert df["CSuite"].all() and df["Director"].all() and not df["10PercentOwner"].any()
+
+    sale = df.row(0, named=True)
+    assert sale["TransactionCode"] == "Open market sale"
+    assert sale["AcquisitionDisposal"] == "Disposal"
+    assert sale["OwnershipType"] == "Indirect ownership"
+    assert sale["NatureOfOwnership"] == "By Trust"
+    assert (sale["Shares"], sale["TransactionPrice"]) == (14853.0, 113.2315)
+    assert sale["Date"] == date(2024, 9, 11)
+
+
+def test_holdings_have_no_transaction_fields():
+    df = parse_form_4(load("option_exercise"))
+
+    assert df["TransactionType"].to_list() == [
+        "Non-Derivative Transaction", "Non-Derivative Transaction", "Derivative Transaction", "Derivative Holding",
+    ]
+    holding = df.row(3, named=True)
+    assert holding["Security"] == "Employee Stock Option"
+    assert holding["SharesOwnedFollowingTransaction"] == 5000.0
+    assert all(holding[c] is None for c in ("Date", "TransactionCode", "Shares", "TransactionPrice",
+                                             "AcquisitionDisposal"))
+
+
+def test_roles_without_officer_title():
+    row = parse_form_4(load("director_purchase")).row(0, named=True)
+
+    assert row["Position"] is None
+    assert (row["CSuite"], row["Officer"], row["Director"], row["10PercentOwner"]) == (False, False, True, True)
+    assert row["TransactionCode"] == "Open market purchase"
+
+
+def test_unknown_code_passes_through():
+    root = load("director_purchase")
+    root.find("nonDerivativeTable/nonDerivativeTransaction/transactionCoding/transactionCode").text = "Q"
+    assert parse_form_4(root)["TransactionCode"].to_list() == ["Q"]
+
+
+def test_unparseable_values_become_null():
+    root = load("director_purchase")
+    transaction = root.find("nonDerivativeTable/nonDerivativeTransaction")
+    transaction.find("transactionDate/value").text = "2024-05-17-04:00"
+    transaction.find("transactionAmounts/transactionPricePerShare/value").text = "see footnote"
+
+    row = parse_form_4(root).row(0, named=True)
+    assert row["Date"] == date(2024, 5, 17)
+    assert row["TransactionPrice"] is None
+    assert row["Shares"] == 2500.0
+
+
+def test_frames_concatenate_without_relaxing():
+    frames = [parse_form_4(load(n)) for n in ("open_market_sale", "option_exercise", "director_purchase")]
+    df = pl.concat(frames, how="vertical")
+    assert df.schema == pl.Schema(OUTPUT_SCHEMA)
+    assert df["TransactionType"].dtype == pl.Categorical
+
+
+def test_batched_frame_matches_per_filing_frames():
+    names = ("open_market_sale", "option_exercise", "director_purchase")
+
+    batched = form_4_frame([parse_form_4_columns(load(n)) for n in names])
+
+    assert batched.equals(pl.concat([parse_form_4(load(n)) for n in names]))
+
+
+def test_empty_document_keeps_schema():
+    df = parse_form_4(ET.fromstring("<ownershipDocument/>"))
+    assert df.is_empty()
+    assert df.schema == pl.Schema(OUTPUT_SCHEMA)
@@ -0,0 +1,168 @@
+"""Unit tests for ``finqual.form_parsers.FinqualForms`` (network stubbed)."""
+
+import random
+import time
+from datetime import date, timedelta
+
+import polars as pl
+
+import finqual.form_4 as form_4
+import finqual.form_parsers as form_parsers
+from finqual.form_parsers import FinqualForms
+
+
+def make_forms(n_filings):
+    today = date.today()
+    filings = pl.DataFrame({
+        "accessionNumber": [f"0000000000-25-{i:06d}" for i in range(n_filings)],
+        "filingDate": [today - timedelta(days=i) for i in range(n_filings)],
+        "reportDate": [today - timedelta(days=i + 1) for i in range(n_filings)],
+        "URL": [f"https://example.invalid/{i}.xml" for i in range(n_filings)],
+    })
+
+    forms = FinqualForms.__new__(FinqualForms)
+    forms.headers = {}
+    forms.insider_store = None
+    forms.get_form4 = lambda since=None: filings
+    return forms
+
+
+def fake_retrieve_form_4_columns(url, headers):
+    time.sleep(random.uniform(0, 0.01))
+    i = int(url.rsplit("/", 1)[1].split(".")[0])
+    if i == 3:
+        raise ValueError("bad xml")
+    columns = {col: [None] for col in form_4._OUTPUT_COLUMNS}
+    columns["Shares"] = [str(i)]
+    return columns
+
+
+def test_insider_transactions_keep_filing_order(monkeypatch, capsys):
+    monkeypatch.setattr(form_parsers, "retrieve_form_4_columns", fake_retrieve_form_4_columns)
+    forms = make_forms(20)
+
+    df = forms.get_insider_transactions_period("1y", max_workers=6)
+
+    assert df["Shares"].to_list() == [float(i) for i in range(20) if i != 3]
+    assert df["filingDate"][0] == date.today()
+    assert df["accessionNumber"][0] == "0000000000-25-000000"
+    assert "Skipping Form 4 accession 0000000000-25-000003: ValueError" in capsys.readouterr().out
+
+
+def test_insider_transactions_empty_window(monkeypatch):
+    monkeypatch.setattr(form_parsers, "retrieve_form_4_columns", fake_retrieve_form_4_columns)
+    forms = make_forms(3)
+    forms.get_form4 = lambda since=None: make_forms(0).get_form4()
+    assert forms.get_insider_transactions_period("1y").is_empty()
+
+
+def listing(*names):
+    return {"directory": {"item": [{"name": n} for n in names]}}
+
+
+def test_information_table_name_selection():
+    from finqual.form_parsers import _information_table_name
+
+    assert _information_table_name(listing("primary_doc.xml", "50240.xml"), "xslForm13F_X02/primary_doc.xml") == "50240.xml"
+    assert _information_table_name(listing("cover.xml", "a.xml", "infotable.xml"), "cover.xml") == "infotable.xml"
+    assert _information_table_name(listing("primary_doc.xml", "index.htm"), None) is None
+
+
+def test_resolve_information_tables_uses_filing_cache(monkeypatch, tmp_path, capsys):
+    import json
+
+    import finqual.sec_edgar.xml_utils as xml_utils
+
+    monkeypatch.setenv("FINQUAL_CACHE_DIR", str(tmp_path))
+    requested = []
+
+    class Response:
+        def __init__(self, content):
+            self.content = content
+
+        def raise_for_status(self):
+            pass
+
+    def fake_get(url, headers, timeout):
+        requested.append(url)
+        names = ("primary_doc.xml",) if "000000000000000002" in url else ("primary_doc.xml", "table.xml")
+        return Response(json.dumps(listing(*names)).encode())
+
+    monkeypatch.setattr(xml_utils.requests, "get", fake_get)
+
+    base = "https://www.sec.gov/Archives/edgar/data/1"
+    filings = pl.DataFrame({
+        "accessionNumber": ["0000000000-00-000001", "0000000000-00-000002"],
+        "URL": [f"{base}/000000000000000001", f"{base}/000000000000000002"],
+        "primaryDocument": ["xslForm13F_X02/primary_doc.xml"] * 2,
+    })
+    forms = FinqualForms.__new__(FinqualForms)
+    forms.headers = {}
+
+    resolved = forms.resolve_information_tables(filings)
+    assert resolved == {"0000000000-00-000001": f"{base}/000000000000000001/table.xml"}
+    assert "Skipping Form 13 accession 0000000000-00-000002" in capsys.readouterr().out
+
+    forms.resolve_information_tables(filings)
+    assert len(requested) == 2  # listings are served from the cache on the second pass
+
+
+def test_form13_frames_share_string_dates_when_report_date_missing(monkeypatch):
+    holdings = pl.DataFrame({"CUSIP": ["037833100"], "Shares": [10.0]})
+    monkeypatch.setattr(form_parsers, "retrieve_form_13f_aggregated", lambda url, headers: holdings)
+    forms = FinqualForms.__new__(FinqualForms)
+    forms.headers = {}
+
+    dated = forms._process_form13_filing("u1", date(2024, 5, 15), date(2024, 3, 31), "a1")
+    undated = forms._process_form13_filing("u2", date(2024, 2, 14), None, "a2")
+
+    assert dated.schema == undated.schema
+    assert dated["reportDate"].dtype == pl.Utf8
+    df = pl.concat([dated, undated])
+    assert df["filingDate"].to_list() == ["2024-05-15", "2024-02-14"]
+    assert df["reportDate"].to_list() == ["2024-03-31", None]
+
+
+def test_form13_changes_merge_new_holdings_amendments(monkeypatch):
+    from types import SimpleNamespace
+
+    filings = pl.DataFrame({
+        "accessionNumber": ["q3", "q4", "q4a"],
+        "form": ["13F-HR", "13F-HR", "13F-HR/A"],
+        "filingDate": [date(2024, 11, 14), date(2025, 2, 14), date(2025, 3, 1)],
+        "reportDate": [date(2024, 9, 30), date(2024, 12, 31), date(2024, 12, 31)],
+        "primaryDocument": ["xslForm13F_X02/primary_doc.xml"] * 3,
+        "URL": ["https://example.invalid/q3", "https://example.invalid/q4", "https://example.invalid/q4a"],
+    })
+    tables = {
+        "q3": {"AAA": 10.0, "BBB": 5.0},
+        "q4": {"AAA": 12.0, "BBB": 5.0},
+        "q4a": {"CCC": 7.0},
+    }
+    cover_pages = []
+
+    def fake_retrieve(url, headers):
+        positions = tables[url.rsplit("/", 1)[1]]
+        return pl.DataFrame({"CUSIP": list(positions), "Issuer": "X", "TitleOfClass": "COM", "AssetType": "Equity",
+                             "TotalShares": list(positions.values()),
+                             "TotalValue_USD": list(positions.values()), "PortfolioWeight": 0.1})
+
+    def fake_fetch(url, headers, timeout):
+        cover_pages.append(url)
+        return b"<edgarSubmission><amendmentInfo><amendmentType>NEW HOLDINGS</amendmentType></amendmentInfo></edgarSubmission>"
+
+    monkeypatch.setattr(form_parsers, "retrieve_form_13f_aggregated", fake_retrieve)
+    monkeypatch.setattr(form_parsers, "fetch_document", fake_fetch)
+    forms = FinqualForms.__new__(FinqualForms)
+    forms.headers = {}
+    forms.id_data = SimpleNamespace(cik="0000000001")
+    forms.get_form13 = lambda since=None: filings
+    forms.resolve_information_tables = lambda df: {a: f"https://example.invalid/{a}" for a in df["accessionNumber"]}
+
+    changes = forms.get_form_13_changes(3)
+
+    # Only the amendment's cover page is read, from the raw XML at the accession root.
+    assert cover_pages == ["https://example.invalid/q4a/primary_doc.xml"]
+    latest = changes.filter(pl.col("reportDate") == "2024-12-31")
+    assert sorted(latest["CUSIP"].to_list()) == ["AAA", "BBB", "CCC"]
+    assert not latest["Closed"].any()
@@ -0,0 +1,118 @@
+"""Unit tests for ``finqual.holdings_store``."""
+
+import polars as pl
+
+from finqual.holdings_store import HoldingsStore
+
+
+def filing(cik, accession, report_date, positions):
+    """Build a get_form_13_period-shaped frame from ``{cusip: shares}``."""
+    return pl.DataFrame({
+        "CIK": cik,
+        "CUSIP": list(positions),
+        "Issuer": [f"ISSUER {c}" for c in positions],
+        "TitleOfClass": "COM",
+        "AssetType": "Equity",
+        "TotalShares": [float(s) for s in positions.values()],
+        "TotalValue_USD": [float(s) * 10 for s in positions.values()],
+        "PortfolioWeight": [1.0 / len(positions)] * len(positions),
+        "filingDate": report_date,
+        "reportDate": report_date,
+        "accessionNumber": accession,
+    })
+
+
+def test_holders_lookup_across_managers(tmp_path):
+    store = HoldingsStore(tmp_path)
+    added = store.ingest(pl.concat([
+        filing("0001", "a1", "2024-09-30", {"037833100": 100, "67066G104": 50}),
+        filing("0002", "b1", "2024-09-30", {"037833100": 300, "594918104": 20}),
+    ]))
+    assert added == 4
+
+    holders = store.holders("037833100")
+    assert holders["CIK"].to_list() == ["0002", "0001"]
+    assert store.holders("67066g104")["TotalShares"].to_list() == [50.0]
+    assert store.holders("000000000").is_empty()
+
+
+def test_incremental_ingest_skips_known_filings_and_persists(tmp_path):
+    store = HoldingsStore(tmp_path)
+    first = filing("0001", "a1", "2024-09-30", {"037833100": 100})
+    assert store.ingest(first) == 1
+    assert store.ingest(first) == 0
+
+    store.ingest(filing("0001", "a2", "2024-12-31", {"037833100": 150, "67066G104": 5}))
+
+    reopened = HoldingsStore(tmp_path)
+    assert reopened.accessions() == {"a1", "a2"}
+    assert reopened.holders("037833100")["reportDate"].to_list() == ["2024-12-31", "2024-09-30"]
+    assert reopened.holders("037833100", report_date="2024-09-30").height == 1
+    assert reopened.cusips() == ["037833100", "67066G104"]
+
+
+def test_holder_changes(tmp_path):
+    store = HoldingsStore(tmp_path)
+    store.ingest(pl.concat([
+        filing("0001", "a1", "2024-09-30", {"037833100": 100}),
+        filing("0002", "b1", "2024-09-30", {"037833100": 300}),
+        filing("0003", "c1", "2024-09-30", {"594918104": 7}),
+        filing("0001", "a2", "2024-12-31", {"037833100": 160}),
+        filing("0003", "c2", "2024-12-31", {"037833100": 40}),
+        filing("0002", "b2", "2024-12-31", {"594918104": 1}),
+    ]))
+
+    changes = store.holder_changes("037833100")
+    assert changes.columns == ["reportDate", "CIK", "AssetType", "TotalShares", "PrevShares", "SharesChange",
+                               "TotalValue_USD", "ValueChange", "New", "Closed"]
+    changes = changes.filter(pl.col("reportDate") == "2024-12-31")
+    by_cik = {row["CIK"]: row for row in changes.iter_rows(named=True)}
+
+    assert by_cik["0001"]["SharesChange"] == 60.0 and not by_cik["0001"]["New"]
+    assert by_cik["0003"]["New"] and by_cik["0003"]["SharesChange"] == 40.0
+    assert by_cik["0002"]["Closed"] and by_cik["0002"]["SharesChange"] == -300.0
+
+
+def test_unfiled_reports_are_not_closed_or_new(tmp_path):
+    store = HoldingsStore(tmp_path)
+    store.ingest(pl.concat([
+        filing("0001", "a1", "2024-09-30", {"037833100": 100}),
+        filing("0002", "b1", "2024-09-30", {"037833100": 300}),
+        filing("0001", "a2", "2024-12-31", {"037833100": 160}),
+        filing("0003", "c2", "2024-12-31", {"037833100": 40}),
+    ]))
+
+    changes = store.holder_changes("037833100")
+
+    # 0002 has not filed (or not been ingested) for 2024-12-31: no row, no Closed signal.
+    assert changes.filter(pl.col("CIK") == "0002")["reportDate"].to_list() == ["2024-09-30"]
+    assert not changes["Closed"].any()
+    # 0003's first filing in the store: no earlier report to compare with, so not New.
+    assert not changes.filter(pl.col("CIK") == "0003")["New"].any()
+
+
+def test_holder_changes_honour_amendment_type(tmp_path):
+    store = HoldingsStore(tmp_path)
+    original = filing("0001", "a1", "2024-12-31", {"037833100": 100}).with_columns(filingDate=pl.lit("2025-02-14"))
+    additive = filing("0001", "a2", "2024-12-31", {"037833100": 25}).with_columns(
+        filingDate=pl.lit("2025-03-01"), amendmentType=pl.lit("NEW HOLDINGS"))
+    store.ingest(pl.concat([original, additive], how="diagonal"))
+
+    assert store.holder_changes("037833100")["TotalShares"].to_list() == [125.0]
+
+    restated = filing("0001", "a3", "2024-12-31", {"037833100": 90}).with_columns(
+        filingDate=pl.lit("2025-04-01"), amendmentType=pl.lit("RESTATEMENT"))
+    store.ingest(restated)
+
+    assert store.holder_changes("037833100")["TotalShares"].to_list() == [90.0]
+    assert store.filings().filter(pl.col("accessionNumber") == "a2")["amendmentType"].to_list() == ["NEW HOLDINGS"]
+
+
+def test_legacy_accessions_table_is_read(tmp_path):
+    store = HoldingsStore(tmp_path)
+    store.ingest(filing("0001", "a1", "2024-09-30", {"037833100": 100}))
+    pl.DataFrame({"accessionNumber": ["a1"]}).write_parquet(tmp_path / "accessions.parquet")
+
+    assert store.accessions() == {"a1"}
+    store.ingest(filing("0001", "a2", "2024-12-31", {"594918104": 1}))
+    assert store.holder_changes("037833100")["Closed"].to_list() == [True, False]
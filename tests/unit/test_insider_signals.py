@@ -0,0 +1,105 @@
+"""Unit tests for ``finqual.insider_signals``."""
+
+import random
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+from finqual.form_4 import OUTPUT_SCHEMA, TRANSACTION_CODES
+from finqual.insider_signals import SIGNAL_SCHEMA, InsiderSignals, insider_signals
+
+SCHEMA = {**OUTPUT_SCHEMA, "IssuerCIK": pl.Utf8, "accessionNumber": pl.Utf8}
+
+
+def transactions(rows):
+    """Build typed Form 4 rows from ``(issuer, date, name, code, shares, price, csuite, director)`` tuples."""
+    records = []
+    for i, (issuer, day, name, code, shares, price, csuite, director) in enumerate(rows):
+        record = dict.fromkeys(SCHEMA)
+        record.update({
+            "IssuerCIK": issuer, "Date": day, "Name": name, "TransactionCode": TRANSACTION_CODES[code],
+            "Shares": float(shares), "TransactionPrice": float(price), "CSuite": csuite, "Officer": csuite,
+            "Director": director, "TransactionType": "Non-Derivative Transaction",
+            "accessionNumber": f"{issuer}-{i}",
+        })
+        records.append(record)
+    return pl.DataFrame(records, schema=SCHEMA)
+
+
+D = date(2024, 1, 1)
+
+
+def test_rolling_values_and_cluster_flag():
+    df = transactions([
+        ("A", D, "CEO", "P", 100, 10, True, False),
+        ("A", D + timedelta(days=10), "DIR1", "P", 50, 10, False, True),
+        ("A", D + timedelta(days=20), "DIR2", "P", 10, 10, False, True),
+        ("A", D + timedelta(days=20), "CFO", "S", 30, 10, True, False),
+        ("A", D + timedelta(days=200), "CEO", "P", 1, 10, True, False),
+        ("B", D, "CEO", "A", 1000, 0, True, False),  # grant: ignored
+    ])
+
+    signals = insider_signals(df, window_days=90, cluster_size=3)
+
+    assert signals.schema == pl.Schema(SIGNAL_SCHEMA)
+    assert signals["Issuer"].to_list() == ["A"] * 4
+    day20 = signals.row(2, named=True)
+    assert (day20["PurchaseValue"], day20["SaleValue"], day20["NetPurchaseValue"]) == (1600.0, 300.0, 1300.0)
+    assert (day20["Buyers"], day20["CSuiteBuyers"], day20["DirectorBuyers"]) == (3, 1, 2)
+    assert signals["ClusterBuy"].to_list() == [False, False, True, False]
+    # The window has rolled past the January buys.
+    assert signals.row(3, named=True)["Buyers"] == 1
+
+
+def random_transactions(n, seed):
+    rng = random.Random(seed)
+    rows = [
+        (f"I{rng.randrange(5)}", D + timedelta(days=rng.randrange(400)), f"N{rng.randrange(8)}",
+         rng.choice("PPSA"), rng.randrange(1, 100), rng.randrange(1, 50), rng.random() < 0.4, rng.random() < 0.4)
+        for _ in range(n)
+    ]
+    return transactions(rows)
+
+
+def test_incremental_updates_match_full_recompute():
+    df = random_transactions(600, seed=7)
+    expected = insider_signals(df, window_days=60).sort(["Date", "Issuer"])
+
+    state = InsiderSignals(window_days=60)
+    # Batches arrive out of date order, and one overlaps an earlier batch.
+    for batch in (df.slice(300, 300), df.slice(0, 150), df.slice(100, 200)):
+        state.update(batch)
+
+    assert state.signals.equals(expected)
+
+
+def test_update_recomputes_only_affected_dates():
+    state = InsiderSignals(window_days=30)
+    state.update(transactions([
+        ("A", D, "X", "P", 1, 1, False, False),
+        ("A", D + timedelta(days=100), "Y", "P", 1, 1, False, False),
+        ("B", D, "Z", "P", 1, 1, False, False),
+    ]))
+
+    refreshed = state.update(transactions([("A", D + timedelta(days=90), "W", "P", 1, 1, False, False)])
+                             .with_columns(pl.lit("new").alias("accessionNumber")))
+
+    assert refreshed["Date"].to_list() == [D + timedelta(days=90), D + timedelta(days=100)]
+    assert state.signals.filter(Date=D + timedelta(days=100))["Buyers"].to_list() == [2]
+    assert state.update(transactions([])).is_empty()
+
+
+def test_state_persists(tmp_path):
+    df = random_transactions(100, seed=1)
+    InsiderSignals(root=tmp_path).update(df.slice(0, 50))
+
+    reloaded = InsiderSignals(root=tmp_path)
+    reloaded.update(df.slice(50))
+    assert reloaded.signals.equals(insider_signals(df).sort(["Date", "Issuer"]))
+    assert reloaded.latest()["Issuer"].n_unique() == reloaded.signals["Issuer"].n_unique()
+
+
+def test_missing_columns_rejected():
+    with pytest.raises(ValueError, match="missing columns"):
+        insider_signals(pl.DataFrame({"Ticker": ["A"]}))
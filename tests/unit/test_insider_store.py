@@ -0,0 +1,130 @@
+"""Unit tests for ``finqual.insider_store`` against the Form 4 XML fixtures."""
+
+import io
+import re
+import tarfile
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+from finqual.form_parsers import FinqualForms
+from finqual.insider_store import STORE_SCHEMA, InsiderStore
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "form4"
+
+
+def feed_document(xml, accession, filed):
+    """Wrap an ownership document the way EDGAR's daily / quarterly feeds do."""
+    header = (f"<SUBMISSION>\n<ACCESSION-NUMBER>{accession}\n<TYPE>4\n<FILING-DATE>{filed}\n"
+              "<DOCUMENT>\n<TYPE>4\n<TEXT>\n<XML>\n").encode()
+    return header + xml + b"\n</XML>\n</TEXT>\n</DOCUMENT>\n</SUBMISSION>\n"
+
+
+def build_archive(path):
+    documents = {
+        "2024/0001197647-24-000101.xml": (FIXTURES / "open_market_sale.xml").read_bytes(),
+        "2024/000032019324000055.xml": (FIXTURES / "option_exercise.xml").read_bytes(),
+        "2024/0000000001-24-000007.nc": feed_document(
+            (FIXTURES / "director_purchase.xml").read_bytes(), "0000000001-24-000007", "20240521"
+        ),
+        "2024/10-K.nc": b"<SUBMISSION>\n<TYPE>10-K\n<TEXT>annual report</TEXT>\n</SUBMISSION>",
+        "2024/form3.xml": (FIXTURES / "director_purchase.xml").read_bytes().replace(
+            b"<documentType>4</documentType>", b"<documentType>3</documentType>"
+        ),
+        "2024/broken.xml": b"<ownershipDocument><documentType>4",
+        "README": b"not a filing",
+    }
+    with tarfile.open(path, "w:gz") as archive:
+        for name, content in documents.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+    return path
+
+
+def test_ingest_tarball(tmp_path, capsys):
+    store = InsiderStore(tmp_path / "store")
+
+    added = store.ingest(build_archive(tmp_path / "form4.tar.gz"), processes=False, batch_size=2)
+
+    assert added == 3 + 4 + 1
+    assert "Skipping 2024/broken.xml: ParseError" in capsys.readouterr().out
+    assert store.accessions() == {"0001197647-24-000101", "0000320193-24-000055", "0000000001-24-000007"}
+    assert store.issuers() == ["0000000001", "0000320193", "0001045810"]
+    assert (tmp_path / "store" / "year=2024" / "issuer=0001045810").is_dir()
+
+    df = store.transactions()
+    assert df.schema == pl.Schema(STORE_SCHEMA)
+    assert df["accessionNumber"].unique(maintain_order=True).to_list()[0] == "0000000001-24-000007"
+
+    purchase = store.transactions(cik=1).row(0, named=True)
+    assert purchase["filingDate"] == date(2024, 5, 21)
+    assert purchase["reportDate"] == date(2024, 5, 20)
+    assert purchase["TransactionCode"] == "Open market purchase"
+
+
+def test_reingest_skips_known_filings(tmp_path):
+    archive = build_archive(tmp_path / "form4.tar.gz")
+    store = InsiderStore(tmp_path / "store")
+
+    store.ingest(archive, processes=False)
+    assert store.ingest(archive, processes=False) == 0
+    assert store.transactions().height == 8
+
+
+def test_directory_ingest_in_process_pool(tmp_path):
+    store = InsiderStore(tmp_path / "store")
+
+    added = store.ingest(FIXTURES, max_workers=2)
+
+    assert added == 8
+    # Raw XML without an accession-numbered file name is keyed by its file name.
+    assert store.accessions() == {"open_market_sale", "option_exercise", "director_purchase"}
+
+
+def test_date_range_and_issuer_queries(tmp_path):
+    store = InsiderStore(tmp_path / "store")
+    store.ingest(build_archive(tmp_path / "form4.tar.gz"), processes=False)
+
+    # Filing date when known, otherwise the period of report.
+    assert store.transactions(start="2024-05-01", end="2024-06-30")["accessionNumber"].unique().to_list() == [
+        "0000000001-24-000007"
+    ]
+    assert store.transactions(cik="0001045810")["Ticker"].unique().to_list() == ["NVDA"]
+    assert store.transactions(start=date(2025, 1, 1)).is_empty()
+    assert InsiderStore(tmp_path / "empty").transactions().schema == pl.Schema(STORE_SCHEMA)
+
+
+def test_late_and_undated_filings_are_queryable(tmp_path, capsys):
+    source = tmp_path / "docs"
+    source.mkdir()
+    purchase = (FIXTURES / "director_purchase.xml").read_bytes()
+    # Filed well over a year after its 2024-05-20 period of report.
+    (source / "0000000001-26-000001.nc").write_bytes(feed_document(purchase, "0000000001-26-000001", "20260115"))
+    # Raw XML has no filing date; without a period of report it has no date at all.
+    (source / "undated.xml").write_bytes(re.sub(rb"<periodOfReport>.*?</periodOfReport>", b"", purchase))
+
+    store = InsiderStore(tmp_path / "store")
+    store.ingest(source, processes=False)
+
+    assert "stored under year=unknown" in capsys.readouterr().out
+    assert (tmp_path / "store" / "year=2026").is_dir() and (tmp_path / "store" / "year=unknown").is_dir()
+    assert store.transactions(start="2026-01-01")["accessionNumber"].unique().to_list() == ["0000000001-26-000001"]
+    assert store.transactions(end="2024-12-31").is_empty()
+    assert set(store.transactions()["accessionNumber"]) == {"0000000001-26-000001", "undated"}
+
+
+def test_finqual_forms_reads_from_store(tmp_path):
+    store = InsiderStore(tmp_path / "store")
+    store.ingest(build_archive(tmp_path / "form4.tar.gz"), processes=False)
+
+    forms = FinqualForms.__new__(FinqualForms)
+    forms.insider_store = store
+    forms.id_data = type("Id", (), {"cik": "0001045810"})()
+    forms.get_form4 = lambda since=None: (_ for _ in ()).throw(AssertionError("network used"))
+
+    df = forms.get_insider_transactions_period("100y")
+    assert df.height == 3
+    assert "IssuerCIK" not in df.columns
+    assert df["Shares"].to_list()[:2] == [14853.0, 54847.0]
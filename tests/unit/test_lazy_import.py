@@ -0,0 +1,40 @@
+"""Unit tests for the lazy public API in ``finqual/__init__``."""
+
+import subprocess
+import sys
+
+import pytest
+
+import finqual
+
+
+def loaded_modules(statement):
+    """Names in ``sys.modules`` after running ``statement`` in a fresh interpreter."""
+    probe = f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_bare_import_loads_no_heavy_dependencies():
+    modules = loaded_modules("import finqual")
+
+    assert not {"polars", "numpy", "pydantic", "requests", "cloudscraper", "finqual.core"} & modules
+
+
+def test_forms_do_not_load_the_fundamentals_stack():
+    modules = loaded_modules("from finqual import FinqualForms")
+
+    assert "finqual.form_parsers" in modules
+    assert not {"finqual.core", "numpy", "cloudscraper", "matplotlib"} & modules
+
+
+def test_lazy_attributes_resolve_to_their_classes():
+    from finqual.core import Finqual
+    from finqual.form_parsers import FinqualForms
+
+    assert finqual.Finqual is Finqual
+    assert finqual.FinqualForms is FinqualForms
+    assert {"CCA", "Finqual", "FinqualForms", "Screen"} <= set(dir(finqual))
+
+    with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+        finqual.Nope
@@ -0,0 +1,64 @@
+"""Unit tests for ``finqual.peer_index``."""
+
+import polars as pl
+
+from finqual.peer_index import PeerIndex
+
+
+def legacy_window(df, ticker, n=6):
+    """The positional window ``CCA.get_c`` computed before the index existed."""
+    sector = df.filter(pl.col("ticker") == ticker)["sector"][0]
+    df_c = df.filter(pl.col("sector") == sector)
+    i = df_c["ticker"].to_list().index(ticker)
+    start = max(0, i - 2)
+    end = start + n
+    if end > len(df_c):
+        end = len(df_c)
+        start = max(0, end - n)
+    return tuple(df_c.slice(start, end - start)["ticker"])
+
+
+MAPPING = pl.DataFrame({
+    "ticker": ["A", "B", "C", "D", "E", "F", "G", "X", "Y"],
+    "sector": ["tech"] * 7 + ["energy"] * 2,
+})
+
+
+def test_window_matches_legacy_selection():
+    index = PeerIndex(MAPPING)
+    for ticker in MAPPING["ticker"]:
+        for n in (1, 3, 6, 10):
+            assert index.window(ticker, n) == legacy_window(MAPPING, ticker, n)
+
+
+def test_default_index_is_shared_and_matches_packaged_mapping():
+    index = PeerIndex.default()
+    assert PeerIndex.default() is index
+    assert index.sector("AAPL") == "Electronic Computers"
+    assert index.window("UNKNOWN-TICKER") is None
+
+
+def test_nearest_uses_features_within_sector():
+    features = pl.DataFrame({
+        "ticker": ["A", "B", "C", "D", "E", "F", "G", "X", "Y"],
+        "market_cap": [100.0, 90.0, 10.0, 11.0, 50.0, 9.5, 12.0, 10.5, 10.2],
+        "revenue": [50.0, 45.0, 5.0, 5.5, 20.0, 4.0, 6.0, 5.0, 5.0],
+    })
+    index = PeerIndex(MAPPING, features)
+
+    peers = index.nearest("C", 4)
+    assert peers[0] == "C"
+    assert set(peers) == {"C", "D", "F", "G"}
+    # Peers never cross sectors.
+    assert index.nearest("X", 5) == ("X", "Y")
+
+
+def test_nearest_without_features_falls_back_to_window():
+    index = PeerIndex(MAPPING)
+    assert index.nearest("D", 3) == index.window("D", 3)
+
+
+def test_with_features_keeps_universe():
+    index = PeerIndex(MAPPING).with_features(pl.DataFrame({"ticker": ["A"], "size": [1.0]}))
+    assert index.feature_names == ("size",)
+    assert len(index.nearest("B", 10)) == 7
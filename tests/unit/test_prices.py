@@ -0,0 +1,86 @@
+"""Unit tests for ``finqual.prices.LocalPriceStore``."""
+
+import math
+from datetime import date
+
+import polars as pl
+import pytest
+
+from finqual.prices import LocalPriceStore, PriceProvider
+
+
+@pytest.fixture
+def history():
+    return pl.DataFrame({
+        "ticker": ["BBB", "AAA", "AAA", "AAA", "BBB"],
+        "date": [date(2024, 1, 2), date(2024, 3, 28), date(2023, 12, 29), date(2024, 6, 28), date(2024, 6, 28)],
+        "close": [10.0, 101.0, 100.0, 102.0, 11.0],
+    })
+
+
+def test_asof_returns_last_close_on_or_before(history):
+    store = LocalPriceStore(history)
+    prices = store.price_asof("AAA", [date(2023, 12, 31), date(2024, 3, 28), date(2024, 6, 30)])
+    assert prices == [100.0, 101.0, 102.0]
+
+
+def test_dates_before_history_and_none_are_nan(history):
+    store = LocalPriceStore(history)
+    prices = store.price_asof("aaa", [date(2020, 1, 1), None])
+    assert all(math.isnan(p) for p in prices)
+
+
+def test_unknown_ticker_is_nan(history):
+    assert math.isnan(LocalPriceStore(history).price_asof("ZZZ", [date(2024, 1, 1)])[0])
+
+
+@pytest.mark.parametrize("suffix", [".arrow", ".parquet"])
+def test_from_file(tmp_path, history, suffix):
+    path = tmp_path / f"prices{suffix}"
+    if suffix == ".arrow":
+        history.write_ipc(path)
+    else:
+        history.write_parquet(path)
+
+    store = LocalPriceStore.from_file(path)
+    assert store.tickers == {"AAA", "BBB"}
+    assert store.price_asof("BBB", [date(2024, 6, 30)]) == [11.0]
+
+
+def test_missing_columns_raise():
+    with pytest.raises(ValueError):
+        LocalPriceStore(pl.DataFrame({"ticker": ["A"], "close": [1.0]}))
+
+
+def test_provider_without_price_asof_cannot_be_instantiated():
+    class Incomplete(PriceProvider):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_sorted_ipc_is_indexed_in_place(tmp_path, history):
+    path = tmp_path / "prices.arrow"
+    history.sort("ticker", "date").rechunk().write_ipc(path)
+
+    store = LocalPriceStore.from_file(path)
+
+    # The close array is a read-only view into the memory map, not a heap copy.
+    assert not store._closes.flags.writeable and not store._closes.flags.owndata
+    assert store.price_asof("AAA", [date(2024, 3, 29), date(2024, 7, 1)]) == [101.0, 102.0]
+    assert store.price_asof("BBB", [date(2024, 1, 2)]) == [10.0]
+
+
+@pytest.mark.parametrize("write", [
+    lambda df, path: df.write_ipc(path),  # unsorted
+    lambda df, path: df.sort("ticker", "date").write_ipc(path, compression="zstd"),
+])
+def test_non_qualifying_ipc_falls_back_to_memory(tmp_path, history, write):
+    path = tmp_path / "prices.arrow"
+    write(history, path)
+
+    store = LocalPriceStore.from_file(path)
+
+    assert store.tickers == {"AAA", "BBB"}
+    assert store.price_asof("AAA", [date(2024, 1, 1)]) == [100.0]
@@ -0,0 +1,54 @@
+"""Unit tests for ``finqual.sec_edgar.rate_limit``."""
+
+import threading
+import time
+
+import pytest
+
+from finqual.sec_edgar.rate_limit import RateLimiter
+
+
+def test_calls_within_budget_do_not_block():
+    limiter = RateLimiter(5, 10.0)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.5
+
+
+def test_excess_calls_block_until_window_frees():
+    limiter = RateLimiter(2, 0.2)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.18
+
+
+def test_budget_is_shared_across_threads():
+    limiter = RateLimiter(4, 0.25)
+    stamps = []
+    lock = threading.Lock()
+
+    @limiter.limited
+    def call():
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stamps.sort()
+    # No window of one period ever holds more than the budget.
+    for i in range(len(stamps) - 4):
+        assert stamps[i + 4] - stamps[i] >= 0.24
+
+
+def test_configure_validates_and_updates():
+    limiter = RateLimiter(10, 1.0)
+    limiter.configure(3)
+    assert (limiter.calls, limiter.period) == (3, 1.0)
+    with pytest.raises(ValueError):
+        limiter.configure(0)
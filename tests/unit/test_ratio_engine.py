@@ -0,0 +1,129 @@
+"""Unit tests for ``finqual.ratio_engine``."""
+
+import math
+
+import polars as pl
+import pytest
+
+from finqual import ratio_engine
+
+
+def wide(mapping, periods=("2024", "2023")):
+    """Wide statement frame with the same values in every period column."""
+    return pl.DataFrame({"TEST": list(mapping), **{p: list(mapping.values()) for p in periods}})
+
+
+@pytest.fixture
+def frame(income_stmt_fixture, balance_sheet_fixture, cash_flow_fixture):
+    return ratio_engine.statement_frame({
+        "income": wide(income_stmt_fixture),
+        "balance": wide(balance_sheet_fixture),
+        "cashflow": wide(cash_flow_fixture),
+    }).with_columns(pl.lit(16.0).alias("Share Price"))
+
+
+def test_statement_frame_is_period_major(frame):
+    assert sorted(frame["Period"].to_list()) == ["2023", "2024"]
+    assert frame["Total Revenue"].to_list() == [1000.0, 1000.0]
+
+
+def test_profitability_ratios(frame):
+    out = ratio_engine.evaluate_ratios(frame, ratio_engine.PROFITABILITY_RATIOS)
+    assert out.height == 2
+    row = out.row(0, named=True)
+    assert row["Gross Margin"] == pytest.approx(0.40)
+    assert row["SG&A Ratio"] == pytest.approx(0.10)
+    assert row["ROE"] == pytest.approx(160 / 3000)
+    assert row["ROIC"] == pytest.approx(200 / 4600)
+
+
+def test_liquidity_ratios(frame):
+    out = ratio_engine.evaluate_ratios(frame, ratio_engine.LIQUIDITY_RATIOS).row(0, named=True)
+    assert out["Quick Ratio"] == pytest.approx(1.5)
+    assert out["Debt-to-Equity Ratio"] == pytest.approx(2000 / 3000)
+
+
+def test_valuation_ratios(frame):
+    out = ratio_engine.evaluate_ratios(frame, ratio_engine.VALUATION_RATIOS).row(0, named=True)
+    assert out["P/E"] == pytest.approx(10.0)
+    assert out["EV/EBITDA"] == pytest.approx(2000 / 300)
+
+
+def test_multiplier_scales_every_ratio(frame):
+    out = ratio_engine.evaluate_ratios(frame, ratio_engine.PROFITABILITY_RATIOS, multiplier=100)
+    assert out["Gross Margin"][0] == pytest.approx(40.0)
+
+
+def test_zero_denominator_and_missing_items_are_nan():
+    frame = ratio_engine.statement_frame({
+        "income": pl.DataFrame({"TEST": ["Total Revenue", "Gross Profit"], "2024": [0.0, 100.0]}),
+    })
+    out = ratio_engine.evaluate_ratios(frame, ratio_engine.PROFITABILITY_RATIOS).row(0, named=True)
+    assert math.isnan(out["Gross Margin"])  # zero denominator
+    assert math.isnan(out["ROA"])  # Total Assets missing
+
+
+def test_periods_missing_from_one_statement_are_nan():
+    frame = ratio_engine.statement_frame({
+        "income": pl.DataFrame({"TEST": ["Net Income"], "2024": [10.0], "2023": [5.0]}),
+        "balance": pl.DataFrame({"TEST": ["Total Assets"], "2024": [100.0]}),
+    })
+    out = ratio_engine.evaluate_ratios(frame, {"ROA": ratio_engine.PROFITABILITY_RATIOS["ROA"]}).sort("Period")
+    assert math.isnan(out["ROA"][0])
+    assert out["ROA"][1] == pytest.approx(0.1)
+
+def test_roic_without_tax_provision(income_stmt_fixture, balance_sheet_fixture):
+    inc = {k: v for k, v in income_stmt_fixture.items() if k != "Tax Provision"}
+    frame = ratio_engine.statement_frame({"income": wide(inc), "balance": wide(balance_sheet_fixture)})
+    out = ratio_engine.evaluate_ratios(frame, ratio_engine.PROFITABILITY_RATIOS).row(0, named=True)
+    assert out["ROIC"] == pytest.approx(250 / 4600)
+
+
+def test_defaults_must_reference_formula_items():
+    with pytest.raises(ValueError):
+        ratio_engine.compile_ratio("Net Income / Total Assets", defaults={"Tax Provision": 0.0})
+
+
+# ------------------------------------------------------------------ #
+# Ratio expression language
+# ------------------------------------------------------------------ #
+
+def test_compile_ratio_derives_items_and_sources():
+    ratio = ratio_engine.compile_ratio("(Net Income - Tax Provision) / [Total Assets]")
+    assert ratio.items == {"Net Income", "Tax Provision", "Total Assets"}
+    assert ratio.sources == {"income", "balance"}
+
+
+def test_hyphenated_items_are_not_subtraction():
+    ratio = ratio_engine.compile_ratio("Other Non-Current Assets / Total Assets")
+    assert ratio.items == {"Other Non-Current Assets", "Total Assets"}
+
+
+def test_operator_precedence_and_literals(frame):
+    out = ratio_engine.evaluate_ratios(frame, {
+        "x": "Total Revenue - Cost Of Revenue * 2 / 4",  # 1000 - 300
+        "y": "-(Gross Profit + 100) * 0.5",              # -250
+    }).row(0, named=True)
+    assert out["x"] == pytest.approx(700.0)
+    assert out["y"] == pytest.approx(-250.0)
+
+
+@pytest.mark.parametrize("formula", ["", "Gross Profit /", "(Gross Profit", "Gross Profit Total", "Gross Profit % 2"])
+def test_malformed_formulas_raise(formula):
+    with pytest.raises(ValueError):
+        ratio_engine.compile_ratio(formula)
+
+
+def test_unknown_line_item_raises():
+    with pytest.raises(ValueError, match="Unknown line item"):
+        ratio_engine.compile_ratio("Gross Proft / Total Revenue")
+
+
+def test_stacked_universe_evaluates_in_one_pass(income_stmt_fixture):
+    frames = {
+        "AAA": ratio_engine.statement_frame({"income": wide(income_stmt_fixture)}),
+        "BBB": ratio_engine.statement_frame({"income": wide({"Total Revenue": 10.0, "Gross Profit": 5.0})}),
+    }
+    out = ratio_engine.evaluate_ratios(ratio_engine.stack_frames(frames), {"GM": "Gross Profit / Total Revenue"})
+    by_ticker = dict(zip(out["Ticker"], out["GM"]))
+    assert by_ticker == {"AAA": pytest.approx(0.4), "BBB": pytest.approx(0.5)}
@@ -1,4 +1,4 @@
-"""Unit tests for the pure ratio functions in ``finqual.ratios``."""
+"""Unit tests for the single-period ratio functions in ``finqual.ratios``."""
 
 import math
 
@@ -93,14 +93,19 @@ def test_ev_ebitda(income_stmt_fixture, balance_sheet_fixture, cash_flow_fixture
 # Error paths
 # ------------------------------------------------------------------ #
 
-def test_zero_denominator_raises_zero_division():
-    with pytest.raises(ZeroDivisionError):
-        ratios.gross_margin({"Total Revenue": 0, "Gross Profit": 100})
+def test_zero_denominator_is_nan():
+    assert math.isnan(ratios.gross_margin({"Total Revenue": 0, "Gross Profit": 100}))
 
 
-def test_missing_key_raises_key_error():
-    with pytest.raises(KeyError):
-        ratios.roe({"Net Income": 100}, {})  # Stockholders Equity missing
+def test_missing_or_null_item_is_nan():
+    assert math.isnan(ratios.roe({"Net Income": 100}, {}))  # Stockholders Equity missing
+    assert math.isnan(ratios.roe({"Net Income": None}, {"Stockholders Equity": 50}))
+
+
+def test_roic_without_tax_provision(income_stmt_fixture, balance_sheet_fixture):
+    inc = {k: v for k, v in income_stmt_fixture.items() if k != "Tax Provision"}
+    # NOPAT = 250 (no tax) → ROIC = 250 / 4600
+    assert ratios.roic(inc, balance_sheet_fixture) == pytest.approx(250 / 4600)
 
 
 def test_handles_mapping_like_inputs():
@@ -0,0 +1,56 @@
+"""Unit tests for ``finqual.core.rolling_ttm``."""
+
+import polars as pl
+import pytest
+
+from finqual.core import rolling_ttm
+
+
+def make_quarterly(columns):
+    """Wide quarterly statement with newest-first period columns."""
+    return pl.DataFrame({"TEST": ["Total Revenue", "End Cash Position"], **columns})
+
+
+def test_sums_every_four_quarter_window():
+    df = make_quarterly({
+        "2024Q2": [6.0, 60.0],
+        "2024Q1": [5.0, 50.0],
+        "2023Q4": [4.0, 40.0],
+        "2023Q3": [3.0, 30.0],
+        "2023Q2": [2.0, 20.0],
+        "2023Q1": [1.0, 10.0],
+    })
+    out = rolling_ttm(df)
+    assert out.columns == ["TEST", "2024Q2", "2024Q1", "2023Q4"]
+    assert out["2023Q4"][0] == pytest.approx(10.0)
+    assert out["2024Q1"][0] == pytest.approx(14.0)
+    assert out["2024Q2"][0] == pytest.approx(18.0)
+
+
+def test_point_in_time_items_take_latest_quarter():
+    df = make_quarterly({
+        "2024Q1": [5.0, 50.0],
+        "2023Q4": [4.0, 40.0],
+        "2023Q3": [3.0, 30.0],
+        "2023Q2": [2.0, 20.0],
+    })
+    out = rolling_ttm(df, point_in_time=("End Cash Position",))
+    assert out["2024Q1"].to_list() == [pytest.approx(14.0), pytest.approx(50.0)]
+
+
+def test_gaps_are_not_bridged():
+    # 2023Q3 is missing, so no window can end before 2024Q3.
+    df = make_quarterly({
+        "2024Q2": [6.0, 0.0],
+        "2024Q1": [5.0, 0.0],
+        "2023Q4": [4.0, 0.0],
+        "2023Q2": [2.0, 0.0],
+        "2023Q1": [1.0, 0.0],
+    })
+    out = rolling_ttm(df)
+    assert out.columns == ["TEST"]
+
+
+def test_fewer_than_four_quarters_returns_line_items_only():
+    df = make_quarterly({"2024Q1": [1.0, 1.0], "2023Q4": [1.0, 1.0]})
+    assert rolling_ttm(df).columns == ["TEST"]
@@ -0,0 +1,111 @@
+"""Unit tests for ``finqual.screen`` (Finqual stubbed, thread pool)."""
+
+import polars as pl
+import pytest
+
+import finqual.screen as screen_module
+from finqual.screen import Screen
+
+
+class FakeFinqual:
+    """Stand-in returning one-row ratio frames."""
+
+    calls = []
+
+    def __init__(self, ticker):
+        if ticker == "AAPL":
+            raise RuntimeError("no facts")
+        FakeFinqual.calls.append(ticker)
+        self.ticker = ticker
+
+    def profitability_ratios(self, year, quarter):
+        return pl.DataFrame({"Ticker": [self.ticker], "Period": [str(year)], "ROE": [0.1], "ROA": [0.05]})
+
+    def liquidity_ratios(self, year, quarter):
+        return pl.DataFrame({"Ticker": [self.ticker], "Period": [str(year)], "Current Ratio": [1.5]})
+
+
+@pytest.fixture
+def fake_finqual(monkeypatch):
+    FakeFinqual.calls = []
+    monkeypatch.setattr(screen_module, "Finqual", FakeFinqual)
+
+
+def test_universe_is_filtered_by_sector_and_ticker():
+    screen = Screen(sectors="Electronic Computers", processes=False)
+    assert set(screen.universe["sector"]) == {"Electronic Computers"}
+    assert "AAPL" in screen.universe["ticker"].to_list()
+
+    screen = Screen(tickers=["MSFT", "NVDA"], processes=False)
+    assert sorted(screen.universe["ticker"]) == ["MSFT", "NVDA"]
+
+
+def test_unknown_metric_is_rejected():
+    with pytest.raises(ValueError):
+        Screen(metrics=["growth"])
+
+
+def test_run_returns_long_frame_and_records_failures(fake_finqual):
+    screen = Screen(tickers=["MSFT", "NVDA", "AAPL"], processes=False)
+    df = screen.run(2023)
+
+    assert df.columns == ["Ticker", "Sector", "Period", "Metric", "Ratio", "Value"]
+    assert df.height == 6
+    assert set(df["Ticker"]) == {"MSFT", "NVDA"}
+    assert set(screen.stats.failed) == {"AAPL"}
+    assert screen.stats.completed == 2
+
+
+def test_checkpoint_resumes_completed_companies(fake_finqual, tmp_path):
+    first = Screen(tickers=["MSFT", "NVDA"], processes=False, checkpoint=tmp_path)
+    expected = first.run(2023)
+    assert len(FakeFinqual.calls) == 2
+
+    FakeFinqual.calls = []
+    second = Screen(tickers=["MSFT", "NVDA"], processes=False, checkpoint=tmp_path)
+    assert second.run(2023).equals(expected)
+    assert FakeFinqual.calls == []
+    assert second.stats.resumed == 2
+
+    # A different period is a different checkpoint.
+    second.run(2022)
+    assert len(FakeFinqual.calls) == 2
+
+
+def test_stopping_early_does_not_wait_for_the_universe(monkeypatch):
+    import time
+
+    def slow_company(ticker, sector, metrics, year, quarter):
+        time.sleep(0.2)
+        return pl.DataFrame({"Ticker": [ticker]})
+
+    monkeypatch.setattr(screen_module, "_screen_company", slow_company)
+    screen = Screen(tickers=["MSFT", "NVDA", "AMD", "INTC", "QCOM", "TXN"], processes=False, max_workers=1)
+
+    results = screen.iter_results(2023)
+    next(results)
+    start = time.monotonic()
+    results.close()
+    assert time.monotonic() - start < 0.2
+
+
+@pytest.mark.parametrize("max_workers", [1, 3, 10, 11, 16, 64])
+def test_worker_budgets_never_exceed_the_sec_limit(max_workers):
+    from finqual.sec_edgar.rate_limit import SEC_MAX_CALLS, SEC_PERIOD_SECS
+
+    calls, period = screen_module._worker_budget(max_workers)
+    assert calls >= 1
+    assert max_workers * calls / period <= SEC_MAX_CALLS / SEC_PERIOD_SECS + 1e-9
+
+
+def test_process_pool_workers_share_the_budget(monkeypatch):
+    captured = {}
+
+    class FakePool:
+        def __init__(self, max_workers, initializer, initargs):
+            captured.update(max_workers=max_workers, initargs=initargs)
+
+    monkeypatch.setattr(screen_module, "ProcessPoolExecutor", FakePool)
+    Screen(tickers=["MSFT"], max_workers=16)._executor()
+
+    assert captured == {"max_workers": 16, "initargs": (1, 1.6)}
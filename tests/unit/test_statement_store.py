@@ -0,0 +1,64 @@
+"""Unit tests for ``finqual.statement_store``."""
+
+import polars as pl
+
+from finqual.statement_store import StatementStore, mapping_version, persisted
+
+
+class FakeCompany:
+    """Minimal owner exposing the attributes ``persisted`` relies on."""
+
+    def __init__(self, store, accession="0000000000-25-000001"):
+        self.statement_store = store
+        self.cik = "0000000001"
+        self.latest_accession = accession
+        self.calls = 0
+
+    @persisted("income_stmt")
+    def income_stmt(self, year, quarter=None):
+        self.calls += 1
+        label = str(year) if quarter is None else f"{year}Q{quarter}"
+        return pl.DataFrame({"TEST": ["Total Revenue"], label: [100.0 * self.calls]})
+
+
+def test_mapping_version_is_stable():
+    assert mapping_version() == mapping_version()
+    assert "-" in mapping_version()
+
+
+def test_round_trip(tmp_path):
+    store = StatementStore(tmp_path)
+    df = pl.DataFrame({"TEST": ["Net Income"], "2024": [1.0]})
+    assert store.get("1", "a", "income_stmt", "2024-None") is None
+    store.put("1", "a", "income_stmt", "2024-None", df)
+    assert store.get("1", "a", "income_stmt", "2024-None").equals(df)
+
+
+def test_persisted_serves_from_store_across_instances(tmp_path):
+    store = StatementStore(tmp_path)
+
+    first = FakeCompany(store)
+    df_first = first.income_stmt(2024, 3)
+    assert first.calls == 1
+
+    second = FakeCompany(store)
+    df_second = second.income_stmt(year=2024, quarter=3)
+    assert second.calls == 0
+    assert df_second.equals(df_first)
+
+
+def test_new_accession_invalidates_and_prunes(tmp_path):
+    store = StatementStore(tmp_path)
+    FakeCompany(store, accession="old").income_stmt(2024)
+
+    company = FakeCompany(store, accession="new")
+    company.income_stmt(2024)
+    assert company.calls == 1
+    assert not (store.root / company.cik / "old").exists()
+
+
+def test_persisted_without_store_computes():
+    company = FakeCompany(None)
+    company.income_stmt(2024)
+    company.income_stmt(2024)
+    assert company.calls == 2
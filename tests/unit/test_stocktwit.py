@@ -0,0 +1,91 @@
+"""Unit tests for ``finqual.stocktwit.QuoteService`` (network calls stubbed)."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from finqual.stocktwit import QuoteService
+
+
+class FakeQuoteService(QuoteService):
+    """QuoteService whose network fetch is replaced by a recorder."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.requests = []
+        self._record_lock = threading.Lock()
+
+    def _fetch(self, tickers):
+        with self._record_lock:
+            self.requests.append(list(tickers))
+        return {t: float(len(t)) for t in tickers if t != "MISSING"}
+
+
+def test_concurrent_requests_are_batched():
+    service = FakeQuoteService(batch_window=0.1)
+    tickers = ["AAPL", "MSFT", "NVDA", "AMZN"]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda t: service.get_quotes([t]), tickers))
+
+    assert results == [{t: float(len(t))} for t in tickers]
+    assert sum(len(r) for r in service.requests) == 4
+    assert len(service.requests) < 4
+
+
+def test_quotes_are_cached_within_ttl():
+    service = FakeQuoteService(batch_window=0)
+    service.get_quotes(["AAPL", "MSFT"])
+    assert service.get_quotes(["MSFT", "AAPL"]) == {"MSFT": 4.0, "AAPL": 4.0}
+    assert len(service.requests) == 1
+
+
+def test_expired_quotes_are_refetched():
+    service = FakeQuoteService(batch_window=0, ttl=0)
+    service.get_quotes(["AAPL"])
+    service.get_quotes(["AAPL"])
+    assert len(service.requests) == 2
+
+
+def test_large_requests_are_chunked():
+    service = FakeQuoteService(batch_window=0, max_batch=2)
+    service.get_quotes(["A", "B", "C", "D", "E"])
+    assert [len(r) for r in service.requests] == [2, 2, 1]
+
+
+def test_missing_tickers_are_omitted():
+    service = FakeQuoteService(batch_window=0)
+    assert service.get_quotes(["AAPL", "MISSING"]) == {"AAPL": 4.0}
+
+
+def test_fetch_errors_reach_every_waiter():
+    class Failing(QuoteService):
+        def _fetch(self, tickers):
+            raise RuntimeError("blocked")
+
+    service = Failing(batch_window=0)
+    with pytest.raises(RuntimeError):
+        service.get_quotes(["AAPL"])
+    # The failed ticker is not left pending.
+    with pytest.raises(RuntimeError):
+        service.get_quotes(["AAPL"])
+
+
+def test_interrupted_flush_resolves_waiters_and_recovers():
+    class Interrupted(FakeQuoteService):
+        interrupt = True
+
+        def _fetch(self, tickers):
+            if self.interrupt:
+                self.interrupt = False
+                raise KeyboardInterrupt
+            return super()._fetch(tickers)
+
+    service = Interrupted(batch_window=0, max_batch=1)
+    with pytest.raises(KeyboardInterrupt):
+        service.get_quotes(["AAPL", "MSFT"])
+
+    # Nothing is left queued or pending, and the next call elects a new leader.
+    assert not service._pending and not service._queue and not service._flushing
+    assert service.get_quotes(["AAPL", "MSFT"]) == {"AAPL": 4.0, "MSFT": 4.0}
@@ -0,0 +1,120 @@
+"""Unit tests for ``finqual.sec_edgar.submissions`` (network stubbed)."""
+
+import json
+import threading
+from datetime import date, datetime
+
+import polars as pl
+
+import finqual.sec_edgar.submissions as submissions
+from finqual.sec_edgar.filing_cache import FilingCache
+from finqual.sec_edgar.submissions import SUBMISSION_SCHEMA, Submissions, submissions_frame
+
+
+def table(*filings):
+    """Columnar submissions table from ``(accession, form, filing date)`` tuples."""
+    return {
+        "accessionNumber": [a for a, _, _ in filings],
+        "form": [f for _, f, _ in filings],
+        "filingDate": [d for _, _, d in filings],
+        "reportDate": ["" for _ in filings],
+        "acceptanceDateTime": ["2024-09-13T18:30:52.000Z" for _ in filings],
+        "size": [1000 for _ in filings],
+        "isXBRL": [0 for _ in filings],
+        "isInlineXBRL": [1 for _ in filings],
+        "primaryDocument": ["doc.xml" for _ in filings],
+    }
+
+
+PAYLOAD = {
+    "cik": "1045810",
+    "name": "NVIDIA CORP",
+    "sicDescription": "Semiconductors & Related Devices",
+    "filings": {
+        "recent": table(("a3", "4", "2024-06-01"), ("a2", "10-K", "2023-02-24")),
+        "files": [
+            {"name": "CIK0001045810-submissions-001.json", "filingFrom": "2015-01-01", "filingTo": "2023-01-31"},
+            {"name": "CIK0001045810-submissions-002.json", "filingFrom": "2001-01-01", "filingTo": "2014-12-31"},
+        ],
+    },
+}
+
+PAGES = {
+    "CIK0001045810-submissions-001.json": table(("a1", "4", "2020-03-01"), ("a2", "10-K", "2023-02-24")),
+    "CIK0001045810-submissions-002.json": table(("a0", "13F-HR", "2010-05-15")),
+}
+
+
+class Response:
+    def __init__(self, body):
+        self.content = json.dumps(body).encode()
+        self.status_code = 200
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def stub_pages(monkeypatch):
+    requested = []
+    lock = threading.Lock()
+
+    def fake_get(url, headers, timeout):
+        with lock:
+            requested.append(url.rsplit("/", 1)[1])
+        return Response(PAGES[url.rsplit("/", 1)[1]])
+
+    monkeypatch.setattr(submissions.requests, "get", fake_get)
+    return requested
+
+
+def test_frame_is_typed():
+    df = submissions_frame(PAYLOAD["filings"]["recent"])
+
+    assert df.schema == pl.Schema(SUBMISSION_SCHEMA)
+    assert df["filingDate"].to_list() == [date(2024, 6, 1), date(2023, 2, 24)]
+    assert df["reportDate"].null_count() == 2
+    assert df["acceptanceDateTime"][0] == datetime(2024, 9, 13, 18, 30, 52)
+    assert df["isInlineXBRL"].all() and not df["isXBRL"].any()
+    # Columns absent from a page are null.
+    assert df["items"].null_count() == 2
+
+
+def test_recent_only_queries_skip_pages(monkeypatch):
+    requested = stub_pages(monkeypatch)
+    subs = Submissions("1045810", PAYLOAD, {}, cache=None)
+
+    assert subs.payload["name"] == "NVIDIA CORP" and "filings" not in subs.payload
+    assert subs.filings(date(2024, 1, 1))["accessionNumber"].to_list() == ["a3"]
+    # Reaches past the recent table, but not into any older page's date range.
+    assert subs.filings(date(2023, 2, 1))["accessionNumber"].to_list() == ["a3", "a2"]
+    assert requested == []
+
+
+def test_older_pages_fetched_only_when_overlapping(monkeypatch):
+    requested = stub_pages(monkeypatch)
+    subs = Submissions("1045810", PAYLOAD, {}, cache=None)
+
+    df = subs.filings(date(2019, 1, 1))
+    assert requested == ["CIK0001045810-submissions-001.json"]
+    # Overlapping filings are deduplicated; output stays newest first.
+    assert df["accessionNumber"].to_list() == ["a3", "a2", "a1"]
+
+    full = subs.filings()
+    assert full["accessionNumber"].to_list() == ["a3", "a2", "a1", "a0"]
+    assert sorted(requested) == sorted(PAGES)  # page 001 was served from memory
+
+
+def test_pages_cached_permanently(monkeypatch, tmp_path):
+    requested = stub_pages(monkeypatch)
+    cache = FilingCache(tmp_path)
+
+    Submissions("1045810", PAYLOAD, {}, cache=cache).filings()
+    assert len(requested) == 2
+    assert cache.get("0001045810", "CIK0001045810-submissions-002.json") is not None
+
+    fresh = Submissions("1045810", PAYLOAD, {}, cache=cache)
+    assert fresh.filings()["accessionNumber"].to_list() == ["a3", "a2", "a1", "a0"]
+    assert len(requested) == 2
@@ -0,0 +1,181 @@
+"""Unit tests for ``finqual.tracing`` and the stage spans in ``SecApi``."""
+
+import gzip
+import io
+import json
+import threading
+import time
+
+import polars as pl
+import pytest
+
+import finqual.sec_edgar.sec_api as sec_api
+from finqual import tracing
+from finqual.sec_edgar.entities.models import CompanyIdCode
+from finqual.sec_edgar.sec_api import SecApi
+
+
+@pytest.fixture(autouse=True)
+def reset_tracing():
+    tracing.disable()
+    yield
+    tracing.disable()
+
+
+def test_disabled_spans_are_shared_noops():
+    exporter = tracing.InMemoryExporter()
+
+    with tracing.span("stage", rows=1) as s:
+        s.set(bytes=10)
+
+    assert not tracing.is_enabled()
+    assert tracing.span("a") is tracing.span("b")
+    assert tracing.traced("stage")(lambda x: x + 1)(1) == 2
+    assert exporter.spans == []
+
+
+def test_nested_spans_record_parent_attributes_and_errors():
+    exporter = tracing.InMemoryExporter()
+
+    with tracing.tracing(exporter):
+        with tracing.span("outer", cik="0000320193") as outer:
+            with tracing.span("inner") as inner:
+                inner.set(rows=3, bytes=100)
+            outer.set(rows=1)
+        with pytest.raises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("boom")
+
+    inner, outer, failing = exporter.spans
+    assert (inner.name, outer.name) == ("inner", "outer")
+    assert inner.parent_id == outer.span_id and outer.parent_id is None
+    assert outer.attributes == {"cik": "0000320193", "rows": 1}
+    assert outer.duration >= inner.duration >= 0
+    assert failing.error == "ValueError"
+    assert exporter.totals()["inner"] == {"count": 1, "seconds": inner.duration, "rows": 3, "bytes": 100}
+    assert not tracing.is_enabled()
+
+
+def test_reader_splits_read_time_from_parse_time():
+    class SlowStream(io.BytesIO):
+        def read(self, size=-1):
+            time.sleep(0.02)
+            return super().read(size)
+
+    exporter = tracing.InMemoryExporter()
+    with tracing.tracing(exporter):
+        with tracing.span("parse") as s:
+            stream = s.reader(SlowStream(b"x" * 10))
+            while stream.read(4):
+                time.sleep(0.01)
+
+    (span,) = exporter.spans
+    assert span.attributes["read_seconds"] >= 0.08
+    assert span.attributes["parse_seconds"] >= 0.03
+    stream = io.BytesIO()
+    assert tracing.span("off").reader(stream) is stream
+
+
+def test_scoped_tracing_stays_in_its_context_but_enable_is_global():
+    scoped, global_ = tracing.InMemoryExporter(), tracing.InMemoryExporter()
+
+    def worker():
+        with tracing.span("worker"):
+            pass
+
+    with tracing.tracing(scoped):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    assert scoped.spans == []
+
+    tracing.enable(global_)
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    assert [s.name for s in global_.spans] == ["worker"]
+
+
+def test_json_lines_and_prometheus_exporters(tmp_path):
+    stream = io.StringIO()
+    prometheus = tracing.PrometheusExporter()
+
+    with tracing.tracing(tracing.JsonLinesExporter(stream), prometheus):
+        for _ in range(2):
+            with tracing.span("sec.facts.download", cik="1") as s:
+                s.set(rows=5, bytes=2048)
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [r["name"] for r in records] == ["sec.facts.download"] * 2
+    assert records[0]["attributes"] == {"cik": "1", "rows": 5, "bytes": 2048}
+
+    text = prometheus.render()
+    assert "# TYPE finqual_stage_seconds_total counter" in text
+    assert 'finqual_stage_calls_total{stage="sec.facts.download"} 2' in text
+    assert 'finqual_stage_bytes_total{stage="sec.facts.download"} 4096' in text
+
+    prometheus.write(tmp_path / "finqual.prom")
+    assert (tmp_path / "finqual.prom").read_text() == text
+
+
+def test_pipe_stage_only_materialises_while_tracing():
+    lf = pl.LazyFrame({"x": [1, 2, 3]})
+    double = lambda frame: frame.with_columns(pl.col("x") * 2)
+    exporter = tracing.InMemoryExporter()
+
+    assert "WITH_COLUMNS" in lf.pipe(tracing.pipe_stage, "double", double).explain()
+    with tracing.tracing(exporter):
+        out = lf.pipe(tracing.pipe_stage, "double", double)
+
+    assert out.collect()["x"].to_list() == [2, 4, 6]
+    assert exporter.spans[0].name == "double" and exporter.spans[0].attributes["rows"] == 3
+
+
+FACTS = {
+    "facts": {
+        "dei": {},
+        "us-gaap": {
+            "Revenues": {"description": "Revenue", "units": {"USD": [
+                {"start": "2024-01-01", "end": "2024-03-31", "val": 10, "form": "10-Q", "fp": "Q1",
+                 "frame": "CY2024Q1", "filed": "2024-05-01", "accn": "a1"},
+                {"start": "2024-01-01", "end": "2024-06-30", "val": 25, "form": "10-Q", "fp": "Q2",
+                 "filed": "2024-08-01", "accn": "a2"},
+            ]}},
+        },
+    }
+}
+
+
+class FactsResponse:
+    def __init__(self):
+        self.raw = io.BytesIO(gzip.compress(json.dumps(FACTS).encode()))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+def test_company_facts_stages_are_traced(monkeypatch):
+    monkeypatch.setattr(sec_api.requests, "get", lambda url, headers, stream: FactsResponse())
+    api = SecApi.__new__(SecApi)
+    api.headers = {}
+    api.id_data = CompanyIdCode(cik="0000000001", name="Test", ticker="TST", exchange="Nasdaq")
+    exporter = tracing.InMemoryExporter()
+
+    with tracing.tracing(exporter):
+        facts = api.process_company_facts()
+
+    by_name = {s.name: s for s in exporter.spans}
+    assert set(by_name) == {"sec.facts", "sec.facts.download", "sec.facts.map_missing_frames",
+                            "sec.facts.convert_to_quarters", "sec.facts.collect"}
+    assert by_name["sec.facts.download"].attributes["rows"] == 2
+    assert by_name["sec.facts.download"].attributes["bytes"] > 0
+    download = by_name["sec.facts.download"]
+    assert download.attributes["read_seconds"] + download.attributes["parse_seconds"] == pytest.approx(download.duration)
+    assert by_name["sec.facts.collect"].attributes["rows"] == facts.sec_data.height
+    assert all(s.parent_id == by_name["sec.facts"].span_id for s in exporter.spans if s.name != "sec.facts")
+
+    # The untraced path returns the same frame.
+    assert api.process_company_facts().sec_data.equals(facts.sec_data)